@@ -3,6 +3,7 @@ from nisystemlink.clients.dataframe.models import (
     DecimationMethod,
     DecimationOptions,
     QueryDecimatedDataRequest,
+    QueryTableDataRequest,
 )
 
 client = DataFrameClient()
@@ -24,3 +25,9 @@ request = QueryDecimatedDataRequest(
     )
 )
 client.query_decimated_data(table.id, request)
+
+# Read all rows of table data, fetching the next page in the background while
+# the current page is processed
+for page in client.iter_query_table_data(table.id, QueryTableDataRequest(take=1000)):
+    for row in page.frame.data:
+        print(row)
@@ -63,12 +63,18 @@ class HttpClient:
     @property
     def _async_client(self) -> AsyncClient:
         thread_id = threading.get_ident()
-        if thread_id not in self._clients:
+        if thread_id not in self._aclients:
             if sys.version_info < (3, 6):
                 raise RuntimeError("async support is only available for python 3.6+")
             self._aclients[thread_id] = AsyncClient(**self._kwargs)
         return self._aclients[thread_id]
 
+    async def aclose(self) -> None:
+        """Close the async client used by the current thread, if one was created."""
+        client = self._aclients.pop(threading.get_ident(), None)
+        if client is not None:
+            await client.aclose()
+
 
 class _HttpClientAtUri:
     """Interface to HttpClient for while all queries are relative to a given uri."""
@@ -162,28 +168,58 @@ class _AsyncHttpClientAtUri:
         method: str,
         uri: str,
         *,
-        params: Optional[Dict[str, Optional[str]]] = None,
+        params: Optional[Dict[str, Any]] = None,
         data: Optional[Union[Dict[str, Any], Iterable[Any]]] = None
     ) -> Tuple[Any, HttpResponse]:
         client = self._client._async_client
         uri, params2 = _expand_uri_params(uri, params)
-        response = await client.request(method, uri, json=data, params=params2)
+        response = await client.request(
+            method, uri, params=params2, **_request_body(data)
+        )
         return _handle_response(response, method, uri), response
 
+    async def stream(
+        self,
+        method: str,
+        uri: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Union[Dict[str, Any], Iterable[Any]]] = None
+    ) -> HttpResponse:
+        """Perform a request without reading the response body.
+
+        The caller is responsible for reading the body and closing the response.
+        If the server responds with an error, the body is read and an exception is
+        raised instead.
+        """
+        client = self._client._async_client
+        uri, params2 = _expand_uri_params(self._base_uri + uri, params)
+        request = client.build_request(
+            method, uri, params=params2, **_request_body(data)
+        )
+        response = await client.send(request, stream=True)
+        if not 200 <= response.status_code < 300:
+            try:
+                await response.aread()
+                _handle_response(response, method, uri)
+            finally:
+                await response.aclose()
+        return response
+
     def get(
-        self, uri: str, *, params: Optional[Dict[str, Optional[str]]] = None
+        self, uri: str, *, params: Optional[Dict[str, Any]] = None
     ) -> Awaitable[Tuple[Any, HttpResponse]]:
         """Perform a GET request."""
         return self._request("GET", self._base_uri + uri, params=params)
 
     def head(
-        self, uri: str, *, params: Optional[Dict[str, Optional[str]]] = None
+        self, uri: str, *, params: Optional[Dict[str, Any]] = None
     ) -> Awaitable[Tuple[Any, HttpResponse]]:
         """Perform a HEAD request."""
         return self._request("HEAD", self._base_uri + uri, params=params)
 
     def delete(
-        self, uri: str, *, params: Optional[Dict[str, Optional[str]]] = None
+        self, uri: str, *, params: Optional[Dict[str, Any]] = None
     ) -> Awaitable[Tuple[Any, HttpResponse]]:
         """Perform a DELETE request."""
         return self._request("DELETE", self._base_uri + uri, params=params)
@@ -192,7 +228,7 @@ class _AsyncHttpClientAtUri:
         self,
         uri: str,
         *,
-        params: Optional[Dict[str, Optional[str]]] = None,
+        params: Optional[Dict[str, Any]] = None,
         data: Optional[Union[Dict[str, Any], Iterable[Any]]] = None
     ) -> Awaitable[Tuple[Any, HttpResponse]]:
         """Perform a POST request."""
@@ -202,7 +238,7 @@ class _AsyncHttpClientAtUri:
         self,
         uri: str,
         *,
-        params: Optional[Dict[str, Optional[str]]] = None,
+        params: Optional[Dict[str, Any]] = None,
         data: Optional[Union[Dict[str, Any], Iterable[Any]]] = None
     ) -> Awaitable[Tuple[Any, HttpResponse]]:
         """Perform a PUT request."""
@@ -212,7 +248,7 @@ class _AsyncHttpClientAtUri:
         self,
         uri: str,
         *,
-        params: Optional[Dict[str, Optional[str]]] = None,
+        params: Optional[Dict[str, Any]] = None,
         data: Optional[Union[Dict[str, Any], Iterable[Any]]] = None
     ) -> Awaitable[Tuple[Any, HttpResponse]]:
         """Perform a PATCH request."""
@@ -223,9 +259,22 @@ class _AsyncHttpClientAtUri:
         return self._base_uri
 
 
+def _request_body(
+    data: Optional[Union[Dict[str, Any], Iterable[Any]]]
+) -> Dict[str, Any]:
+    """Get the arguments for sending ``data`` as the body of a request.
+
+    A string is sent as is, since it has already been encoded as JSON. Anything
+    else is encoded as JSON.
+    """
+    if isinstance(data, str):
+        return {"content": data, "headers": {"Content-Type": "application/json"}}
+    return {"json": data}
+
+
 def _expand_uri_params(
-    uri: str, params: Optional[Dict[str, Optional[str]]]
-) -> Tuple[str, Optional[Dict[str, str]]]:
+    uri: str, params: Optional[Dict[str, Any]]
+) -> Tuple[str, Optional[Dict[str, Any]]]:
     """Expand any params in uri with a url-encoded version of the corresponding value in ``params``.
 
     Any matched params will be removed from params. Any unmatched params will be left
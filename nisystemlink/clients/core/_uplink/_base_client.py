@@ -1,13 +1,13 @@
 # mypy: disable-error-code = misc
 
-from json import loads
-from typing import Any, Callable, Dict, get_origin, Optional, Type, Union
+from typing import Any, Callable, get_origin, Optional, Type, Union
 
 from nisystemlink.clients import core
 from pydantic import parse_obj_as
 from requests import JSONDecodeError, Response
 from uplink import commands, Consumer, converters, response_handler, utils
 
+from ._json_body import JsonBody
 from ._json_model import JsonModel
 
 
@@ -43,9 +43,9 @@ def _handle_http_status(response: Response) -> Optional[Response]:
 class _JsonModelConverter(converters.Factory):
     def create_request_body_converter(
         self, _class: Type, _: commands.RequestDefinition
-    ) -> Optional[Callable[[JsonModel], Dict]]:
-        def encoder(model: JsonModel) -> Dict:
-            return loads(model.json(by_alias=True, exclude_unset=True))
+    ) -> Optional[Callable[[JsonModel], JsonBody]]:
+        def encoder(model: JsonModel) -> JsonBody:
+            return JsonBody(model.json(by_alias=True, exclude_unset=True).encode())
 
         if utils.is_subclass(_class, JsonModel):
             return encoder
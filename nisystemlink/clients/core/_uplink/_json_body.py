@@ -0,0 +1,20 @@
+"""Implementation of JsonBody."""
+
+from typing import Iterable, Union
+
+
+class JsonBody:
+    """A request body that has already been encoded as JSON.
+
+    The content is sent as it is, so that request models are serialized only once.
+    An iterable of byte strings is sent using chunked transfer encoding as it is
+    iterated, without holding the whole body in memory.
+    """
+
+    def __init__(self, content: Union[bytes, Iterable[bytes]]) -> None:
+        """Initialize an instance.
+
+        Args:
+            content: The UTF-8 encoded JSON document, or the consecutive pieces of it.
+        """
+        self.content = content
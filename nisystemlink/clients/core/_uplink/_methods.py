@@ -5,14 +5,32 @@ from typing import Any, Callable, Optional, Sequence, Tuple, TypeVar, Union
 from uplink import (
     Body,
     commands,
-    json,
+    decorators,
+    json as uplink_json,
     response_handler as uplink_response_handler,
     returns,
 )
 
+from ._json_body import JsonBody
+
 F = TypeVar("F", bound=Callable[..., Any])
 
 
+class _json(uplink_json):
+    """Annotation for a request with a JSON request body, which is sent as it is when
+    it has already been encoded as a :class:`JsonBody`.
+    """
+
+    @classmethod
+    def set_json_body(cls, request_builder: Any) -> None:
+        body = request_builder.info.get("data")
+        if isinstance(body, JsonBody):
+            request_builder.info["data"] = body.content
+            request_builder.info["headers"]["Content-Type"] = "application/json"
+        else:
+            super().set_json_body(request_builder)
+
+
 def get(path: str, args: Optional[Sequence[Any]] = None) -> Callable[[F], F]:
     """Annotation for a GET request."""
 
@@ -32,7 +50,7 @@ def post(
     """
 
     def decorator(func: F) -> F:
-        result = json(commands.post(path, args=args or (Body,))(func))
+        result = _json(commands.post(path, args=args or (Body,))(func))
         if return_key:
             result = returns.json(key=return_key)(result)
         return result  # type: ignore
@@ -44,7 +62,7 @@ def patch(path: str, args: Optional[Sequence[Any]] = None) -> Callable[[F], F]:
     """Annotation for a PATCH request with a JSON request body."""
 
     def decorator(func: F) -> F:
-        return json(commands.patch(path, args=args)(func))  # type: ignore
+        return _json(commands.patch(path, args=args)(func))  # type: ignore
 
     return decorator
 
@@ -67,3 +85,15 @@ def response_handler(
         return uplink_response_handler(handler, requires_consumer)(func)  # type: ignore
 
     return decorator
+
+
+class _StreamResponse(decorators.MethodAnnotation):
+    def modify_request(self, request_builder: Any) -> None:
+        request_builder.info["stream"] = True
+
+
+def stream_response(func: F) -> F:
+    """Annotation for a request whose response body is downloaded as it is read,
+    instead of in full before the response is returned.
+    """
+    return _StreamResponse()(func)  # type: ignore
@@ -0,0 +1,96 @@
+"""Helpers for walking the continuation tokens of paged responses."""
+
+import queue
+import threading
+from typing import Callable, Iterator, Optional, TypeVar, Union
+
+from ._with_paging import WithPaging
+
+TPage = TypeVar("TPage", bound=WithPaging)
+
+
+def iterate_pages(
+    fetch_page: Callable[[Optional[str]], TPage],
+    continuation_token: Optional[str] = None,
+    prefetch: int = 0,
+) -> Iterator[TPage]:
+    """Iterate over every page of a paged query, following continuation tokens.
+
+    Args:
+        fetch_page: Called with the continuation token of the page to fetch, or
+            ``continuation_token`` for the first page.
+        continuation_token: The token of the first page to fetch, or None to start
+            from the beginning of the results.
+        prefetch: The number of pages to fetch ahead of the consumer on a
+            background thread. Because each request needs the continuation token
+            returned by the previous one, at most one request is in flight at a
+            time; ``prefetch`` bounds how many received pages may wait to be
+            consumed. If 0, each page is fetched only when it is requested.
+
+    Returns:
+        An iterator over the pages, in order.
+
+    Raises:
+        ValueError: if ``prefetch`` is negative.
+    """
+    if prefetch < 0:
+        raise ValueError("prefetch cannot be negative")
+    if prefetch == 0:
+        return _iterate_pages(fetch_page, continuation_token)
+    return _iterate_pages_in_background(fetch_page, continuation_token, prefetch)
+
+
+def _iterate_pages(
+    fetch_page: Callable[[Optional[str]], TPage], continuation_token: Optional[str]
+) -> Iterator[TPage]:
+    while True:
+        page = fetch_page(continuation_token)
+        yield page
+        continuation_token = page.continuation_token
+        if continuation_token is None:
+            return
+
+
+class _Done:
+    pass
+
+
+def _iterate_pages_in_background(
+    fetch_page: Callable[[Optional[str]], TPage],
+    continuation_token: Optional[str],
+    prefetch: int,
+) -> Iterator[TPage]:
+    pages = queue.Queue(
+        maxsize=prefetch
+    )  # type: queue.Queue[Union[TPage, BaseException, _Done]]
+    stopped = threading.Event()
+
+    def fetch_all() -> None:
+        try:
+            for page in _iterate_pages(fetch_page, continuation_token):
+                pages.put(page)
+                if stopped.is_set():
+                    return
+            pages.put(_Done())
+        except Exception as ex:
+            pages.put(ex)
+
+    thread = threading.Thread(target=fetch_all, name="PagePrefetcher", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = pages.get()
+            if isinstance(item, _Done):
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        # If the consumer stops early, unblock the fetching thread so that it can
+        # observe the stop request and exit.
+        stopped.set()
+        while True:
+            try:
+                pages.get_nowait()
+            except queue.Empty:
+                break
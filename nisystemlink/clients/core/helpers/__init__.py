@@ -1,3 +1,4 @@
+from ._async_iterator_file_like import AsyncIteratorFileLike
 from ._iterator_file_like import IteratorFileLike
 
 # flake8: noqa
@@ -0,0 +1,94 @@
+from types import TracebackType
+from typing import Any, AsyncIterator, Optional, Type
+
+
+class AsyncIteratorFileLike:
+    """An async file-like object adapter that wraps a python async iterator,
+    providing a way to read from the iterator as if it was a file.
+
+    The iterator must produce bytes-like chunks. Iterating over the object with
+    ``async for`` yields the remaining data one chunk at a time.
+    """
+
+    def __init__(self, iterator: AsyncIterator[Any]):
+        self._iterator = iterator
+        self._buffer = bytearray()
+        self._exhausted = False
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        """Whether the file-like object has been closed."""
+        return self._closed
+
+    async def read(self, size: Optional[int] = -1) -> bytes:
+        """Read at most `size` bytes from the file-like object. If `size` is not
+        specified or is negative, read until the iterator is exhausted and
+        returns all bytes read.
+        """
+        self._check_not_closed()
+        while (size is None or size < 0 or len(self._buffer) < size) and (
+            await self._fill()
+        ):
+            pass
+
+        if size is None or size < 0 or size > len(self._buffer):
+            size = len(self._buffer)
+        with memoryview(self._buffer) as view:
+            data = view[:size].tobytes()
+        # Deleting from the front of a bytearray doesn't move the remaining data.
+        del self._buffer[:size]
+        return data
+
+    def __aiter__(self) -> "AsyncIteratorFileLike":
+        return self
+
+    async def __anext__(self) -> bytes:
+        self._check_not_closed()
+        if not self._buffer and not await self._fill():
+            raise StopAsyncIteration
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+    async def aclose(self) -> None:
+        """Close the file-like object and the wrapped iterator, if it supports it."""
+        if self._closed:
+            return
+        self._closed = True
+        self._buffer.clear()
+        aclose = getattr(self._iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+    async def __aenter__(self) -> "AsyncIteratorFileLike":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.aclose()
+
+    def _check_not_closed(self) -> None:
+        if self._closed:
+            raise ValueError("I/O operation on closed file.")
+
+    async def _fill(self) -> bool:
+        """Append the next non-empty chunk from the iterator to the buffer.
+
+        Returns:
+            False if the iterator is exhausted.
+        """
+        while not self._exhausted:
+            try:
+                chunk = await self._iterator.__anext__()
+            except StopAsyncIteration:
+                self._exhausted = True
+                break
+            if chunk:
+                self._buffer += chunk
+                return True
+        return False
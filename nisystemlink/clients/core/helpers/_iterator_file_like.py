@@ -1,30 +1,192 @@
-from typing import Any, Iterator
+import io
+from collections import deque
+from typing import Any, Deque, Iterator, List, Optional, Union
 
+_Chunk = Union[bytes, bytearray]
 
-class IteratorFileLike:
+
+class IteratorFileLike(io.BufferedIOBase):
     """A file-like object adapter that wraps a python iterator, providing a way to
     read from the iterator as if it was a file.
+
+    The iterator must produce bytes-like chunks. Chunks are buffered as they are
+    received and each byte is copied at most once when read, so the object can be
+    handed to consumers such as :class:`io.TextIOWrapper`, :mod:`csv`,
+    ``pandas.read_csv``, or :func:`shutil.copyfileobj` to stream the data.
     """
 
     def __init__(self, iterator: Iterator[Any]):
+        super().__init__()
         self._iterator = iterator
-        self._buffer = b""
+        self._chunks = deque()  # type: Deque[_Chunk]
+        self._offset = 0  # Position within the first chunk
+        self._buffered = 0  # Number of unread bytes in self._chunks
+        self._exhausted = False
 
-    def read(self, size: int = -1) -> bytes:
+    def readable(self) -> bool:
+        """Return True, as the file-like object is always readable."""
+        return True
+
+    def read(self, size: Optional[int] = -1) -> bytes:
         """Read at most `size` bytes from the file-like object. If `size` is not
         specified or is negative, read until the iterator is exhausted and
         returns all bytes or characters read.
         """
-        while size < 0 or len(self._buffer) < size:
+        self._check_not_closed()
+        if size is None or size < 0:
+            while self._fill():
+                pass
+            return self._take(self._buffered)
+
+        while self._buffered < size and self._fill():
+            pass
+        return self._take(min(size, self._buffered))
+
+    def read1(self, size: int = -1) -> bytes:
+        """Read at most `size` bytes, pulling at most one chunk from the iterator,
+        and only if no data is buffered.
+        """
+        self._check_not_closed()
+        if not self._buffered:
+            self._fill()
+        if size < 0 or size > self._buffered:
+            size = self._buffered
+        return self._take(size)
+
+    def readinto(self, buffer: Any) -> int:
+        """Read bytes directly into a pre-allocated, writable bytes-like object.
+
+        Returns:
+            The number of bytes read, which is 0 at the end of the data.
+        """
+        self._check_not_closed()
+        with memoryview(buffer) as view, view.cast("B") as target:
+            while self._buffered < len(target) and self._fill():
+                pass
+            return self._take_into(target)
+
+    def readinto1(self, buffer: Any) -> int:
+        """Read bytes directly into a pre-allocated, writable bytes-like object,
+        pulling at most one chunk from the iterator, and only if no data is buffered.
+
+        Returns:
+            The number of bytes read, which is 0 at the end of the data.
+        """
+        self._check_not_closed()
+        if not self._buffered:
+            self._fill()
+        with memoryview(buffer) as view, view.cast("B") as target:
+            return self._take_into(target)
+
+    def readline(self, size: Optional[int] = -1) -> bytes:
+        """Read and return one line, including the trailing newline, reading at most
+        `size` bytes if `size` is specified and non-negative.
+        """
+        self._check_not_closed()
+        limit = -1 if size is None or size < 0 else size
+        length = 0  # Number of buffered bytes known to be part of the line
+        index = 0  # Index of the next chunk to search for a newline
+        while limit < 0 or length < limit:
+            if index == len(self._chunks) and not self._fill():
+                break
+            chunk = self._chunks[index]
+            start = self._offset if index == 0 else 0
+            newline = chunk.find(b"\n", start)
+            if newline >= 0:
+                length += newline + 1 - start
+                break
+            length += len(chunk) - start
+            index += 1
+
+        if limit >= 0:
+            length = min(length, limit)
+        return self._take(length)
+
+    def peek(self, size: int = 0) -> bytes:
+        """Return buffered bytes without advancing the position, pulling a chunk
+        from the iterator only if no data is buffered.
+        """
+        self._check_not_closed()
+        if not self._buffered:
+            self._fill()
+        if not self._chunks:
+            return b""
+        return bytes(self._chunks[0][self._offset :])
+
+    def close(self) -> None:
+        """Close the file-like object and the wrapped iterator, if it supports it."""
+        if not self.closed:
+            self._chunks.clear()
+            self._buffered = 0
+            close = getattr(self._iterator, "close", None)
+            if close is not None:
+                close()
+        super().close()
+
+    def _check_not_closed(self) -> None:
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+
+    def _fill(self) -> bool:
+        """Append the next non-empty chunk from the iterator to the buffer.
+
+        Returns:
+            False if the iterator is exhausted.
+        """
+        while not self._exhausted:
             try:
                 chunk = next(self._iterator)
-                self._buffer += chunk
             except StopIteration:
+                self._exhausted = True
                 break
-        if size < 0:
-            data = self._buffer
-            self._buffer = b""
-        else:
-            data = self._buffer[:size]
-            self._buffer = self._buffer[size:]
-        return data
+            if chunk:
+                if not isinstance(chunk, (bytes, bytearray)):
+                    chunk = bytes(chunk)
+                self._chunks.append(chunk)
+                self._buffered += len(chunk)
+                return True
+        return False
+
+    def _take(self, size: int) -> bytes:
+        """Remove and return `size` buffered bytes."""
+        parts = []  # type: List[Union[_Chunk, memoryview]]
+        remaining = size
+        while remaining:
+            chunk = self._chunks[0]
+            available = len(chunk) - self._offset
+            if available <= remaining:
+                parts.append(
+                    memoryview(chunk)[self._offset :] if self._offset else chunk
+                )
+                self._chunks.popleft()
+                self._offset = 0
+                remaining -= available
+            else:
+                parts.append(memoryview(chunk)[self._offset : self._offset + remaining])
+                self._offset += remaining
+                remaining = 0
+
+        self._buffered -= size
+        if len(parts) == 1 and isinstance(parts[0], bytes):
+            # A whole chunk can be returned without copying it.
+            return parts[0]
+        return b"".join(parts)
+
+    def _take_into(self, target: memoryview) -> int:
+        """Remove buffered bytes by copying them into `target`."""
+        size = min(len(target), self._buffered)
+        position = 0
+        while position < size:
+            chunk = self._chunks[0]
+            count = min(len(chunk) - self._offset, size - position)
+            target[position : position + count] = memoryview(chunk)[
+                self._offset : self._offset + count
+            ]
+            position += count
+            self._offset += count
+            if self._offset == len(chunk):
+                self._chunks.popleft()
+                self._offset = 0
+
+        self._buffered -= size
+        return size
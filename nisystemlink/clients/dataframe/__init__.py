@@ -1,3 +1,9 @@
+from ._adaptive_take import AdaptiveTake, PageMeasurement
+from ._async_data_frame_client import AsyncDataFrameClient
+from ._buffered_table_writer import BufferedTableWriter
 from ._data_frame_client import DataFrameClient
+from ._decimation_cache import DecimationCache
+from ._table_metadata_cache import TableMetadataCache
+from ._table_reader import TableReadResult
 
 # flake8: noqa
@@ -0,0 +1,127 @@
+"""Choosing the number of rows to request in each page of a paged read."""
+
+from typing import Callable, List, Optional
+
+_MAX_GROWTH = 2.0
+"""The most the take can grow from one page to the next."""
+
+_MAX_SHRINK = 0.25
+"""The most the take can shrink from one page to the next."""
+
+
+class PageMeasurement:
+    """How long one page of a paged read took and how large it was."""
+
+    def __init__(self, take: int, rows: int, seconds: float, size: int) -> None:
+        """Initialize an instance.
+
+        Args:
+            take: The number of rows requested.
+            rows: The number of rows returned.
+            seconds: The time taken to request and download the page.
+            size: The size of the response body in bytes.
+        """
+        self.take = take
+        self.rows = rows
+        self.seconds = seconds
+        self.size = size
+
+    def __repr__(self) -> str:
+        return "PageMeasurement(take={!r}, rows={!r}, seconds={!r}, size={!r})".format(
+            self.take, self.rows, self.seconds, self.size
+        )
+
+
+class AdaptiveTake:
+    """Adjusts the number of rows requested in each page of a paged read so that each
+    page takes about the same time to download.
+
+    Small pages waste round trips on high-latency connections, while large pages use
+    more memory and risk timing out. After each page, the time taken per row is
+    measured and the take of the next page is scaled toward ``target_seconds``,
+    within ``minimum`` and ``maximum``. The take changes by at most a factor of 2
+    when growing and 4 when shrinking from one page to the next, so that a single
+    slow or fast page doesn't cause large swings.
+
+    Pass an instance as the ``adaptive_take`` argument of
+    :meth:`DataFrameClient.iter_query_table_data
+    <nisystemlink.clients.dataframe.DataFrameClient.iter_query_table_data>` or
+    :meth:`DataFrameClient.iter_table_data
+    <nisystemlink.clients.dataframe.DataFrameClient.iter_table_data>`. The take chosen
+    for a read can be reused by passing the same instance to the next read of a
+    similar table. An instance must not be used by more than one read at a time.
+    """
+
+    def __init__(
+        self,
+        initial: int = 500,
+        minimum: int = 100,
+        maximum: int = 10000,
+        target_seconds: float = 1.0,
+        max_bytes: Optional[int] = None,
+        on_page: Optional[Callable[[PageMeasurement], None]] = None,
+    ) -> None:
+        """Initialize an instance.
+
+        Args:
+            initial: The take of the first page.
+            minimum: The smallest take to request.
+            maximum: The largest take to request.
+            target_seconds: The time each page should take to request and download.
+            max_bytes: If set, the take is also limited so that each page's response
+                is expected to be at most this many bytes.
+            on_page: Called with the measurement of each page after it is read, such
+                as to log or record metrics about the read.
+
+        Raises:
+            ValueError: if ``minimum`` is less than one, ``initial`` isn't between
+                ``minimum`` and ``maximum``, or ``target_seconds`` or ``max_bytes``
+                isn't positive.
+        """
+        if minimum < 1:
+            raise ValueError("minimum must be at least 1")
+        if not minimum <= initial <= maximum:
+            raise ValueError("initial must be between minimum and maximum")
+        if target_seconds <= 0:
+            raise ValueError("target_seconds must be positive")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+
+        self.take = initial
+        """The take to request in the next page."""
+        self.pages = []  # type: List[PageMeasurement]
+        """The measurements of every page read so far."""
+        self._minimum = minimum
+        self._maximum = maximum
+        self._target_seconds = target_seconds
+        self._max_bytes = max_bytes
+        self._on_page = on_page
+
+    def record(self, take: int, rows: int, seconds: float, size: int) -> None:
+        """Record the measurements of a page and choose the take of the next page.
+
+        Args:
+            take: The number of rows requested.
+            rows: The number of rows returned.
+            seconds: The time taken to request and download the page.
+            size: The size of the response body in bytes.
+        """
+        measurement = PageMeasurement(take, rows, seconds, size)
+        self.pages.append(measurement)
+        # A page with fewer rows than requested is the last one, and says little
+        # about how long a full page would take.
+        if rows >= take and rows > 0:
+            self.take = self._next_take(measurement)
+        if self._on_page is not None:
+            self._on_page(measurement)
+
+    def _next_take(self, page: PageMeasurement) -> int:
+        if page.seconds > 0:
+            scale = self._target_seconds / page.seconds
+        else:
+            scale = _MAX_GROWTH
+        scale = min(max(scale, _MAX_SHRINK), _MAX_GROWTH)
+        take = page.take * scale
+        if self._max_bytes is not None and page.size > 0:
+            take = min(take, self._max_bytes * page.rows / page.size)
+        return int(min(max(take, self._minimum), self._maximum))
@@ -0,0 +1,437 @@
+"""Implementation of AsyncDataFrameClient."""
+
+import asyncio
+from types import TracebackType
+from typing import Any, AsyncIterator, Dict, List, Optional, Type
+
+from nisystemlink.clients import core
+from nisystemlink.clients.core._internal._http_client import HttpClient, HttpResponse
+from nisystemlink.clients.core._uplink._json_model import JsonModel
+from nisystemlink.clients.core.helpers import AsyncIteratorFileLike
+
+from . import models
+from ._follow import FollowState
+from ._trusted_rows import parse_rows, Rows
+
+
+class AsyncDataFrameClient:
+    """An asynchronous client for the SystemLink DataFrame service.
+
+    Provides the same operations as
+    :class:`DataFrameClient <nisystemlink.clients.dataframe.DataFrameClient>` as
+    coroutines, so that many requests can be in flight at once on a single event
+    loop. Connections are pooled, so the client should be closed with
+    :meth:`aclose` or used as an ``async with`` context manager.
+    """
+
+    def __init__(
+        self,
+        configuration: Optional[core.HttpConfiguration] = None,
+        trust_responses: bool = False,
+    ):
+        """Initialize an instance.
+
+        Args:
+            configuration: Defines the web server to connect to and information about
+                how to connect. If not provided, an instance of
+                :class:`JupyterHttpConfiguration <nisystemlink.clients.core.JupyterHttpConfiguration>`
+                is used.
+            trust_responses: Whether methods that return rows of table data create
+                the returned models without validating each cell. Can be overridden
+                by the ``trusted`` argument of each method.
+        """
+        if configuration is None:
+            configuration = core.JupyterHttpConfiguration()
+
+        self._http_client = HttpClient(configuration)
+        self._api = self._http_client.at_uri("/nidataframe/v1/").as_async
+        self._trust_responses = trust_responses
+
+    async def aclose(self) -> None:
+        """Close the connections used by the client."""
+        await self._http_client.aclose()
+
+    def _parse_rows(
+        self, cls: Type[Rows], data: Dict[str, Any], trusted: Optional[bool]
+    ) -> Rows:
+        if trusted is None:
+            trusted = self._trust_responses
+        return parse_rows(cls, data, trusted)
+
+    async def __aenter__(self) -> "AsyncDataFrameClient":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.aclose()
+
+    async def api_info(self) -> models.ApiInfo:
+        """Get information about available API operations.
+
+        Returns:
+            Information about available API operations.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service.
+        """
+        data, _ = await self._api.get("")
+        return models.ApiInfo.parse_obj(data)
+
+    async def list_tables(
+        self,
+        take: Optional[int] = None,
+        id: Optional[List[str]] = None,
+        order_by: Optional[models.OrderBy] = None,
+        order_by_descending: Optional[bool] = None,
+        continuation_token: Optional[str] = None,
+        workspace: Optional[List[str]] = None,
+    ) -> models.PagedTables:
+        """Lists available tables on the SystemLink DataFrame service.
+
+        Args:
+            take: Limits the returned list to the specified number of results. Defaults to 1000.
+            id: List of table IDs to filter by.
+            order_by: The sort order of the returned list of tables.
+            order_by_descending: Whether to sort descending instead of ascending. Defaults to false.
+            continuation_token: The token used to paginate results.
+            workspace: List of workspace IDs to filter by.
+
+        Returns:
+            The list of tables with a continuation token.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        params = {
+            "take": take,
+            "id": id,
+            "orderBy": order_by,
+            "orderByDescending": order_by_descending,
+            "continuationToken": continuation_token,
+            "workspace": workspace,
+        }  # type: Dict[str, Any]
+        data, _ = await self._api.get("tables", params=params)
+        return models.PagedTables.parse_obj(data)
+
+    async def create_table(self, table: models.CreateTableRequest) -> str:
+        """Create a new table with the provided metadata and column definitions.
+
+        Args:
+            table: The request to create the table.
+
+        Returns:
+            The ID of the newly created table.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        data, _ = await self._api.post("tables", data=_encode(table))
+        return data["id"]
+
+    async def query_tables(
+        self, query: models.QueryTablesRequest
+    ) -> models.PagedTables:
+        """Queries available tables on the SystemLink DataFrame service and returns their metadata.
+
+        Args:
+            query: The request to query tables.
+
+        Returns:
+            The list of tables with a continuation token.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        data, _ = await self._api.post("query-tables", data=_encode(query))
+        return models.PagedTables.parse_obj(data)
+
+    async def get_table_metadata(self, id: str) -> models.TableMetadata:
+        """Retrieves the metadata and column information for a single table identified by its ID.
+
+        Args:
+            id (str): Unique ID of a data table.
+
+        Returns:
+            The metadata for the table.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        data, _ = await self._api.get("tables/{id}", params={"id": id})
+        return models.TableMetadata.parse_obj(data)
+
+    async def modify_table(self, id: str, update: models.ModifyTableRequest) -> None:
+        """Modify properties of a table or its columns.
+
+        Args:
+            id: Unique ID of a data table.
+            update: The metadata to update.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        await self._api.patch("tables/{id}", params={"id": id}, data=_encode(update))
+
+    async def delete_table(self, id: str) -> None:
+        """Deletes a table.
+
+        Args:
+            id (str): Unique ID of a data table.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        await self._api.delete("tables/{id}", params={"id": id})
+
+    async def delete_tables(
+        self, ids: List[str]
+    ) -> Optional[models.DeleteTablesPartialSuccess]:
+        """Deletes multiple tables.
+
+        Args:
+            ids (List[str]): List of unique IDs of data tables.
+
+        Returns:
+            A partial success if any tables failed to delete, or None if all
+            tables were deleted successfully.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        data, _ = await self._api.post("delete-tables", data={"ids": ids})
+        return (
+            models.DeleteTablesPartialSuccess.parse_obj(data)
+            if data is not None
+            else None
+        )
+
+    async def modify_tables(
+        self, updates: models.ModifyTablesRequest
+    ) -> Optional[models.ModifyTablesPartialSuccess]:
+        """Modify the properties associated with the tables identified by their IDs.
+
+        Args:
+            updates: The table modifications to apply.
+
+        Returns:
+            A partial success if any tables failed to be modified, or None if all
+            tables were modified successfully.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        data, _ = await self._api.post("modify-tables", data=_encode(updates))
+        return (
+            models.ModifyTablesPartialSuccess.parse_obj(data)
+            if data is not None
+            else None
+        )
+
+    async def get_table_data(
+        self,
+        id: str,
+        columns: Optional[List[str]] = None,
+        order_by: Optional[List[str]] = None,
+        order_by_descending: Optional[bool] = None,
+        take: Optional[int] = None,
+        continuation_token: Optional[str] = None,
+        trusted: Optional[bool] = None,
+    ) -> models.PagedTableRows:
+        """Reads raw data from the table identified by its ID.
+
+        Args:
+            id: Unique ID of a data table.
+            columns: Columns to include in the response. Data will be returned in the same order as
+                the columns. If not specified, all columns are returned.
+            order_by: List of columns to sort by. Multiple columns may be specified to order rows
+                that have the same value for prior columns. The columns used for ordering do not
+                need to be included in the columns list, in which case they are not returned. If
+                not specified, then the order in which results are returned is undefined.
+            order_by_descending: Whether to sort descending instead of ascending. Defaults to false.
+            take: Limits the returned list to the specified number of results. Defaults to 500.
+            continuation_token: The token used to paginate results.
+            trusted: Whether to create the returned rows without validating each cell.
+                Defaults to the client's ``trust_responses`` setting.
+
+        Returns:
+            The table data and total number of rows with a continuation token.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        params = {
+            "id": id,
+            "columns": columns,
+            "orderBy": order_by,
+            "orderByDescending": order_by_descending,
+            "take": take,
+            "continuationToken": continuation_token,
+        }  # type: Dict[str, Any]
+        data, _ = await self._api.get("tables/{id}/data", params=params)
+        return self._parse_rows(models.PagedTableRows, data, trusted)
+
+    async def append_table_data(
+        self, id: str, data: models.AppendTableDataRequest
+    ) -> None:
+        """Appends one or more rows of data to the table identified by its ID.
+
+        Args:
+            id: Unique ID of a data table.
+            data: The rows of data to append and any additional options.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        await self._api.post("tables/{id}/data", params={"id": id}, data=_encode(data))
+
+    async def query_table_data(
+        self,
+        id: str,
+        query: models.QueryTableDataRequest,
+        trusted: Optional[bool] = None,
+    ) -> models.PagedTableRows:
+        """Reads rows of data that match a filter from the table identified by its ID.
+
+        Args:
+            id: Unique ID of a data table.
+            query: The filtering and sorting to apply when reading data.
+            trusted: Whether to create the returned rows without validating each cell.
+                Defaults to the client's ``trust_responses`` setting.
+
+        Returns:
+            The table data and total number of rows with a continuation token.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        data, _ = await self._api.post(
+            "tables/{id}/query-data", params={"id": id}, data=_encode(query)
+        )
+        return self._parse_rows(models.PagedTableRows, data, trusted)
+
+    def follow_table(
+        self,
+        id: str,
+        query: Optional[models.QueryTableDataRequest] = None,
+        poll_interval: float = 5.0,
+        start_after: Optional[str] = None,
+    ) -> AsyncIterator[models.PagedTableRows]:
+        """Reads the rows of the table identified by its ID as they are appended.
+
+        See :meth:`DataFrameClient.follow_table
+        <nisystemlink.clients.dataframe.DataFrameClient.follow_table>` for how the
+        table is polled.
+
+        Args:
+            id: Unique ID of a data table.
+            query: The columns and filters to apply when reading data. ``take`` sets the
+                maximum number of rows in each page. The query must include the index
+                column, and may only be ordered by the index column in ascending order.
+            poll_interval: The number of seconds to wait between polls.
+            start_after: Only rows with an index value greater than this are read. If
+                None, every row of the table is read, starting with those already
+                appended.
+
+        Returns:
+            An async iterator over each page of new rows. Pages without rows are
+            skipped.
+
+        Raises:
+            ValueError: if ``poll_interval`` is negative, or the query cannot be
+                followed by the table's index column.
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        if poll_interval < 0:
+            raise ValueError("poll_interval must not be negative")
+        state = FollowState(query, start_after)
+
+        async def follow() -> AsyncIterator[models.PagedTableRows]:
+            while True:
+                page_query = state.poll(await self.get_table_metadata(id))
+                while page_query is not None:
+                    page = await self.query_table_data(id, page_query)
+                    if page.frame.data:
+                        yield page
+                    page_query = state.next_page(page)
+                if state.complete:
+                    return
+                await asyncio.sleep(poll_interval)
+
+        return follow()
+
+    async def query_decimated_data(
+        self,
+        id: str,
+        query: models.QueryDecimatedDataRequest,
+        trusted: Optional[bool] = None,
+    ) -> models.TableRows:
+        """Reads decimated rows of data from the table identified by its ID.
+
+        Args:
+            id: Unique ID of a data table.
+            query: The filtering and decimation options to apply when reading data.
+            trusted: Whether to create the returned rows without validating each cell.
+                Defaults to the client's ``trust_responses`` setting.
+
+        Returns:
+            The decimated table data.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        data, _ = await self._api.post(
+            "tables/{id}/query-decimated-data", params={"id": id}, data=_encode(query)
+        )
+        return self._parse_rows(models.TableRows, data, trusted)
+
+    async def export_table_data(
+        self, id: str, query: models.ExportTableDataRequest
+    ) -> AsyncIteratorFileLike:
+        """Exports rows of data that match a filter from the table identified by its ID.
+
+        Args:
+            id: Unique ID of a data table.
+            query: The filtering, sorting, and export format to apply when exporting data.
+
+        Returns:
+            An async binary file-like object for reading the exported data as it is
+            downloaded. Closing it releases the connection.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        response = await self._api.stream(
+            "POST", "tables/{id}/export-data", params={"id": id}, data=_encode(query)
+        )
+        return AsyncIteratorFileLike(_iter_content(response))
+
+
+def _encode(model: JsonModel) -> str:
+    # Sent as is, rather than parsed again to be serialized by httpx.
+    return model.json(by_alias=True, exclude_unset=True)
+
+
+async def _iter_content(response: HttpResponse) -> AsyncIterator[bytes]:
+    try:
+        async for chunk in response.aiter_bytes(65536):
+            yield chunk
+    finally:
+        await response.aclose()
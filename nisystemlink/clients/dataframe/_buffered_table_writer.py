@@ -0,0 +1,256 @@
+"""Implementation of BufferedTableWriter."""
+
+import threading
+from types import TracebackType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Type,
+    TYPE_CHECKING,
+)
+
+from nisystemlink.clients import core
+from nisystemlink.clients.core._internal._manual_reset_timer import ManualResetTimer
+from typing_extensions import Literal
+
+from . import models
+
+if TYPE_CHECKING:
+    from ._data_frame_client import DataFrameClient
+
+Row = Sequence[Optional[str]]
+
+
+class BufferedTableWriter:
+    """Buffers rows to append to a table and sends them in batches instead of one
+    request per write.
+
+    Buffered rows are sent automatically once ``buffer_rows`` rows have been
+    buffered or ``max_buffer_time`` has passed since the first row was buffered,
+    whichever comes first, and when the writer is closed. Rows may be written from
+    multiple threads; batches are appended in the order their rows were written.
+
+    Errors sending rows in the background are raised by the next call to
+    :meth:`write`, :meth:`write_rows`, or :meth:`close`.
+
+    Note that :class:`BufferedTableWriter` objects support using the ``with``
+    statement, to automatically :meth:`close` the writer on exit.
+    """
+
+    def __init__(
+        self,
+        client: "DataFrameClient",
+        id: str,
+        buffer_rows: int,
+        flush_timer: ManualResetTimer,
+        columns: Optional[List[str]] = None,
+        end_of_data: bool = True,
+    ) -> None:
+        """Initialize the writer.
+
+        Clients do not typically construct a writer directly. Use
+        :meth:`DataFrameClient.create_writer` instead.
+
+        Args:
+            client: The client used to append rows.
+            id: Unique ID of the data table to append rows to.
+            buffer_rows: The maximum number of rows to buffer before automatically
+                sending them to the server, or 0 for no limit.
+            flush_timer: A timer that, once started, elapses whenever buffered rows
+                should be sent automatically. Does not have to be a configured timer.
+            columns: The names and order of the columns included in each row. If not
+                specified, each row must contain all columns in the order specified
+                when the table was created.
+            end_of_data: Whether to tell the table to expect no more rows when the
+                writer is closed.
+        """
+        self._client = client
+        self._id = id
+        self._columns = columns
+        self._end_of_data = end_of_data
+        self._buffer_limit = buffer_rows
+        self._flush_timer = flush_timer
+        # Held while taking rows from the buffer and sending them, so that batches
+        # are appended in the order they were buffered.
+        self._send_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._buffer = []  # type: List[Row]
+        self._closed = False
+        self._send_error = None  # type: Optional[core.ApiException]
+        self._timer_generation = 0
+        self._timer_handler = None  # type: Optional[Callable[[], None]]
+
+    @property
+    def closed(self) -> bool:
+        """Whether the writer has been closed."""
+        return self._closed
+
+    def write(self, row: Row) -> None:
+        """Buffer a single row to append to the table.
+
+        Args:
+            row: The values of the row, encoded as described by :class:`.DataFrame`.
+
+        Raises:
+            ReferenceError: if the writer has been closed.
+            ApiException: if sending this or previously buffered rows failed.
+        """
+        self.write_rows([row])
+
+    def write_rows(self, rows: Iterable[Row]) -> None:
+        """Buffer several rows to append to the table.
+
+        Args:
+            rows: The rows, with values encoded as described by :class:`.DataFrame`.
+
+        Raises:
+            ReferenceError: if the writer has been closed.
+            ApiException: if sending these or previously buffered rows failed.
+        """
+        if self._closed:
+            raise ReferenceError("BufferedTableWriter")
+
+        pending_error = None
+        flush = False
+        with self._lock:
+            was_empty = not self._buffer
+            self._buffer.extend(rows)
+            if self._buffer_limit and len(self._buffer) >= self._buffer_limit:
+                flush = True
+            elif was_empty and self._buffer:
+                self._start_timer_while_locked()
+            if self._send_error is not None:
+                pending_error = self._send_error
+                self._send_error = None
+
+        if flush:
+            self.send_buffered_writes()
+        if pending_error:
+            raise pending_error
+
+    def send_buffered_writes(self) -> None:
+        """Append all of the buffered rows to the table.
+
+        Does nothing if there are no buffered rows.
+
+        Raises:
+            ReferenceError: if the writer has been closed.
+            ApiException: if the API call fails.
+        """
+        if self._closed:
+            raise ReferenceError("BufferedTableWriter")
+        self._send(end_of_data=False)
+
+    def clear_buffered_writes(self) -> None:
+        """Discard any buffered rows.
+
+        Raises:
+            ReferenceError: if the writer has been closed.
+        """
+        if self._closed:
+            raise ReferenceError("BufferedTableWriter")
+
+        with self._lock:
+            self._stop_timer_while_locked()
+            self._buffer = []
+
+    def close(self) -> None:
+        """Send any buffered rows and close the writer.
+
+        If the writer was created with ``end_of_data``, the table is also told to
+        expect no more rows, unless sending rows in the background failed. Does
+        nothing if the writer is already closed.
+
+        Raises:
+            ApiException: if sending buffered rows failed, now or in the background.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._flush_timer.__exit__(None, None, None)
+
+        with self._lock:
+            pending_error = self._send_error
+            self._send_error = None
+        self._send(end_of_data=self._end_of_data and pending_error is None)
+        if pending_error:
+            raise pending_error
+
+    def __enter__(self) -> "BufferedTableWriter":
+        if self._closed:
+            raise ReferenceError("BufferedTableWriter")
+        self._flush_timer.__enter__()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> Literal[False]:
+        self.close()
+        return False
+
+    def _send(self, end_of_data: bool) -> None:
+        with self._send_lock:
+            with self._lock:
+                self._stop_timer_while_locked()
+                rows = self._buffer
+                self._buffer = []
+
+            if not rows and not end_of_data:
+                return
+            fields = {}  # type: Dict[str, Any]
+            if rows and self._columns is None:
+                fields["frame"] = models.DataFrame.construct(data=rows)
+            elif rows:
+                fields["frame"] = models.DataFrame.construct(
+                    columns=self._columns, data=rows
+                )
+            if end_of_data:
+                fields["end_of_data"] = True
+            self._client.append_table_data(
+                self._id, models.AppendTableDataRequest.construct(**fields)
+            )
+
+    def _start_timer_while_locked(self) -> None:
+        """Start the flush timer, if configured.
+
+        Must hold :attr:`_lock`.
+        """
+        if not self._flush_timer.can_start:
+            return
+
+        handler_generation = self._timer_generation
+        self._flush_timer.elapsed -= self._timer_handler
+        self._timer_handler = lambda: self._timer_expired(handler_generation)
+        self._flush_timer.elapsed += self._timer_handler
+        self._flush_timer.start()
+
+    def _stop_timer_while_locked(self) -> None:
+        """Stop the flush timer, if configured.
+
+        Must hold :attr:`_lock`.
+        """
+        self._flush_timer.stop()
+        self._timer_generation += 1
+
+    def _timer_expired(self, generation: int) -> None:
+        if self._closed:
+            return
+
+        with self._lock:
+            if generation != self._timer_generation:
+                # The timer was canceled after we were already queued.
+                return
+
+        try:
+            self._send(end_of_data=False)
+        except core.ApiException as ex:
+            with self._lock:
+                self._send_error = ex
@@ -0,0 +1,146 @@
+"""Helpers for splitting bulk operations into requests and running them concurrently."""
+
+import json
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+from nisystemlink.clients import core
+
+T = TypeVar("T")
+
+Outcome = Tuple[List[T], Optional[core.ApiError]]
+"""The items of a request that failed, and the error that caused them to fail."""
+
+Row = Sequence[Optional[str]]
+
+
+def split_rows(
+    rows: Iterable[Row], max_rows: int, max_bytes: int
+) -> Iterator[List[Row]]:
+    """Group rows into chunks limited by row count and approximate JSON size.
+
+    A row larger than ``max_bytes`` on its own is returned as a chunk by itself.
+    """
+    chunk = []  # type: List[Row]
+    size = 0
+    for row in rows:
+        row_size = _json_size(row)
+        if chunk and (len(chunk) == max_rows or size + row_size > max_bytes):
+            yield chunk
+            chunk = []
+            size = 0
+        chunk.append(row)
+        size += row_size
+    if chunk:
+        yield chunk
+
+
+def _json_size(row: Row) -> int:
+    """The number of bytes a row adds to the JSON encoding of a data frame."""
+    # One byte per separating comma and the row's brackets.
+    size = len(row) + 2
+    for cell in row:
+        if cell is None:
+            size += 4
+        elif cell.isascii() and cell.isprintable() and '"' not in cell:
+            if "\\" in cell:
+                size += len(cell) + cell.count("\\") + 2
+            else:
+                size += len(cell) + 2
+        else:
+            size += len(json.dumps(cell))
+    return size
+
+
+def run_concurrently(
+    func: Callable[[T], None], items: Iterable[T], max_workers: int
+) -> None:
+    """Call ``func`` on each item using up to ``max_workers`` threads.
+
+    Items are consumed from ``items`` only as workers become available, so an
+    arbitrarily long iterable is never held in memory at once. If any call raises,
+    no further items are started and the first exception is re-raised once the
+    calls already in progress have finished.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = set()  # type: Set[Future[None]]
+        try:
+            for item in items:
+                if len(pending) >= max_workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+                pending.add(executor.submit(func, item))
+            for future in wait(pending).done:
+                future.result()
+        except BaseException:
+            for future in pending:
+                future.cancel()
+            raise
+
+
+def run_with_retries(
+    send: Callable[[List[T]], Outcome[T]],
+    items: Sequence[T],
+    max_items: int,
+    max_workers: int,
+    retries: int,
+) -> Tuple[List[T], List[core.ApiError]]:
+    """Send items in requests of at most ``max_items`` using up to ``max_workers``
+    threads, then send the items that failed again up to ``retries`` times.
+
+    An :class:`ApiException <nisystemlink.clients.core.ApiException>` raised by
+    ``send`` fails every item of that request.
+
+    Returns:
+        The items that still failed after the last attempt, and the errors that
+        caused them to fail.
+    """
+
+    def send_chunk(chunk: List[T]) -> Outcome[T]:
+        try:
+            return send(chunk)
+        except core.ApiException as ex:
+            return chunk, ex.error or core.ApiError(message=str(ex))
+
+    failed = list(items)
+    errors = []  # type: List[core.ApiError]
+    for _ in range(retries + 1):
+        chunks = [
+            failed[start : start + max_items]
+            for start in range(0, len(failed), max_items)
+        ]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            outcomes = list(executor.map(send_chunk, chunks))
+        failed = [item for chunk_failed, _ in outcomes for item in chunk_failed]
+        errors = [error for _, error in outcomes if error is not None]
+        if not failed:
+            break
+    return failed, errors
+
+
+def merge_errors(errors: Sequence[core.ApiError]) -> core.ApiError:
+    """Combine the errors of several requests into one, whose inner errors are the
+    errors of each request.
+    """
+    if len(errors) == 1:
+        return errors[0]
+    inner_errors = []  # type: List[core.ApiError]
+    for error in errors:
+        inner_errors.extend(error.inner_errors or [error])
+    return core.ApiError(
+        name=errors[0].name,
+        code=errors[0].code,
+        message=errors[0].message,
+        inner_errors=inner_errors,
+    )
@@ -0,0 +1,264 @@
+"""Resumable reads and exports that record their progress in a local checkpoint file."""
+
+import csv
+import json
+import os
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from nisystemlink.clients import core
+from nisystemlink.clients.core.helpers import IteratorFileLike
+from requests import RequestException
+
+from . import models
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+_CHECKPOINT_BYTES = 1 << 20
+"""Exports record a checkpoint after at least this many bytes have been written."""
+
+_READ_BYTES = 65536
+
+
+class CheckpointFile:
+    """A small JSON file recording how far an operation has progressed.
+
+    The file also records which operation it belongs to, so that a checkpoint is
+    never used to resume a different table or query.
+    """
+
+    def __init__(self, path: PathLike, operation: Dict[str, Any]) -> None:
+        self.path = os.fspath(path)
+        self.operation = operation
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Read the progress recorded by a previous attempt.
+
+        Returns:
+            The recorded progress, or None if there is no checkpoint.
+
+        Raises:
+            ValueError: if the checkpoint belongs to a different operation.
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                checkpoint = json.load(file)
+        except FileNotFoundError:
+            return None
+        if checkpoint.get("operation") != self.operation:
+            raise ValueError(
+                "Checkpoint '{}' was recorded for a different table or query".format(
+                    self.path
+                )
+            )
+        return checkpoint["progress"]
+
+    def save(self, progress: Dict[str, Any]) -> None:
+        """Record progress, replacing the file atomically so that a crash leaves
+        either the previous checkpoint or the new one.
+        """
+        temporary = self.path + ".tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump({"operation": self.operation, "progress": progress}, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, self.path)
+
+    def remove(self) -> None:
+        """Delete the checkpoint once the operation has completed."""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def iter_checkpointed(
+    pages: Callable[[Optional[str]], Iterator[models.PagedTableRows]],
+    continuation_token: Optional[str],
+    checkpoint: CheckpointFile,
+) -> Iterator[models.PagedTableRows]:
+    """Yield pages of rows, recording the continuation token of the next page once the
+    caller has finished with each one.
+
+    A page is only considered finished when the caller asks for the next one, so a
+    page being processed when the process stops is read again on resume.
+    """
+    progress = checkpoint.load()
+    if progress is not None:
+        continuation_token = progress["continuationToken"]
+
+    for page in pages(continuation_token):
+        yield page
+        if page.continuation_token is None:
+            checkpoint.remove()
+        else:
+            checkpoint.save({"continuationToken": page.continuation_token})
+
+
+def export_to_file(
+    export: Callable[[models.ExportTableDataRequest], IteratorFileLike],
+    index: models.Column,
+    query: models.ExportTableDataRequest,
+    path: PathLike,
+    checkpoint: CheckpointFile,
+    retries: int,
+) -> int:
+    """Export rows to a CSV file, resuming from the checkpoint if there is one.
+
+    Only complete rows are written to the file. The checkpoint records the size of
+    the file and the index value of its last row, both periodically and when the
+    export is interrupted, so an export is resumed by truncating the file to that
+    size and requesting the rows with greater index values. Errors communicating
+    with the service are retried from the last checkpoint up to ``retries`` times.
+
+    Returns:
+        The number of rows in the file, excluding the header.
+    """
+    query = _ordered_by_index(query, index.name)
+    progress = checkpoint.load()
+    attempt = 0
+    while True:
+        try:
+            progress = _export_from(
+                export, index.name, query, path, checkpoint, progress
+            )
+            checkpoint.remove()
+            return progress["rows"]
+        except (core.ApiException, RequestException):
+            if attempt >= retries:
+                raise
+            attempt += 1
+            progress = checkpoint.load()
+
+
+def _ordered_by_index(
+    query: models.ExportTableDataRequest, index_name: str
+) -> models.ExportTableDataRequest:
+    """Check that an export can be resumed by its index column, and order it by that
+    column if it is not already.
+    """
+    if query.response_format != models.ExportFormat.CSV:
+        raise ValueError("Resumable exports must use the CSV format")
+    if query.columns is not None and index_name not in query.columns:
+        raise ValueError(
+            "Resumable exports must include the index column '{}'".format(index_name)
+        )
+    if not query.order_by:
+        return query.copy(
+            update={"order_by": [models.ColumnOrderBy(column=index_name)]}
+        )
+    if (
+        len(query.order_by) == 1
+        and query.order_by[0].column == index_name
+        and not query.order_by[0].descending
+    ):
+        return query
+    raise ValueError(
+        "Resumable exports can only be ordered by the index column '{}' "
+        "in ascending order".format(index_name)
+    )
+
+
+def _export_from(
+    export: Callable[[models.ExportTableDataRequest], IteratorFileLike],
+    index_name: str,
+    query: models.ExportTableDataRequest,
+    path: PathLike,
+    checkpoint: CheckpointFile,
+    progress: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Export the rows after those recorded in ``progress`` and append them to the file.
+
+    Returns:
+        The progress after the last row.
+    """
+    resuming = progress is not None
+    if progress is None:
+        progress = {"offset": 0, "lastIndex": None, "rows": 0}
+    else:
+        filters = list(query.filters or [])
+        filters.append(
+            models.ColumnFilter(
+                column=index_name,
+                operation=models.FilterOperation.GreaterThan,
+                value=progress["lastIndex"],
+            )
+        )
+        query = query.copy(update={"filters": filters})
+
+    try:
+        with open(path, "r+b" if resuming else "wb") as output, export(query) as stream:
+            output.truncate(progress["offset"])
+            output.seek(progress["offset"])
+            position = None  # type: Optional[int]
+            unsaved = 0
+            pending = b""
+            finished = False
+            while not finished:
+                chunk = stream.read1(_READ_BYTES)
+                finished = not chunk
+                data = pending + chunk
+                rows, end = _split_rows(data)
+                if finished and end < len(data):
+                    rows.append(data[end:])
+                    end = len(data)
+                pending = data[end:]
+                if not rows:
+                    continue
+
+                if position is None:
+                    # Every export begins with a header row, which is only kept once.
+                    header = rows.pop(0)
+                    position = _parse_row(header).index(index_name)
+                    if not resuming:
+                        output.write(header)
+                for row in rows:
+                    output.write(row)
+                    unsaved += len(row)
+                if rows:
+                    progress = {
+                        "offset": output.tell(),
+                        "lastIndex": _parse_row(rows[-1])[position],
+                        "rows": progress["rows"] + len(rows),
+                    }
+                if unsaved >= _CHECKPOINT_BYTES:
+                    output.flush()
+                    os.fsync(output.fileno())
+                    checkpoint.save(progress)
+                    unsaved = 0
+    except BaseException:
+        # The file was flushed when it was closed, so every row counted so far has
+        # been written.
+        if progress["lastIndex"] is not None:
+            checkpoint.save(progress)
+        raise
+    return progress
+
+
+def _split_rows(data: bytes) -> Tuple[List[bytes], int]:
+    """Split the complete CSV rows from the start of ``data``.
+
+    A newline only ends a row when it is outside a quoted value, which is the case
+    when an even number of quotes precede it in the row.
+
+    Returns:
+        The complete rows, including their newlines, and the offset just past them.
+    """
+    rows = []  # type: List[bytes]
+    start = 0
+    position = 0
+    quotes = 0
+    while True:
+        newline = data.find(b"\n", position)
+        if newline < 0:
+            return rows, start
+        quotes += data.count(b'"', position, newline)
+        position = newline + 1
+        if quotes % 2 == 0:
+            rows.append(data[start:position])
+            start = position
+            quotes = 0
+
+
+def _parse_row(row: bytes) -> List[str]:
+    # The service begins each export with a byte order mark.
+    return next(csv.reader([row.decode("utf-8-sig")]))
@@ -1,25 +1,77 @@
 """Implementation of DataFrameClient."""
 
-from typing import List, Optional
+import datetime
+import json
+import os
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TYPE_CHECKING,
+)
 
 from nisystemlink.clients import core
+from nisystemlink.clients.core._internal._manual_reset_timer import ManualResetTimer
 from nisystemlink.clients.core._uplink._base_client import BaseClient
+from nisystemlink.clients.core._uplink._json_body import JsonBody
+from nisystemlink.clients.core._uplink._json_model import JsonModel
 from nisystemlink.clients.core._uplink._methods import (
     delete,
     get,
     patch,
     post,
     response_handler,
+    stream_response,
 )
+from nisystemlink.clients.core._uplink._paging import iterate_pages
 from nisystemlink.clients.core.helpers import IteratorFileLike
 from requests.models import Response
 from uplink import Body, Field, Path, Query
 
 from . import models
+from ._adaptive_take import AdaptiveTake
+from ._buffered_table_writer import BufferedTableWriter
+from ._bulk import (
+    merge_errors,
+    Outcome,
+    run_concurrently,
+    run_with_retries,
+    split_rows,
+)
+from ._checkpoint import (
+    CheckpointFile,
+    export_to_file,
+    iter_checkpointed,
+    PathLike,
+)
+from ._follow import FollowState
+from ._partitioned_read import find_index_column, iter_partitioned
+from ._request_body import encode_append_request
+from ._table_metadata_cache import TableMetadataCache
+from ._table_reader import read_tables, TableReadResult
+from ._trusted_rows import loads, parse_rows, Rows
+
+if TYPE_CHECKING:
+    from .columnar import ColumnArray, MemmapTable, TableStatistics
 
 
 class DataFrameClient(BaseClient):
-    def __init__(self, configuration: Optional[core.HttpConfiguration] = None):
+    def __init__(
+        self,
+        configuration: Optional[core.HttpConfiguration] = None,
+        metadata_cache: Optional[TableMetadataCache] = None,
+        trust_responses: bool = False,
+    ):
         """Initialize an instance.
 
         Args:
@@ -27,6 +79,16 @@ class DataFrameClient(BaseClient):
                 how to connect. If not provided, an instance of
                 :class:`JupyterHttpConfiguration <nisystemlink.clients.core.JupyterHttpConfiguration>`
                 is used.
+            metadata_cache: A cache for :meth:`get_table_metadata` to return table
+                metadata from instead of requesting it from the server. The cache is
+                filled with the metadata returned by any method, and tables are
+                removed from it when they are modified or deleted through this
+                client. If not provided, metadata is not cached.
+            trust_responses: Whether methods that return rows of table data create
+                the returned models without validating each cell, which is much
+                faster for large pages. Can be overridden by the ``trusted``
+                argument of each method. Responses are decoded with ``orjson``
+                when it is installed.
 
         Raises:
             ApiException: if unable to communicate with the DataFrame Service.
@@ -35,6 +97,24 @@ class DataFrameClient(BaseClient):
             configuration = core.JupyterHttpConfiguration()
 
         super().__init__(configuration, "/nidataframe/v1/")
+        self._metadata_cache = metadata_cache
+        self._trust_responses = trust_responses
+
+    @property
+    def metadata_cache(self) -> Optional[TableMetadataCache]:
+        """The cache of table metadata used by the client, if any."""
+        return self._metadata_cache
+
+    def _invalidate_metadata(self, ids: Iterable[str]) -> None:
+        if self._metadata_cache is not None:
+            self._metadata_cache.invalidate(ids)
+
+    def _parse_rows(
+        self, cls: Type[Rows], response: Response, trusted: Optional[bool]
+    ) -> Rows:
+        if trusted is None:
+            trusted = self._trust_responses
+        return parse_rows(cls, loads(response.content), trusted)
 
     @get("")
     def api_info(self) -> models.ApiInfo:
@@ -59,6 +139,17 @@ class DataFrameClient(BaseClient):
             Query("workspace"),
         ],
     )
+    def _list_tables(
+        self,
+        take: Optional[int] = None,
+        id: Optional[List[str]] = None,
+        order_by: Optional[models.OrderBy] = None,
+        order_by_descending: Optional[bool] = None,
+        continuation_token: Optional[str] = None,
+        workspace: Optional[List[str]] = None,
+    ) -> models.PagedTables:
+        ...
+
     def list_tables(
         self,
         take: Optional[int] = None,
@@ -85,7 +176,17 @@ class DataFrameClient(BaseClient):
             ApiException: if unable to communicate with the DataFrame Service
                 or provided an invalid argument.
         """
-        ...
+        result = self._list_tables(
+            take=take,
+            id=id,
+            order_by=order_by,
+            order_by_descending=order_by_descending,
+            continuation_token=continuation_token,
+            workspace=workspace,
+        )
+        if self._metadata_cache is not None:
+            self._metadata_cache.put_many(result.tables)
+        return result
 
     @post("tables", return_key="id")
     def create_table(self, table: models.CreateTableRequest) -> str:
@@ -104,6 +205,9 @@ class DataFrameClient(BaseClient):
         ...
 
     @post("query-tables")
+    def _query_tables(self, query: models.QueryTablesRequest) -> models.PagedTables:
+        ...
+
     def query_tables(self, query: models.QueryTablesRequest) -> models.PagedTables:
         """Queries available tables on the SystemLink DataFrame service and returns their metadata.
 
@@ -117,9 +221,15 @@ class DataFrameClient(BaseClient):
             ApiException: if unable to communicate with the DataFrame Service
                 or provided an invalid argument.
         """
-        ...
+        result = self._query_tables(query)
+        if self._metadata_cache is not None:
+            self._metadata_cache.put_many(result.tables)
+        return result
 
     @get("tables/{id}")
+    def _get_table_metadata(self, id: str) -> models.TableMetadata:
+        ...
+
     def get_table_metadata(self, id: str) -> models.TableMetadata:
         """Retrieves the metadata and column information for a single table identified by its ID.
 
@@ -133,9 +243,19 @@ class DataFrameClient(BaseClient):
             ApiException: if unable to communicate with the DataFrame Service
                 or provided an invalid argument.
         """
-        ...
+        if self._metadata_cache is None:
+            return self._get_table_metadata(id)
+
+        metadata = self._metadata_cache.get(id)
+        if metadata is None:
+            metadata = self._get_table_metadata(id)
+            self._metadata_cache.put(metadata)
+        return metadata
 
     @patch("tables/{id}", args=[Path, Body])
+    def _modify_table(self, id: str, update: models.ModifyTableRequest) -> None:
+        ...
+
     def modify_table(self, id: str, update: models.ModifyTableRequest) -> None:
         """Modify properties of a table or its columns.
 
@@ -147,9 +267,15 @@ class DataFrameClient(BaseClient):
             ApiException: if unable to communicate with the DataFrame Service
                 or provided an invalid argument.
         """
-        ...
+        try:
+            self._modify_table(id, update)
+        finally:
+            self._invalidate_metadata([id])
 
     @delete("tables/{id}")
+    def _delete_table(self, id: str) -> None:
+        ...
+
     def delete_table(self, id: str) -> None:
         """Deletes a table.
 
@@ -160,9 +286,17 @@ class DataFrameClient(BaseClient):
             ApiException: if unable to communicate with the DataFrame Service
                 or provided an invalid argument.
         """
-        ...
+        try:
+            self._delete_table(id)
+        finally:
+            self._invalidate_metadata([id])
 
     @post("delete-tables", args=[Field("ids")])
+    def _delete_tables(
+        self, ids: List[str]
+    ) -> Optional[models.DeleteTablesPartialSuccess]:
+        ...
+
     def delete_tables(
         self, ids: List[str]
     ) -> Optional[models.DeleteTablesPartialSuccess]:
@@ -179,9 +313,17 @@ class DataFrameClient(BaseClient):
             ApiException: if unable to communicate with the DataFrame Service
                 or provided an invalid argument.
         """
-        ...
+        try:
+            return self._delete_tables(ids)
+        finally:
+            self._invalidate_metadata(ids)
 
     @post("modify-tables")
+    def _modify_tables(
+        self, updates: models.ModifyTablesRequest
+    ) -> Optional[models.ModifyTablesPartialSuccess]:
+        ...
+
     def modify_tables(
         self, updates: models.ModifyTablesRequest
     ) -> Optional[models.ModifyTablesPartialSuccess]:
@@ -198,7 +340,125 @@ class DataFrameClient(BaseClient):
             ApiException: if unable to communicate with the DataFrame Service
                 or provided an invalid argument.
         """
-        ...
+        try:
+            return self._modify_tables(updates)
+        finally:
+            self._invalidate_metadata(table.id for table in updates.tables)
+
+    def bulk_delete_tables(
+        self,
+        ids: Iterable[str],
+        max_ids_per_request: int = 1000,
+        max_workers: int = 4,
+        retries: int = 1,
+    ) -> Optional[models.DeleteTablesPartialSuccess]:
+        """Deletes any number of tables, split into multiple requests that are sent
+        concurrently.
+
+        Tables that fail to delete are retried on their own, without resending the
+        tables that were deleted. A request that fails entirely counts as a failure
+        to delete each of its tables.
+
+        Args:
+            ids: Unique IDs of data tables.
+            max_ids_per_request: The maximum number of tables to delete per request.
+            max_workers: The maximum number of requests to send at once.
+            retries: The number of times to retry deleting tables that failed.
+
+        Returns:
+            The combined partial success of every request if any tables still failed
+            to delete after retrying, or None if all tables were deleted. The error
+            of the partial success contains the errors of each failed request.
+
+        Raises:
+            ValueError: if ``max_ids_per_request`` or ``max_workers`` is less than one,
+                or ``retries`` is negative.
+        """
+        if max_ids_per_request < 1:
+            raise ValueError("max_ids_per_request must be at least 1")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if retries < 0:
+            raise ValueError("retries cannot be negative")
+        all_ids = list(ids)
+
+        def send(chunk: List[str]) -> Outcome[str]:
+            result = self.delete_tables(chunk)
+            if result is None:
+                return [], None
+            return result.failed_table_ids, result.error
+
+        failed, errors = run_with_retries(
+            send, all_ids, max_ids_per_request, max_workers, retries
+        )
+        if not failed:
+            return None
+        failed_ids = set(failed)
+        return models.DeleteTablesPartialSuccess(
+            deleted_table_ids=[id for id in all_ids if id not in failed_ids],
+            failed_table_ids=failed,
+            error=merge_errors(errors),
+        )
+
+    def bulk_modify_tables(
+        self,
+        updates: models.ModifyTablesRequest,
+        max_tables_per_request: int = 1000,
+        max_workers: int = 4,
+        retries: int = 1,
+    ) -> Optional[models.ModifyTablesPartialSuccess]:
+        """Modify any number of tables, split into multiple requests that are sent
+        concurrently.
+
+        Modifications that fail are retried on their own, without resending the
+        modifications that succeeded. A request that fails entirely counts as a
+        failure to apply each of its modifications.
+
+        Args:
+            updates: The table modifications to apply. ``replace`` applies to every
+                request.
+            max_tables_per_request: The maximum number of tables to modify per
+                request.
+            max_workers: The maximum number of requests to send at once.
+            retries: The number of times to retry modifications that failed.
+
+        Returns:
+            The combined partial success of every request if any modifications still
+            failed after retrying, or None if all tables were modified. The error of
+            the partial success contains the errors of each failed request.
+
+        Raises:
+            ValueError: if ``max_tables_per_request`` or ``max_workers`` is less than
+                one, or ``retries`` is negative.
+        """
+        if max_tables_per_request < 1:
+            raise ValueError("max_tables_per_request must be at least 1")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if retries < 0:
+            raise ValueError("retries cannot be negative")
+
+        def send(
+            chunk: List[models.TableMetadataModification],
+        ) -> Outcome[models.TableMetadataModification]:
+            result = self.modify_tables(updates.copy(update={"tables": chunk}))
+            if result is None:
+                return [], None
+            return result.failed_modifications, result.error
+
+        failed, errors = run_with_retries(
+            send, updates.tables, max_tables_per_request, max_workers, retries
+        )
+        if not failed:
+            return None
+        failed_ids = {modification.id for modification in failed}
+        return models.ModifyTablesPartialSuccess(
+            modified_table_ids=[
+                table.id for table in updates.tables if table.id not in failed_ids
+            ],
+            failed_modifications=failed,
+            error=merge_errors(errors),
+        )
 
     @get(
         "tables/{id}/data",
@@ -211,6 +471,17 @@ class DataFrameClient(BaseClient):
             Query("continuationToken"),
         ],
     )
+    def _get_table_data(
+        self,
+        id: str,
+        columns: Optional[List[str]] = None,
+        order_by: Optional[List[str]] = None,
+        order_by_descending: Optional[bool] = None,
+        take: Optional[int] = None,
+        continuation_token: Optional[str] = None,
+    ) -> Response:
+        ...
+
     def get_table_data(
         self,
         id: str,
@@ -219,6 +490,7 @@ class DataFrameClient(BaseClient):
         order_by_descending: Optional[bool] = None,
         take: Optional[int] = None,
         continuation_token: Optional[str] = None,
+        trusted: Optional[bool] = None,
     ) -> models.PagedTableRows:
         """Reads raw data from the table identified by its ID.
 
@@ -233,6 +505,8 @@ class DataFrameClient(BaseClient):
             order_by_descending: Whether to sort descending instead of ascending. Defaults to false.
             take: Limits the returned list to the specified number of results. Defaults to 500.
             continuation_token: The token used to paginate results.
+            trusted: Whether to create the returned rows without validating each cell.
+                Defaults to the client's ``trust_responses`` setting.
 
         Returns:
             The table data and total number of rows with a continuation token.
@@ -241,12 +515,99 @@ class DataFrameClient(BaseClient):
             ApiException: if unable to communicate with the DataFrame Service
                 or provided an invalid argument.
         """
-        ...
+        response = self._get_table_data(
+            id,
+            columns=columns,
+            order_by=order_by,
+            order_by_descending=order_by_descending,
+            take=take,
+            continuation_token=continuation_token,
+        )
+        return self._parse_rows(models.PagedTableRows, response, trusted)
+
+    def iter_table_data(
+        self,
+        id: str,
+        columns: Optional[List[str]] = None,
+        order_by: Optional[List[str]] = None,
+        order_by_descending: Optional[bool] = None,
+        take: Optional[int] = None,
+        continuation_token: Optional[str] = None,
+        prefetch: int = 1,
+        adaptive_take: Optional[AdaptiveTake] = None,
+    ) -> Iterator[models.PagedTableRows]:
+        """Reads every page of raw data from the table identified by its ID,
+        following continuation tokens automatically.
+
+        Args:
+            id: Unique ID of a data table.
+            columns: Columns to include in the response. Data will be returned in the same order as
+                the columns. If not specified, all columns are returned.
+            order_by: List of columns to sort by. If not specified, then the order in which
+                results are returned is undefined.
+            order_by_descending: Whether to sort descending instead of ascending. Defaults to false.
+            take: Limits each page to the specified number of results. Defaults to 500.
+            continuation_token: The token of the first page to read, or None to start from the
+                first row.
+            prefetch: The number of pages to request ahead of the caller on a background thread,
+                so that network latency overlaps with processing of the current page. If 0, each
+                page is requested only when the iterator is advanced.
+            adaptive_take: If set, chooses the take of each page from the time taken by
+                previous pages, instead of using ``take``.
+
+        Returns:
+            An iterator over each page of table data.
+
+        Raises:
+            ValueError: if ``prefetch`` is negative.
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        return iterate_pages(
+            lambda token: self._read_page(
+                lambda page_take: self._get_table_data(
+                    id,
+                    columns=columns,
+                    order_by=order_by,
+                    order_by_descending=order_by_descending,
+                    take=take if page_take is None else page_take,
+                    continuation_token=token,
+                ),
+                adaptive_take,
+            ),
+            continuation_token,
+            prefetch,
+        )
+
+    def _read_page(
+        self,
+        request: Callable[[Optional[int]], Response],
+        adaptive_take: Optional[AdaptiveTake],
+    ) -> models.PagedTableRows:
+        """Request a page of rows, letting ``adaptive_take`` choose its take and
+        measure how long it took.
+        """
+        if adaptive_take is None:
+            return self._parse_rows(models.PagedTableRows, request(None), None)
+
+        take = adaptive_take.take
+        started = time.perf_counter()
+        response = request(take)
+        seconds = time.perf_counter() - started
+        page = self._parse_rows(models.PagedTableRows, response, None)
+        adaptive_take.record(take, len(page.frame.data), seconds, len(response.content))
+        return page
 
     @post("tables/{id}/data", args=[Path, Body])
+    def _append_table_data(self, id: str, data: JsonBody) -> None:
+        ...
+
     def append_table_data(self, id: str, data: models.AppendTableDataRequest) -> None:
         """Appends one or more rows of data to the table identified by its ID.
 
+        Frames with many rows are encoded and sent a piece at a time, rather than
+        encoding the whole request before sending it.
+
         Args:
             id: Unique ID of a data table.
             data: The rows of data to append and any additional options.
@@ -255,17 +616,189 @@ class DataFrameClient(BaseClient):
             ApiException: if unable to communicate with the DataFrame Service
                 or provided an invalid argument.
         """
-        ...
+        self._append_table_data(id, encode_append_request(data))
+
+    def append_arrays(
+        self,
+        id: str,
+        columns: Mapping[str, Any],
+        end_of_data: Optional[bool] = None,
+    ) -> None:
+        """Appends rows of data, given as one array per column, to the table identified by its ID.
+
+        Values are converted to the string encoding of each column's data type a
+        whole column at a time. Requires NumPy.
+
+        Args:
+            id: Unique ID of a data table.
+            columns: A mapping from column name to the values of that column, such
+                as a dictionary of NumPy arrays or a pandas ``DataFrame``. See
+                :func:`~nisystemlink.clients.dataframe.columnar.encode_frame` for
+                the supported value types and how nulls are represented.
+            end_of_data: Whether the table should expect any additional rows to be
+                appended in future requests.
+
+        Raises:
+            ValueError: if a column isn't defined in the table, or the columns are
+                not all the same length.
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        from .columnar import encode_frame
+
+        frame = encode_frame(columns, self.get_table_metadata(id))
+        if end_of_data is None:
+            request = models.AppendTableDataRequest.construct(frame=frame)
+        else:
+            request = models.AppendTableDataRequest.construct(
+                frame=frame, end_of_data=end_of_data
+            )
+        self.append_table_data(id, request)
+
+    def bulk_append_table_data(
+        self,
+        id: str,
+        rows: Iterable[Sequence[Optional[str]]],
+        columns: Optional[List[str]] = None,
+        end_of_data: Optional[bool] = None,
+        max_rows_per_request: int = 10000,
+        max_bytes_per_request: int = 4 * 1024 * 1024,
+        max_workers: int = 4,
+    ) -> int:
+        """Appends any number of rows to the table identified by its ID, split into
+        multiple requests that are sent concurrently.
+
+        Rows are consumed from ``rows`` as requests are sent, so ``rows`` may be a
+        generator producing more data than fits in memory. Because requests
+        complete in any order, the rows may be stored in a different order than
+        they were provided. Read the table ordered by its index column to get them
+        back in order.
+
+        Args:
+            id: Unique ID of a data table.
+            rows: The rows to append, with each value encoded as described by
+                :class:`.DataFrame`.
+            columns: The names and order of the columns included in each row. If not
+                specified, each row must contain all columns in the order specified
+                when the table was created.
+            end_of_data: Whether the table should expect any additional rows to be
+                appended in future requests. If True, this is sent in a final request
+                only after all rows have been appended successfully.
+            max_rows_per_request: The maximum number of rows in each request.
+            max_bytes_per_request: The approximate maximum size, in bytes, of the rows
+                in each request. A single row larger than this is sent on its own.
+            max_workers: The maximum number of requests to send at once.
+
+        Returns:
+            The number of rows appended.
+
+        Raises:
+            ValueError: if ``max_rows_per_request``, ``max_bytes_per_request``, or
+                ``max_workers`` is less than one.
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument. No further requests are started
+                after a request fails, and ``end_of_data`` is not sent.
+        """
+        if max_rows_per_request < 1:
+            raise ValueError("max_rows_per_request must be at least 1")
+        if max_bytes_per_request < 1:
+            raise ValueError("max_bytes_per_request must be at least 1")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        row_count = 0
+
+        def chunks() -> Iterator[List[Sequence[Optional[str]]]]:
+            nonlocal row_count
+            for chunk in split_rows(rows, max_rows_per_request, max_bytes_per_request):
+                row_count += len(chunk)
+                yield chunk
+
+        def append(chunk: List[Sequence[Optional[str]]]) -> None:
+            if columns is None:
+                frame = models.DataFrame.construct(data=chunk)
+            else:
+                frame = models.DataFrame.construct(columns=columns, data=chunk)
+            self.append_table_data(
+                id, models.AppendTableDataRequest.construct(frame=frame)
+            )
+
+        run_concurrently(append, chunks(), max_workers)
+        if end_of_data:
+            self.append_table_data(id, models.AppendTableDataRequest(end_of_data=True))
+        return row_count
+
+    def create_writer(
+        self,
+        id: str,
+        *,
+        buffer_rows: Optional[int] = None,
+        max_buffer_time: Optional[datetime.timedelta] = None,
+        columns: Optional[List[str]] = None,
+        end_of_data: bool = True,
+    ) -> BufferedTableWriter:
+        """Create a writer that buffers rows to append to the table identified by its ID
+        until :meth:`~BufferedTableWriter.send_buffered_writes()` is called on the
+        returned object, ``buffer_rows`` rows have been buffered, or
+        ``max_buffer_time`` time has passed since buffering a row, at which point the
+        rows will be sent automatically.
+
+        Args:
+            id: Unique ID of a data table.
+            buffer_rows: The maximum number of rows to buffer before automatically
+                sending them to the server.
+            max_buffer_time: The amount of time before rows are sent.
+            columns: The names and order of the columns included in each row. If not
+                specified, each row must contain all columns in the order specified
+                when the table was created.
+            end_of_data: Whether to tell the table to expect no more rows when the
+                writer is closed.
+
+        Returns:
+            The created writer. Close the writer to send any remaining rows and free
+            resources.
+
+        Raises:
+            ValueError: if ``buffer_rows`` and ``max_buffer_time`` are both None.
+            ValueError: if ``buffer_rows`` is less than one.
+        """
+        if buffer_rows is None and max_buffer_time is None:
+            raise ValueError("must provide either buffer_rows or max_buffer_time")
+
+        if buffer_rows is not None:
+            if buffer_rows < 1:
+                raise ValueError("buffer_rows cannot be 0 or negative")
+        else:
+            buffer_rows = 0
+
+        if max_buffer_time is not None:
+            if max_buffer_time.total_seconds() < 0.001:
+                raise ValueError("max_buffer_time must be at least 1 millisecond")
+            timer = ManualResetTimer(max_buffer_time)
+        else:
+            timer = ManualResetTimer.null_timer
+
+        return BufferedTableWriter(self, id, buffer_rows, timer, columns, end_of_data)
 
     @post("tables/{id}/query-data", args=[Path, Body])
-    def query_table_data(
+    def _query_table_data(
         self, id: str, query: models.QueryTableDataRequest
+    ) -> Response:
+        ...
+
+    def query_table_data(
+        self,
+        id: str,
+        query: models.QueryTableDataRequest,
+        trusted: Optional[bool] = None,
     ) -> models.PagedTableRows:
         """Reads rows of data that match a filter from the table identified by its ID.
 
         Args:
             id: Unique ID of a data table.
             query: The filtering and sorting to apply when reading data.
+            trusted: Whether to create the returned rows without validating each cell.
+                Defaults to the client's ``trust_responses`` setting.
 
         Returns:
             The table data and total number of rows with a continuation token.
@@ -274,17 +807,258 @@ class DataFrameClient(BaseClient):
             ApiException: if unable to communicate with the DataFrame Service
                 or provided an invalid argument.
         """
-        ...
+        response = self._query_table_data(id, query)
+        return self._parse_rows(models.PagedTableRows, response, trusted)
+
+    def iter_query_table_data(
+        self,
+        id: str,
+        query: models.QueryTableDataRequest,
+        prefetch: int = 1,
+        checkpoint_path: Optional[PathLike] = None,
+        adaptive_take: Optional[AdaptiveTake] = None,
+    ) -> Iterator[models.PagedTableRows]:
+        """Reads every page of rows that match a filter from the table identified by its ID,
+        following continuation tokens automatically.
+
+        Args:
+            id: Unique ID of a data table.
+            query: The filtering and sorting to apply when reading data. If
+                ``query.continuation_token`` is set, reading starts from that page.
+            prefetch: The number of pages to request ahead of the caller on a background thread,
+                so that network latency overlaps with processing of the current page. If 0, each
+                page is requested only when the iterator is advanced.
+            checkpoint_path: The path of a local file in which to record the continuation
+                token of the next page each time the caller advances the iterator. If the
+                file exists, reading resumes from the recorded page instead of
+                ``query.continuation_token``, so a read interrupted by a crash or a network
+                error can be continued by calling this method again with the same arguments.
+                The page being processed when the read was interrupted is read again. The
+                file is deleted once the last page has been read.
+            adaptive_take: If set, chooses the take of each page from the time taken by
+                previous pages, instead of using ``query.take``.
+
+        Returns:
+            An iterator over each page of table data.
+
+        Raises:
+            ValueError: if ``prefetch`` is negative, or if the checkpoint file was recorded
+                for a different table or query.
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+
+        def read_page(token: Optional[str]) -> models.PagedTableRows:
+            page_query = (
+                query
+                if token is None
+                else query.copy(update={"continuation_token": token})
+            )
+            return self._read_page(
+                lambda take: self._query_table_data(
+                    id,
+                    page_query
+                    if take is None
+                    else page_query.copy(update={"take": take}),
+                ),
+                adaptive_take,
+            )
+
+        def pages(token: Optional[str]) -> Iterator[models.PagedTableRows]:
+            return iterate_pages(read_page, token, prefetch)
+
+        if checkpoint_path is None:
+            return pages(query.continuation_token)
+        if prefetch < 0:
+            raise ValueError("prefetch must not be negative")
+        checkpoint = CheckpointFile(
+            checkpoint_path,
+            {"table": id, "query": self._operation(query, {"continuation_token"})},
+        )
+        return iter_checkpointed(pages, query.continuation_token, checkpoint)
+
+    def follow_table(
+        self,
+        id: str,
+        query: Optional[models.QueryTableDataRequest] = None,
+        poll_interval: float = 5.0,
+        start_after: Optional[str] = None,
+    ) -> Iterator[models.PagedTableRows]:
+        """Reads the rows of the table identified by its ID as they are appended.
+
+        The table is polled every ``poll_interval`` seconds. Each poll reads the
+        table's metadata and, only if its rows have been modified since the last poll,
+        requests the rows with index values greater than the largest one read so far.
+        Rows are returned in order of the table's index column. The iterator ends once
+        the table no longer supports appending and every row has been read.
+
+        Args:
+            id: Unique ID of a data table.
+            query: The columns and filters to apply when reading data. ``take`` sets the
+                maximum number of rows in each page. The query must include the index
+                column, and may only be ordered by the index column in ascending order.
+            poll_interval: The number of seconds to wait between polls.
+            start_after: Only rows with an index value greater than this are read. If
+                None, every row of the table is read, starting with those already
+                appended.
+
+        Returns:
+            An iterator over each page of new rows. Pages without rows are skipped.
+
+        Raises:
+            ValueError: if ``poll_interval`` is negative, or the query cannot be
+                followed by the table's index column.
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        if poll_interval < 0:
+            raise ValueError("poll_interval must not be negative")
+        state = FollowState(query, start_after)
+
+        def follow() -> Iterator[models.PagedTableRows]:
+            while True:
+                # The cache would hide changes to the rows until its entry expires.
+                page_query = state.poll(self._get_table_metadata(id))
+                while page_query is not None:
+                    page = self.query_table_data(id, page_query)
+                    if page.frame.data:
+                        yield page
+                    page_query = state.next_page(page)
+                if state.complete:
+                    return
+                time.sleep(poll_interval)
+
+        return follow()
+
+    def iter_query_table_data_partitioned(
+        self,
+        id: str,
+        query: models.QueryTableDataRequest,
+        partitions: int = 4,
+        max_workers: Optional[int] = None,
+    ) -> Iterator[models.TableRows]:
+        """Reads every row that matches a filter from the table identified by its ID,
+        reading several ranges of the table's index column in parallel.
+
+        The smallest and largest index values matching the query are found first.
+        That range is split into ``partitions`` ranges of equal width, and each is
+        paged through on its own worker thread. Pages are returned ordered by the
+        index column, and pages of a range are returned as soon as all earlier
+        ranges are complete, so pages of later ranges may be held in memory until
+        then.
+
+        Args:
+            id: Unique ID of a data table.
+            query: The filtering to apply when reading data, and the number of rows
+                to read per request. The query may only be ordered by the index
+                column, which is the default ordering.
+            partitions: The number of ranges to split the index column into.
+            max_workers: The maximum number of ranges to read at once. Defaults to
+                ``partitions``.
+
+        Returns:
+            An iterator over each page of table data, ordered by the index column.
+
+        Raises:
+            ValueError: if ``partitions`` or ``max_workers`` is less than one, the
+                table has no INDEX column, or the query is ordered by another column.
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        if partitions < 1:
+            raise ValueError("partitions must be at least 1")
+        if max_workers is None:
+            max_workers = partitions
+        elif max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        index = find_index_column(self.get_table_metadata(id))
+        return iter_partitioned(
+            lambda page_query: self.query_table_data(id, page_query),
+            index,
+            query,
+            partitions,
+            max_workers,
+        )
+
+    def read_tables(
+        self,
+        query: models.QueryTablesRequest,
+        data_query: Optional[models.QueryTableDataRequest] = None,
+        max_workers: int = 8,
+    ) -> Iterator[TableReadResult]:
+        """Reads the data of every table that matches a query, reading several tables
+        in parallel.
+
+        Pages of matching tables are requested on a background thread, and each table
+        is read as soon as the page it is on arrives. Results are returned in the
+        order the reads complete, not the order the tables were found. An error
+        reading one table doesn't stop the others from being read; it is returned in
+        that table's result instead.
+
+        Args:
+            query: The filter used to find the tables to read, and the number of tables
+                to request per page.
+            data_query: The filtering and sorting to apply when reading each table's
+                data, and the number of rows to read per request. If not specified,
+                every row and column of each table is read.
+            max_workers: The maximum number of tables to read at once.
+
+        Returns:
+            An iterator over the result of reading each table.
+
+        Raises:
+            ValueError: if ``max_workers`` is less than one.
+            ApiException: if unable to query the tables to read. Errors reading a
+                table are reported in its :class:`TableReadResult` instead.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        table_query = data_query or models.QueryTableDataRequest()
+
+        def read_table(metadata: models.TableMetadata) -> models.DataFrame:
+            columns = None  # type: Optional[List[str]]
+            data = []  # type: List[List[Optional[str]]]
+            for page in self.iter_query_table_data(
+                metadata.id, table_query, prefetch=0
+            ):
+                columns = page.frame.columns
+                data.extend(page.frame.data)
+            return models.DataFrame.construct(columns=columns, data=data)
+
+        tables = (
+            table
+            for page in iterate_pages(
+                lambda token: self.query_tables(
+                    query
+                    if token is None
+                    else query.copy(update={"continuation_token": token})
+                ),
+                query.continuation_token,
+            )
+            for table in page.tables
+        )
+        return read_tables(tables, read_table, max_workers)
 
     @post("tables/{id}/query-decimated-data", args=[Path, Body])
-    def query_decimated_data(
+    def _query_decimated_data(
         self, id: str, query: models.QueryDecimatedDataRequest
+    ) -> Response:
+        ...
+
+    def query_decimated_data(
+        self,
+        id: str,
+        query: models.QueryDecimatedDataRequest,
+        trusted: Optional[bool] = None,
     ) -> models.TableRows:
         """Reads decimated rows of data from the table identified by its ID.
 
         Args:
             id: Unique ID of a data table.
             query: The filtering and decimation options to apply when reading data.
+            trusted: Whether to create the returned rows without validating each cell.
+                Defaults to the client's ``trust_responses`` setting.
 
         Returns:
             The decimated table data.
@@ -293,12 +1067,20 @@ class DataFrameClient(BaseClient):
             ApiException: if unable to communicate with the DataFrame Service
                 or provided an invalid argument.
         """
-        ...
+        response = self._query_decimated_data(id, query)
+        return self._parse_rows(models.TableRows, response, trusted)
 
     def _iter_content_filelike_wrapper(response: Response) -> IteratorFileLike:
-        return IteratorFileLike(response.iter_content(chunk_size=4096))
+        def iter_content() -> Iterator[bytes]:
+            try:
+                yield from response.iter_content(chunk_size=65536)
+            finally:
+                response.close()
+
+        return IteratorFileLike(iter_content())
 
     @response_handler(_iter_content_filelike_wrapper)
+    @stream_response
     @post("tables/{id}/export-data", args=[Path, Body])
     def export_table_data(
         self, id: str, query: models.ExportTableDataRequest
@@ -310,10 +1092,356 @@ class DataFrameClient(BaseClient):
             query: The filtering, sorting, and export format to apply when exporting data.
 
         Returns:
-            A file-like object for reading the exported data.
+            A binary file-like object for reading the exported data as it is
+            downloaded. Closing it releases the connection.
 
         Raises:
             ApiException: if unable to communicate with the DataFrame Service
                 or provided an invalid argument.
         """
         ...
+
+    def export_table_data_to_file(
+        self,
+        id: str,
+        query: models.ExportTableDataRequest,
+        path: PathLike,
+        checkpoint_path: Optional[PathLike] = None,
+        retries: int = 3,
+    ) -> int:
+        """Exports rows of data that match a filter from the table identified by its ID
+        to a local CSV file, recording progress so that the export can be resumed.
+
+        Rows are exported in order of the table's index column. After each megabyte
+        of rows, and whenever the export is interrupted, the size of the file and the
+        index value of its last row are recorded in a checkpoint file. An export that
+        is resumed truncates the file to the recorded size and requests only the rows
+        after the recorded index value, so each row appears in the file exactly once.
+
+        Args:
+            id: Unique ID of a data table.
+            query: The filtering, sorting, and export format to apply when exporting
+                data. The format must be ``CSV``. The export must include the index
+                column, and may only be ordered by the index column in ascending order.
+                If no order is given, the rows are ordered by the index column.
+            path: The path of the CSV file to write.
+            checkpoint_path: The path of the file in which to record progress. Defaults
+                to ``path`` with ``.checkpoint`` appended. If the file exists, the export
+                resumes from the recorded progress. It is deleted once the export
+                completes.
+            retries: The number of times to resume the export from the last checkpoint
+                after an error communicating with the DataFrame Service.
+
+        Returns:
+            The number of rows in the file, excluding the header.
+
+        Raises:
+            ValueError: if the query cannot be resumed by the table's index column,
+                ``retries`` is negative, or the checkpoint file was recorded for a
+                different table, query, or file.
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        if retries < 0:
+            raise ValueError("retries must not be negative")
+
+        path = os.fspath(path)
+        if checkpoint_path is None:
+            checkpoint_path = path + ".checkpoint"
+        checkpoint = CheckpointFile(
+            checkpoint_path,
+            {
+                "table": id,
+                "query": self._operation(query, set()),
+                "path": os.path.abspath(path),
+            },
+        )
+        index = find_index_column(self.get_table_metadata(id))
+        return export_to_file(
+            lambda query: self.export_table_data(id, query),
+            index,
+            query,
+            path,
+            checkpoint,
+            retries,
+        )
+
+    @staticmethod
+    def _operation(query: JsonModel, exclude: Set[str]) -> Dict[str, Any]:
+        """Describe a query in the form it is recorded in a checkpoint file."""
+        return json.loads(query.json(by_alias=True, exclude=exclude))
+
+    def export_table_batches(
+        self,
+        id: str,
+        query: models.ExportTableDataRequest,
+        batch_rows: int = 10000,
+    ) -> Iterator[Dict[str, "ColumnArray"]]:
+        """Exports rows of data that match a filter from the table identified by its ID,
+        parsing them incrementally into batches of typed columns.
+
+        The export is parsed as it is downloaded, so memory use is bounded by
+        ``batch_rows`` regardless of the size of the export. Requires NumPy.
+
+        Args:
+            id: Unique ID of a data table.
+            query: The filtering, sorting, and export format to apply when exporting
+                data. The format must be ``CSV``.
+            batch_rows: The maximum number of rows in each batch.
+
+        Returns:
+            An iterator over batches of rows. Each batch maps each exported column
+            name to a :class:`~nisystemlink.clients.dataframe.columnar.ColumnArray`.
+            See :func:`~nisystemlink.clients.dataframe.columnar.iter_csv_batches`
+            for how nulls are represented.
+
+        Raises:
+            ValueError: if ``batch_rows`` is less than one.
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        _, batches = self._export_batches(id, query, batch_rows)
+        return batches
+
+    def export_table_batches_parallel(
+        self,
+        id: str,
+        query: models.ExportTableDataRequest,
+        block_size: int = 16 * 1024 * 1024,
+        max_workers: Optional[int] = None,
+    ) -> Iterator[Dict[str, "ColumnArray"]]:
+        """Exports rows of data that match a filter from the table identified by its ID,
+        parsing them into batches of typed columns on a pool of processes.
+
+        The export is split into blocks of rows as it is downloaded, and the blocks
+        are parsed in parallel, so that parsing keeps up with fast connections
+        instead of being limited to a single processor. Requires NumPy.
+
+        Args:
+            id: Unique ID of a data table.
+            query: The filtering, sorting, and export format to apply when exporting
+                data. The format must be ``CSV``.
+            block_size: The approximate number of bytes of the export in each batch.
+            max_workers: The number of processes to parse with. Defaults to the number
+                of processors on the machine.
+
+        Returns:
+            An iterator over batches of rows, in the order they were exported. See
+            :func:`~nisystemlink.clients.dataframe.columnar.iter_csv_batches_parallel`
+            for how the export is split and parsed.
+
+        Raises:
+            ValueError: if ``block_size`` or ``max_workers`` is less than one.
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        from .columnar import iter_csv_batches_parallel
+
+        if block_size < 1:
+            raise ValueError("block_size must be at least 1")
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        metadata = self.get_table_metadata(id)
+        stream = self.export_table_data(id, query)
+
+        def parse() -> Iterator[Dict[str, "ColumnArray"]]:
+            try:
+                yield from iter_csv_batches_parallel(
+                    stream, metadata, block_size, max_workers
+                )
+            finally:
+                # Release the connection if iteration stops early.
+                stream.close()
+
+        return parse()
+
+    def export_table_data_to_parquet(
+        self,
+        id: str,
+        query: models.ExportTableDataRequest,
+        path: PathLike,
+        batch_rows: int = 10000,
+        compression: str = "snappy",
+    ) -> int:
+        """Exports rows of data that match a filter from the table identified by its ID
+        to a compressed, columnar Parquet file.
+
+        The export is parsed as it is downloaded and each batch of rows is written as
+        a row group, so memory use is bounded by ``batch_rows`` regardless of the size
+        of the export. See
+        :func:`~nisystemlink.clients.dataframe.columnar.arrow_schema` for the type of
+        each column. Requires NumPy and PyArrow.
+
+        Args:
+            id: Unique ID of a data table.
+            query: The filtering, sorting, and export format to apply when exporting
+                data. The format must be ``CSV``.
+            path: The file to write. An existing file is overwritten.
+            batch_rows: The maximum number of rows in each row group.
+            compression: The compression codec, such as ``"snappy"``, ``"zstd"``, or
+                ``"none"``.
+
+        Returns:
+            The number of rows written.
+
+        Raises:
+            ValueError: if ``batch_rows`` is less than one or the query contains a
+                column that isn't defined in the table.
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        from .columnar import write_parquet
+
+        columns, batches = self._export_batches(id, query, batch_rows)
+        return write_parquet(batches, columns, path, compression)
+
+    def export_table_data_to_arrow(
+        self,
+        id: str,
+        query: models.ExportTableDataRequest,
+        path: PathLike,
+        batch_rows: int = 10000,
+    ) -> int:
+        """Exports rows of data that match a filter from the table identified by its ID
+        to an Arrow IPC file.
+
+        The export is parsed as it is downloaded and each batch of rows is written as
+        a record batch, so memory use is bounded by ``batch_rows`` regardless of the
+        size of the export. See
+        :func:`~nisystemlink.clients.dataframe.columnar.arrow_schema` for the type of
+        each column. Requires NumPy and PyArrow.
+
+        Args:
+            id: Unique ID of a data table.
+            query: The filtering, sorting, and export format to apply when exporting
+                data. The format must be ``CSV``.
+            path: The file to write. An existing file is overwritten.
+            batch_rows: The maximum number of rows in each record batch.
+
+        Returns:
+            The number of rows written.
+
+        Raises:
+            ValueError: if ``batch_rows`` is less than one or the query contains a
+                column that isn't defined in the table.
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        from .columnar import write_arrow_ipc
+
+        columns, batches = self._export_batches(id, query, batch_rows)
+        return write_arrow_ipc(batches, columns, path)
+
+    def _export_batches(
+        self, id: str, query: models.ExportTableDataRequest, batch_rows: int
+    ) -> Tuple[List[models.Column], Iterator[Dict[str, "ColumnArray"]]]:
+        """Start an export parsed into batches, along with the definitions of the
+        exported columns in order.
+        """
+        from .columnar import iter_csv_batches
+
+        if batch_rows < 1:
+            raise ValueError("batch_rows must be at least 1")
+
+        metadata = self.get_table_metadata(id)
+        definitions = {column.name: column for column in metadata.columns}
+        columns = metadata.columns
+        if query.columns:
+            columns = []
+            for name in query.columns:
+                if name not in definitions:
+                    raise ValueError(
+                        "Column '{}' is not defined in the table".format(name)
+                    )
+                columns.append(definitions[name])
+        stream = self.export_table_data(id, query)
+
+        def parse() -> Iterator[Dict[str, "ColumnArray"]]:
+            try:
+                yield from iter_csv_batches(stream, metadata, batch_rows)
+            finally:
+                # Release the connection if iteration stops early.
+                stream.close()
+
+        return columns, parse()
+
+    def profile_table_data(
+        self,
+        id: str,
+        query: Optional[models.ExportTableDataRequest] = None,
+        batch_rows: int = 10000,
+    ) -> "TableStatistics":
+        """Computes summary statistics of each column of the table identified by its ID.
+
+        The rows are exported and parsed in batches, and each batch is included in
+        the statistics and then discarded, so memory use does not depend on the size
+        of the table. Requires NumPy.
+
+        Args:
+            id: Unique ID of a data table.
+            query: The columns and filters to apply when exporting data. Defaults to
+                every row of every column. The format must be ``CSV``.
+            batch_rows: The maximum number of rows parsed at a time.
+
+        Returns:
+            The statistics of each exported column. See
+            :class:`~nisystemlink.clients.dataframe.columnar.ColumnStatistics` for how
+            they are computed. As with
+            :func:`~nisystemlink.clients.dataframe.columnar.iter_csv_batches`, null
+            values of ``STRING`` columns are read as empty strings.
+
+        Raises:
+            ValueError: if ``batch_rows`` is less than one.
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        from .columnar import TableStatistics
+
+        if query is None:
+            query = models.ExportTableDataRequest(
+                response_format=models.ExportFormat.CSV
+            )
+        statistics = TableStatistics()
+        for batch in self.export_table_batches(id, query, batch_rows):
+            statistics.update(batch)
+        return statistics
+
+    def query_table_data_to_memmap(
+        self,
+        id: str,
+        query: models.QueryTableDataRequest,
+        directory: Optional[PathLike] = None,
+        prefetch: int = 1,
+    ) -> "MemmapTable":
+        """Reads every row that matches a filter from the table identified by its ID
+        into memory-mapped files on disk.
+
+        Each page is decoded into typed columns and appended to one file per column
+        as it is read, so tables much larger than memory can be read and then sliced
+        with constant memory use. Requires NumPy.
+
+        Args:
+            id: Unique ID of a data table.
+            query: The filtering and sorting to apply when reading data.
+            directory: The directory to write the files to, which is created if it
+                doesn't exist. Defaults to a new temporary directory, which is deleted
+                when the returned table is closed.
+            prefetch: The number of pages to request ahead of the page being written.
+
+        Returns:
+            The rows, as a :class:`~nisystemlink.clients.dataframe.columnar.MemmapTable`
+            whose columns are backed by :class:`numpy.memmap` arrays.
+
+        Raises:
+            ValueError: if ``prefetch`` is negative.
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        from .columnar import decode_frame, spill_to_memmap
+
+        metadata = self.get_table_metadata(id)
+        pages = self.iter_query_table_data(id, query, prefetch)
+        return spill_to_memmap(
+            (decode_frame(page, metadata) for page in pages), metadata, directory
+        )
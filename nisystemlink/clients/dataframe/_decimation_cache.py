@@ -0,0 +1,461 @@
+"""Implementation of DecimationCache."""
+
+import math
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING, Union
+
+from . import models
+from ._partitioned_read import (
+    find_index_column,
+    find_range,
+    timestamp_from_int,
+    to_int,
+)
+
+if TYPE_CHECKING:
+    from ._data_frame_client import DataFrameClient
+
+Number = Union[int, float]
+
+_CACHED_METHODS = (models.DecimationMethod.MaxMin, models.DecimationMethod.EntryExit)
+_LOWER_BOUNDS = (
+    models.FilterOperation.GreaterThan,
+    models.FilterOperation.GreaterThanEquals,
+)
+_UPPER_BOUNDS = (
+    models.FilterOperation.LessThan,
+    models.FilterOperation.LessThanEquals,
+)
+_DEFAULT_INTERVALS = 1000
+_MAX_FLOAT_LEVEL = 30
+
+_SeriesKey = Tuple[str, str, Tuple[str, ...], str, Optional[Tuple[str, ...]], str]
+"""The table ID, x column, y columns, method, columns, and non-range filters."""
+
+_TileKey = Tuple[_SeriesKey, int, int]
+"""The series, pyramid level, and tile number within the level."""
+
+_Bound = Tuple[Number, bool]
+"""A value of the x column and whether it is included in the range."""
+
+
+class _Series:
+    """The range of x column values that a series' pyramid divides into tiles.
+
+    Level ``n`` of the pyramid splits the range into about ``2 ** n`` tiles of
+    equal width. Integer and timestamp ranges are split on whole numbers.
+    """
+
+    def __init__(self, data_type: models.DataType, first: str, last: str) -> None:
+        self.data_type = data_type
+        self.integral = data_type not in (
+            models.DataType.Float32,
+            models.DataType.Float64,
+        )
+        self.first = self.to_number(first)
+        self.last = self.to_number(last)
+        if not (math.isfinite(self.first) and math.isfinite(self.last)):
+            raise ValueError("The x column contains infinite values")
+        if self.integral:
+            self.span = self.last - self.first + 1  # type: Number
+            self.max_level = int(self.span - 1).bit_length()
+        else:
+            self.span = (self.last - self.first) or 1.0
+            self.max_level = _MAX_FLOAT_LEVEL
+
+    def to_number(self, value: str) -> Number:
+        if self.integral:
+            return to_int(value)
+        return float(value)
+
+    def to_value(self, number: Number) -> str:
+        if self.data_type == models.DataType.Timestamp:
+            return timestamp_from_int(int(number))
+        return repr(number) if not self.integral else str(number)
+
+    def tile_width(self, level: int) -> Number:
+        if self.integral:
+            return max(1, -(-int(self.span) // 2**level))
+        return self.span / 2**level
+
+    def tile_count(self, level: int) -> int:
+        if self.integral:
+            return -(-int(self.span) // int(self.tile_width(level)))
+        return 2**level
+
+    def tile_of(self, level: int, number: Number) -> int:
+        offset = (number - self.first) / self.tile_width(level)
+        return min(max(math.floor(offset), 0), self.tile_count(level) - 1)
+
+    def tile_filters(
+        self, x_column: str, level: int, tile: int
+    ) -> List[models.ColumnFilter]:
+        width = self.tile_width(level)
+        filters = [
+            models.ColumnFilter(
+                column=x_column,
+                operation=models.FilterOperation.GreaterThanEquals,
+                value=self.to_value(self.first + tile * width),
+            )
+        ]
+        if tile == self.tile_count(level) - 1:
+            filters.append(
+                models.ColumnFilter(
+                    column=x_column,
+                    operation=models.FilterOperation.LessThanEquals,
+                    value=self.to_value(self.last),
+                )
+            )
+        else:
+            filters.append(
+                models.ColumnFilter(
+                    column=x_column,
+                    operation=models.FilterOperation.LessThan,
+                    value=self.to_value(self.first + (tile + 1) * width),
+                )
+            )
+        return filters
+
+
+class DecimationCache:
+    """A client-side cache of ``MAX_MIN`` and ``ENTRY_EXIT`` decimated data that
+    answers zoomed and panned views of a table from previously fetched data.
+
+    For each combination of table, x column, y columns, decimation method, and
+    filters, the cache keeps a pyramid of power-of-two resolutions. Each level
+    splits the range of the x column into tiles of equal width, and each tile is
+    decimated by the server into ``tile_intervals`` intervals. A view is answered
+    from the coarsest level that gives at least the requested number of intervals
+    across the view, and only the tiles of that level that aren't cached yet are
+    fetched from the server. The rows of the tiles are then trimmed to the view.
+
+    Because interval boundaries are aligned to tiles rather than to the view, the
+    rows returned are not identical to the rows the server would return for the
+    same query, but every minimum and maximum within the view is present.
+
+    The range of the x column is read when a combination is first queried, and
+    tiles are cached as they were when fetched. Call :meth:`invalidate` after
+    appending rows to a table to see them.
+    """
+
+    def __init__(
+        self,
+        client: "DataFrameClient",
+        tile_intervals: int = 256,
+        max_tiles: int = 1024,
+        max_workers: int = 4,
+    ) -> None:
+        """Initialize an instance.
+
+        Args:
+            client: The client used to read table metadata and data.
+            tile_intervals: The number of decimation intervals in each tile.
+            max_tiles: The maximum number of tiles to keep. The least recently used
+                tiles are evicted first.
+            max_workers: The maximum number of tiles to fetch concurrently.
+
+        Raises:
+            ValueError: if any argument is less than one.
+        """
+        if tile_intervals < 1:
+            raise ValueError("tile_intervals must be at least 1")
+        if max_tiles < 1:
+            raise ValueError("max_tiles must be at least 1")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self._client = client
+        self._tile_intervals = tile_intervals
+        self._max_tiles = max_tiles
+        self._max_workers = max_workers
+        self._lock = threading.Lock()
+        self._series = {}  # type: Dict[_SeriesKey, Optional[_Series]]
+        self._tiles = OrderedDict()  # type: OrderedDict[_TileKey, models.DataFrame]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._tiles)
+
+    def query_decimated_data(
+        self, id: str, query: models.QueryDecimatedDataRequest
+    ) -> models.TableRows:
+        """Reads decimated rows of data from the table identified by its ID, using
+        cached data where possible.
+
+        Filters on the x column using ``GREATER_THAN``, ``GREATER_THAN_EQUALS``,
+        ``LESS_THAN``, or ``LESS_THAN_EQUALS`` select the view; all other filters
+        select the data that is decimated. Queries using the ``LOSSY`` method are
+        not cached and are passed to the server unchanged.
+
+        Args:
+            id: Unique ID of a data table.
+            query: The filtering and decimation options to apply when reading data.
+
+        Returns:
+            The decimated table data, ordered by the x column.
+
+        Raises:
+            ValueError: if the x column contains infinite values.
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        decimation = query.decimation or models.DecimationOptions()
+        if decimation.method not in _CACHED_METHODS:
+            return self._client.query_decimated_data(id, query)
+
+        x_column, data_type = self._resolve_x_column(id, decimation)
+        filters = []  # type: List[models.ColumnFilter]
+        lower = []  # type: List[models.ColumnFilter]
+        upper = []  # type: List[models.ColumnFilter]
+        for filter in query.filters or []:
+            if filter.column == x_column and filter.operation in _LOWER_BOUNDS:
+                lower.append(filter)
+            elif filter.column == x_column and filter.operation in _UPPER_BOUNDS:
+                upper.append(filter)
+            else:
+                filters.append(filter)
+
+        key = (
+            id,
+            x_column,
+            tuple(decimation.y_columns or []),
+            str(decimation.method.value),
+            tuple(query.columns) if query.columns is not None else None,
+            "[{}]".format(",".join(filter.json() for filter in filters)),
+        )  # type: _SeriesKey
+        series = self._get_series(key, data_type, filters)
+        if series is None:
+            return self._client.query_decimated_data(id, query)
+
+        low = _tightest(series, lower, is_lower=True)
+        high = _tightest(series, upper, is_lower=False)
+        first = _first_included(series, low)
+        last = _last_included(series, high)
+        if first > last:
+            return self._client.query_decimated_data(id, query)
+
+        level = self._choose_level(
+            series, first, last, decimation.intervals or _DEFAULT_INTERVALS
+        )
+        tiles = range(series.tile_of(level, first), series.tile_of(level, last) + 1)
+        frames = self._get_tiles(
+            id, query, key, series, x_column, filters, decimation, level, tiles
+        )
+        return models.TableRows(frame=_trim(frames, query, series, x_column, low, high))
+
+    def invalidate(self, id: str) -> None:
+        """Remove all cached data of a table.
+
+        Args:
+            id: Unique ID of a data table. Tables that aren't cached are ignored.
+        """
+        with self._lock:
+            for key in [key for key in self._series if key[0] == id]:
+                del self._series[key]
+            for tile_key in [
+                tile_key for tile_key in self._tiles if tile_key[0][0] == id
+            ]:
+                del self._tiles[tile_key]
+
+    def clear(self) -> None:
+        """Remove all cached data."""
+        with self._lock:
+            self._series.clear()
+            self._tiles.clear()
+
+    def _resolve_x_column(
+        self, id: str, decimation: models.DecimationOptions
+    ) -> Tuple[str, models.DataType]:
+        metadata = self._client.get_table_metadata(id)
+        if decimation.x_column is None:
+            column = find_index_column(metadata)
+            return column.name, column.data_type
+        for column in metadata.columns:
+            if column.name == decimation.x_column:
+                return column.name, column.data_type
+        raise ValueError(
+            "Table '{}' does not have a column named '{}'".format(
+                id, decimation.x_column
+            )
+        )
+
+    def _get_series(
+        self,
+        key: _SeriesKey,
+        data_type: models.DataType,
+        filters: List[models.ColumnFilter],
+    ) -> Optional[_Series]:
+        with self._lock:
+            if key in self._series:
+                return self._series[key]
+
+        x_column = key[1]
+        range_filters = filters + [
+            models.ColumnFilter(
+                column=x_column, operation=models.FilterOperation.NotEquals, value=None
+            )
+        ]
+        if data_type in (models.DataType.Float32, models.DataType.Float64):
+            range_filters.append(
+                models.ColumnFilter(
+                    column=x_column,
+                    operation=models.FilterOperation.NotEquals,
+                    value="NaN",
+                )
+            )
+        bounds = find_range(
+            lambda query: self._client.query_table_data(key[0], query),
+            x_column,
+            range_filters,
+        )
+        series = _Series(data_type, *bounds) if bounds is not None else None
+        with self._lock:
+            self._series[key] = series
+        return series
+
+    def _choose_level(
+        self, series: _Series, first: Number, last: Number, intervals: int
+    ) -> int:
+        """Choose the coarsest level with at least ``intervals`` intervals between
+        ``first`` and ``last``.
+        """
+        view_span = last - first + 1 if series.integral else last - first
+        if view_span <= 0:
+            return series.max_level
+        ratio = series.span * intervals / (view_span * self._tile_intervals)
+        level = math.ceil(math.log2(ratio)) if ratio > 1 else 0
+        return min(level, series.max_level)
+
+    def _get_tiles(
+        self,
+        id: str,
+        query: models.QueryDecimatedDataRequest,
+        key: _SeriesKey,
+        series: _Series,
+        x_column: str,
+        filters: List[models.ColumnFilter],
+        decimation: models.DecimationOptions,
+        level: int,
+        tiles: range,
+    ) -> List[models.DataFrame]:
+        frames = {}  # type: Dict[int, models.DataFrame]
+        with self._lock:
+            for tile in tiles:
+                frame = self._tiles.get((key, level, tile))
+                if frame is not None:
+                    self._tiles.move_to_end((key, level, tile))
+                    frames[tile] = frame
+        missing = [tile for tile in tiles if tile not in frames]
+
+        columns = query.columns
+        if columns is not None and x_column not in columns:
+            columns = columns + [x_column]
+        tile_decimation = decimation.copy(
+            update={"x_column": x_column, "intervals": self._tile_intervals}
+        )
+
+        def fetch(tile: int) -> models.DataFrame:
+            return self._client.query_decimated_data(
+                id,
+                models.QueryDecimatedDataRequest(
+                    columns=columns,
+                    filters=filters + series.tile_filters(x_column, level, tile),
+                    decimation=tile_decimation,
+                ),
+            ).frame
+
+        if len(missing) > 1 and self._max_workers > 1:
+            with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+                fetched = list(executor.map(fetch, missing))
+        else:
+            fetched = [fetch(tile) for tile in missing]
+
+        with self._lock:
+            for tile, frame in zip(missing, fetched):
+                frames[tile] = frame
+                self._tiles[(key, level, tile)] = frame
+            while len(self._tiles) > self._max_tiles:
+                self._tiles.popitem(last=False)
+        return [frames[tile] for tile in tiles]
+
+
+def _tightest(
+    series: _Series, filters: List[models.ColumnFilter], is_lower: bool
+) -> Optional[_Bound]:
+    """Combine lower or upper bound filters into the most restrictive bound."""
+    result = None  # type: Optional[_Bound]
+    for filter in filters:
+        if filter.value is None:
+            raise ValueError("Range filters on the x column require a value")
+        number = series.to_number(filter.value)
+        inclusive = filter.operation in (
+            models.FilterOperation.GreaterThanEquals,
+            models.FilterOperation.LessThanEquals,
+        )
+        if result is None:
+            result = (number, inclusive)
+        elif number == result[0]:
+            result = (number, inclusive and result[1])
+        elif (number > result[0]) == is_lower:
+            result = (number, inclusive)
+    return result
+
+
+def _first_included(series: _Series, low: Optional[_Bound]) -> Number:
+    """The smallest x value within both a lower bound and the series' range."""
+    if low is None:
+        return series.first
+    number, inclusive = low
+    if series.integral and not inclusive:
+        number += 1
+    return max(number, series.first)
+
+
+def _last_included(series: _Series, high: Optional[_Bound]) -> Number:
+    """The largest x value within both an upper bound and the series' range."""
+    if high is None:
+        return series.last
+    number, inclusive = high
+    if series.integral and not inclusive:
+        number -= 1
+    return min(number, series.last)
+
+
+def _trim(
+    frames: List[models.DataFrame],
+    query: models.QueryDecimatedDataRequest,
+    series: _Series,
+    x_column: str,
+    low: Optional[_Bound],
+    high: Optional[_Bound],
+) -> models.DataFrame:
+    """Join the rows of consecutive tiles, keeping only those within the view."""
+    columns = list(frames[0].columns or [])
+    x_index = columns.index(x_column)
+    keep_x = query.columns is None or x_column in query.columns
+
+    data = []  # type: List[List[Optional[str]]]
+    for frame in frames:
+        for row in frame.data:
+            value = row[x_index]
+            if value is None:
+                continue
+            number = series.to_number(value)
+            if low is not None and (
+                number < low[0] or (number == low[0] and not low[1])
+            ):
+                continue
+            if high is not None and (
+                number > high[0] or (number == high[0] and not high[1])
+            ):
+                continue
+            if keep_x:
+                data.append(row)
+            else:
+                data.append(row[:x_index] + row[x_index + 1 :])
+
+    if not keep_x:
+        del columns[x_index]
+    return models.DataFrame(columns=columns, data=data)
@@ -0,0 +1,109 @@
+"""Tailing rows as they are appended to a table."""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from . import models
+from ._partitioned_read import find_index_column
+
+
+class FollowState:
+    """Tracks how much of a table has been read by a follower.
+
+    Each poll first checks the table's metadata. If its rows haven't been modified
+    since the last poll, nothing is read. Otherwise the rows whose index value is
+    greater than the largest one read so far are requested, in index order.
+    """
+
+    def __init__(
+        self,
+        query: Optional[models.QueryTableDataRequest],
+        start_after: Optional[str],
+    ) -> None:
+        self._query = query or models.QueryTableDataRequest()
+        if self._query.continuation_token is not None:
+            raise ValueError("Followed queries cannot have a continuation token")
+        self._last_index = start_after
+        self._rows_modified_at = None  # type: Optional[datetime]
+        self._index_name = ""
+        self._columns = []  # type: List[str]
+        self._poll_query = self._query
+        self.complete = False
+
+    def poll(
+        self, metadata: models.TableMetadata
+    ) -> Optional[models.QueryTableDataRequest]:
+        """Decide whether a poll needs to read rows.
+
+        Args:
+            metadata: The table's metadata, read at the start of the poll.
+
+        Returns:
+            The query for the first page of new rows, or None if the rows haven't
+            been modified since the last poll.
+
+        Raises:
+            ValueError: if the query cannot be followed by the table's index column.
+        """
+        if not self._index_name:
+            self._index_name = find_index_column(metadata).name
+            _validate(self._query, self._index_name)
+            self._columns = self._query.columns or [
+                column.name for column in metadata.columns
+            ]
+        # Once appends are disabled, the rows read by this poll are the last ones.
+        self.complete = not metadata.supports_append
+        if metadata.rows_modified_at == self._rows_modified_at:
+            return None
+        self._rows_modified_at = metadata.rows_modified_at
+
+        filters = list(self._query.filters or [])  # type: List[models.ColumnFilter]
+        if self._last_index is not None:
+            filters.append(
+                models.ColumnFilter(
+                    column=self._index_name,
+                    operation=models.FilterOperation.GreaterThan,
+                    value=self._last_index,
+                )
+            )
+        update = {
+            "order_by": [models.ColumnOrderBy(column=self._index_name)]
+        }  # type: Dict[str, Any]
+        if filters:
+            update["filters"] = filters
+        self._poll_query = self._query.copy(update=update)
+        return self._poll_query
+
+    def next_page(
+        self, page: models.PagedTableRows
+    ) -> Optional[models.QueryTableDataRequest]:
+        """Record the rows of a page that was read.
+
+        Returns:
+            The query for the next page of the poll, or None if it was the last page.
+        """
+        if page.frame.data:
+            columns = page.frame.columns or self._columns
+            position = columns.index(self._index_name)
+            self._last_index = page.frame.data[-1][position]
+        if page.continuation_token is None:
+            return None
+        return self._poll_query.copy(
+            update={"continuation_token": page.continuation_token}
+        )
+
+
+def _validate(query: models.QueryTableDataRequest, index_name: str) -> None:
+    if query.columns is not None and index_name not in query.columns:
+        raise ValueError(
+            "Followed queries must include the index column '{}'".format(index_name)
+        )
+    if query.order_by and not (
+        len(query.order_by) == 1
+        and query.order_by[0].column == index_name
+        and not query.order_by[0].descending
+    ):
+        raise ValueError(
+            "Followed queries can only be ordered by the index column '{}' "
+            "in ascending order".format(index_name)
+        )
@@ -0,0 +1,218 @@
+"""Reading table data in parallel by splitting the index column's range into partitions."""
+
+import datetime
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from . import models
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+_MILLISECOND = datetime.timedelta(milliseconds=1)
+
+QueryPage = Callable[[models.QueryTableDataRequest], models.PagedTableRows]
+
+
+class _Done:
+    """Marks the end of a partition's pages."""
+
+
+def find_index_column(metadata: models.TableMetadata) -> models.Column:
+    """Get the definition of a table's INDEX column."""
+    for column in metadata.columns:
+        if column.column_type == models.ColumnType.Index:
+            return column
+    raise ValueError("Table '{}' does not have an INDEX column".format(metadata.id))
+
+
+def iter_partitioned(
+    query_page: QueryPage,
+    index: models.Column,
+    query: models.QueryTableDataRequest,
+    partitions: int,
+    max_workers: int,
+) -> Iterator[models.TableRows]:
+    """Read the rows matching a query, split into ranges of the index column that are
+    read concurrently, and yield the pages of each range in index order.
+    """
+    descending = _validate_order(query, index.name)
+    bounds = _find_bounds(query_page, index.name, query)
+    if bounds is None:
+        return
+
+    ranges = _split_range(bounds[0], bounds[1], partitions)
+    if descending:
+        ranges.reverse()
+    queries = [
+        query.copy(
+            update={
+                "filters": list(query.filters or [])
+                + _range_filters(index, start, stop),
+                "order_by": [
+                    models.ColumnOrderBy(column=index.name, descending=descending)
+                ],
+                "continuation_token": None,
+            }
+        )
+        for start, stop in ranges
+    ]
+    yield from _read_concurrently(query_page, queries, max_workers)
+
+
+def _validate_order(query: models.QueryTableDataRequest, index_name: str) -> bool:
+    """Check that a query orders by nothing but the index column.
+
+    Returns:
+        Whether the index column is sorted in descending order.
+    """
+    if not query.order_by:
+        return False
+    if len(query.order_by) == 1 and query.order_by[0].column == index_name:
+        return bool(query.order_by[0].descending)
+    raise ValueError(
+        "Partitioned reads can only be ordered by the index column '{}'".format(
+            index_name
+        )
+    )
+
+
+def _find_bounds(
+    query_page: QueryPage,
+    index_name: str,
+    query: models.QueryTableDataRequest,
+) -> Optional[Tuple[int, int]]:
+    """Find the smallest and largest index values of the rows matching a query.
+
+    Returns:
+        The bounds as integers, or None if no rows match.
+    """
+    bounds = find_range(query_page, index_name, query.filters)
+    if bounds is None:
+        return None
+    return to_int(bounds[0]), to_int(bounds[1])
+
+
+def find_range(
+    query_page: QueryPage,
+    column_name: str,
+    filters: Optional[List[models.ColumnFilter]],
+) -> Optional[Tuple[str, str]]:
+    """Find the smallest and largest values of a column in the rows matching a set
+    of filters, using one single-row query for each.
+
+    Returns:
+        The bounds as they are encoded in a data frame, or None if no rows match.
+    """
+    values = []  # type: List[Optional[str]]
+    for descending in (False, True):
+        page = query_page(
+            models.QueryTableDataRequest(
+                columns=[column_name],
+                filters=filters,
+                order_by=[
+                    models.ColumnOrderBy(column=column_name, descending=descending)
+                ],
+                take=1,
+            )
+        )
+        if not page.frame.data:
+            return None
+        values.append(page.frame.data[0][0])
+
+    minimum, maximum = values
+    if minimum is None or maximum is None:
+        raise ValueError("Column '{}' contains null values".format(column_name))
+    return minimum, maximum
+
+
+def _split_range(first: int, last: int, partitions: int) -> List[Tuple[int, int]]:
+    """Split the inclusive range [first, last] into at most ``partitions`` half-open
+    ranges of nearly equal width.
+    """
+    stop = last + 1
+    width = stop - first
+    edges = [first + width * i // partitions for i in range(partitions)] + [stop]
+    return [(start, end) for start, end in zip(edges, edges[1:]) if start < end]
+
+
+def _range_filters(
+    index: models.Column, start: int, stop: int
+) -> List[models.ColumnFilter]:
+    to_str = str  # type: Callable[[int], str]
+    if index.data_type == models.DataType.Timestamp:
+        to_str = timestamp_from_int
+    return [
+        models.ColumnFilter(
+            column=index.name,
+            operation=models.FilterOperation.GreaterThanEquals,
+            value=to_str(start),
+        ),
+        models.ColumnFilter(
+            column=index.name,
+            operation=models.FilterOperation.LessThan,
+            value=to_str(stop),
+        ),
+    ]
+
+
+def to_int(value: str) -> int:
+    """Convert an INT32, INT64, or TIMESTAMP index value to an integer, where
+    timestamps are converted to milliseconds since the Unix epoch.
+    """
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    timestamp = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=datetime.timezone.utc)
+    return (timestamp - _EPOCH) // _MILLISECOND
+
+
+def timestamp_from_int(milliseconds: int) -> str:
+    """Convert milliseconds since the Unix epoch to a TIMESTAMP value."""
+    timestamp = _EPOCH + milliseconds * _MILLISECOND
+    return timestamp.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def _read_concurrently(
+    query_page: QueryPage,
+    queries: List[models.QueryTableDataRequest],
+    max_workers: int,
+) -> Iterator[models.TableRows]:
+    """Page through each query on a worker thread and yield the pages of each query
+    in turn, as soon as they are available.
+    """
+    stopped = threading.Event()
+    pages = [queue.Queue() for _ in queries]  # type: List[queue.Queue]
+
+    def read(query: models.QueryTableDataRequest, results: queue.Queue) -> None:
+        try:
+            while not stopped.is_set():
+                page = query_page(query)
+                results.put(models.TableRows(frame=page.frame))
+                if page.continuation_token is None:
+                    break
+                query = query.copy(
+                    update={"continuation_token": page.continuation_token}
+                )
+            results.put(_Done())
+        except BaseException as ex:
+            results.put(ex)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            for query, results in zip(queries, pages):
+                executor.submit(read, query, results)
+            for results in pages:
+                while True:
+                    item = results.get()
+                    if isinstance(item, _Done):
+                        break
+                    if isinstance(item, BaseException):
+                        raise item
+                    yield item
+        finally:
+            # Stop requesting pages if the caller stopped iterating early.
+            stopped.set()
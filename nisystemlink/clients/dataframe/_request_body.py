@@ -0,0 +1,42 @@
+"""Encoding of append requests, streamed in pieces when the frame is large."""
+
+import json
+from typing import Iterator
+
+from nisystemlink.clients.core._uplink._json_body import JsonBody
+
+from . import models
+
+_STREAM_ROWS = 10000
+"""Frames with more rows than this are sent in pieces instead of all at once."""
+
+_CHUNK_ROWS = 1000
+"""The number of rows encoded into each piece of a streamed request."""
+
+
+def encode_append_request(data: models.AppendTableDataRequest) -> JsonBody:
+    """Encode a request to append rows, producing the same JSON as the request model.
+
+    Large frames are encoded a few rows at a time as the request is sent, so that the
+    encoded rows are never all held in memory at once.
+    """
+    if data.frame is None or len(data.frame.data) <= _STREAM_ROWS:
+        return JsonBody(data.json(by_alias=True, exclude_unset=True).encode())
+    return JsonBody(_iter_append_request(data, data.frame))
+
+
+def _iter_append_request(
+    data: models.AppendTableDataRequest, frame: models.DataFrame
+) -> Iterator[bytes]:
+    # Encode everything except the rows with pydantic, then splice the rows in.
+    options = data.json(by_alias=True, exclude_unset=True, exclude={"frame"})
+    frame_options = frame.json(by_alias=True, exclude_unset=True, exclude={"data"})
+
+    yield '{{"frame": {}{}"data": ['.format(
+        frame_options[:-1], ", " if frame_options != "{}" else ""
+    ).encode()
+    rows = frame.data
+    for start in range(0, len(rows), _CHUNK_ROWS):
+        chunk = json.dumps(rows[start : start + _CHUNK_ROWS])[1:-1]
+        yield (", " + chunk if start else chunk).encode()
+    yield "]}}{}".format(", " + options[1:] if options != "{}" else "}").encode()
@@ -0,0 +1,115 @@
+"""Implementation of TableMetadataCache."""
+
+import datetime
+import threading
+import time
+from collections import OrderedDict
+from typing import Iterable, Optional, Tuple
+
+from . import models
+
+_Entry = Tuple[float, models.TableMetadata]
+"""The time an entry expires, as given by time.monotonic(), and the metadata."""
+
+
+class TableMetadataCache:
+    """A thread-safe cache of table metadata, keyed by table ID.
+
+    Entries expire ``time_to_live`` after they are added, and the least recently
+    used entry is evicted when the cache is full. Pass an instance to
+    :class:`DataFrameClient <nisystemlink.clients.dataframe.DataFrameClient>` to
+    have the client fill it with the metadata it receives and remove tables that
+    it modifies or deletes.
+
+    Appending rows does not invalidate a table's metadata, so the row count and
+    modification times of cached metadata may be out of date by up to
+    ``time_to_live``. Column definitions only change when a table is modified.
+    """
+
+    def __init__(
+        self,
+        time_to_live: datetime.timedelta = datetime.timedelta(minutes=5),
+        max_size: int = 1000,
+    ) -> None:
+        """Initialize an instance.
+
+        Args:
+            time_to_live: How long metadata is kept after it is added to the cache.
+            max_size: The maximum number of tables to keep metadata for.
+
+        Raises:
+            ValueError: if ``time_to_live`` is not positive or ``max_size`` is less
+                than one.
+        """
+        if time_to_live.total_seconds() <= 0:
+            raise ValueError("time_to_live must be positive")
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self._time_to_live = time_to_live.total_seconds()
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # type: OrderedDict[str, _Entry]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, id: str) -> Optional[models.TableMetadata]:
+        """Get the cached metadata of a table.
+
+        Args:
+            id: Unique ID of a data table.
+
+        Returns:
+            A copy of the cached metadata, or None if the table isn't cached or its
+            metadata has expired.
+        """
+        with self._lock:
+            entry = self._entries.get(id)
+            if entry is None:
+                return None
+            expires_at, metadata = entry
+            if expires_at <= time.monotonic():
+                del self._entries[id]
+                return None
+            self._entries.move_to_end(id)
+        return metadata.copy(deep=True)
+
+    def put(self, metadata: models.TableMetadata) -> None:
+        """Add or replace the cached metadata of a table.
+
+        Args:
+            metadata: The metadata to cache. A copy is stored.
+        """
+        self.put_many([metadata])
+
+    def put_many(self, tables: Iterable[models.TableMetadata]) -> None:
+        """Add or replace the cached metadata of several tables.
+
+        Args:
+            tables: The metadata to cache. Copies are stored.
+        """
+        copies = [metadata.copy(deep=True) for metadata in tables]
+        expires_at = time.monotonic() + self._time_to_live
+        with self._lock:
+            for metadata in copies:
+                self._entries[metadata.id] = (expires_at, metadata)
+                self._entries.move_to_end(metadata.id)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, ids: Iterable[str]) -> None:
+        """Remove tables from the cache.
+
+        Args:
+            ids: Unique IDs of data tables. IDs that aren't cached are ignored.
+        """
+        with self._lock:
+            for id in ids:
+                self._entries.pop(id, None)
+
+    def clear(self) -> None:
+        """Remove all tables from the cache."""
+        with self._lock:
+            self._entries.clear()
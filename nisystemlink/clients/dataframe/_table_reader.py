@@ -0,0 +1,116 @@
+"""Reading the data of many tables in parallel."""
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, Optional, Union
+
+from . import models
+
+
+class TableReadResult:
+    """The outcome of reading the data of one table with
+    :meth:`DataFrameClient.read_tables
+    <nisystemlink.clients.dataframe.DataFrameClient.read_tables>`.
+    """
+
+    def __init__(
+        self,
+        metadata: models.TableMetadata,
+        frame: Optional[models.DataFrame] = None,
+        error: Optional[Exception] = None,
+    ) -> None:
+        """Initialize an instance.
+
+        Args:
+            metadata: The metadata of the table that was read.
+            frame: Every row that was read from the table, or None if reading failed.
+            error: The error that prevented reading the table, or None if it was read.
+        """
+        self.metadata = metadata
+        self.frame = frame
+        self.error = error
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the table's data was read."""
+        return self.error is None
+
+    def __repr__(self) -> str:
+        return "TableReadResult(id={!r}, rows={!r}, error={!r})".format(
+            self.metadata.id,
+            None if self.frame is None else len(self.frame.data),
+            self.error,
+        )
+
+
+class _Done:
+    """Marks the end of the tables to read and how many there were."""
+
+    def __init__(self, count: int) -> None:
+        self.count = count
+
+
+_Item = Union[TableReadResult, _Done, BaseException]
+
+
+def read_tables(
+    tables: Iterable[models.TableMetadata],
+    read_table: Callable[[models.TableMetadata], models.DataFrame],
+    max_workers: int,
+) -> Iterator[TableReadResult]:
+    """Read each table on a pool of worker threads as soon as it is discovered, and
+    yield the results in the order the reads complete.
+
+    ``tables`` is consumed on its own thread, so that discovering further tables
+    overlaps with reading the ones found so far. At most ``2 * max_workers`` tables
+    are read ahead of the caller. An error raised by ``tables`` is re-raised, while
+    an error reading a table is returned as part of that table's result.
+    """
+    results = queue.Queue()  # type: queue.Queue[_Item]
+    slots = threading.Semaphore(2 * max_workers)
+    stopped = threading.Event()
+
+    def read(metadata: models.TableMetadata) -> None:
+        if stopped.is_set():
+            return
+        try:
+            results.put(TableReadResult(metadata, frame=read_table(metadata)))
+        except Exception as ex:
+            results.put(TableReadResult(metadata, error=ex))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+        def discover() -> None:
+            count = 0
+            try:
+                for metadata in tables:
+                    slots.acquire()
+                    if stopped.is_set():
+                        return
+                    executor.submit(read, metadata)
+                    count += 1
+                results.put(_Done(count))
+            except BaseException as ex:
+                results.put(ex)
+
+        thread = threading.Thread(target=discover, name="TableDiscovery", daemon=True)
+        thread.start()
+        try:
+            yielded = 0
+            expected = None  # type: Optional[int]
+            while expected is None or yielded < expected:
+                item = results.get()
+                if isinstance(item, _Done):
+                    expected = item.count
+                elif isinstance(item, BaseException):
+                    raise item
+                else:
+                    slots.release()
+                    yielded += 1
+                    yield item
+        finally:
+            # Stop discovering and reading tables if the caller stopped early.
+            stopped.set()
+            slots.release()
+            thread.join()
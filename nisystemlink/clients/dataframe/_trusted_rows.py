@@ -0,0 +1,49 @@
+"""Decoding of row data responses without validating each cell."""
+
+import json
+from typing import Any, Dict, Type, TypeVar
+
+from nisystemlink.clients.core._uplink._json_model import JsonModel
+
+from . import models
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+Rows = TypeVar("Rows", models.TableRows, models.PagedTableRows)
+
+
+def loads(content: bytes) -> Any:
+    """Decode a JSON document, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def parse_rows(cls: Type[Rows], data: Dict[str, Any], trusted: bool) -> Rows:
+    """Create a :class:`.TableRows` or :class:`.PagedTableRows` from decoded JSON.
+
+    When ``trusted`` is set, the models are created with ``construct()`` and the
+    cells of the data frame are used as they are, without validation. Otherwise the
+    response is validated as usual.
+    """
+    if not trusted:
+        return cls.parse_obj(data)
+    values = _field_values(cls, data)
+    values["frame"] = models.DataFrame.construct(
+        **_field_values(models.DataFrame, data["frame"])
+    )
+    return cls.construct(**values)
+
+
+def _field_values(cls: Type[JsonModel], data: Dict[str, Any]) -> Dict[str, Any]:
+    """Key the values of a JSON object by field name instead of alias, dropping
+    unknown keys.
+    """
+    return {
+        name: data[field.alias]
+        for name, field in cls.__fields__.items()
+        if field.alias in data
+    }
@@ -0,0 +1,20 @@
+"""Typed, column-oriented NumPy representations of table data.
+
+This package requires NumPy, which can be installed with the ``numpy`` extra:
+``pip install nisystemlink-clients[numpy]``. Writing Parquet and Arrow IPC files
+also requires PyArrow, which can be installed with the ``arrow`` extra.
+"""
+
+from ._arrow import arrow_schema, to_record_batch, write_arrow_ipc, write_parquet
+from ._column_array import ColumnArray, numpy_dtype
+from ._csv import iter_csv_batches
+from ._decimate import decimate
+from ._decode import decode_column, decode_frame
+from ._encode import encode_column, encode_frame
+from ._memmap import MemmapTable, spill_to_memmap
+from ._parallel_csv import iter_csv_batches_parallel
+from ._query import evaluate_filters, query_columns, sort_order
+from ._statistics import ColumnStatistics, TableStatistics
+from ._timestamps import format_timestamps, parse_timestamps
+
+# flake8: noqa
@@ -0,0 +1,150 @@
+"""Writing typed columns to Apache Parquet and Arrow IPC files.
+
+These functions require PyArrow, which can be installed with the ``arrow`` extra:
+``pip install nisystemlink-clients[arrow]``.
+"""
+
+import os
+from typing import Any, Iterable, Mapping, Sequence
+
+from ._column_array import ColumnArray
+from ._memmap import PathLike
+from ..models import Column, ColumnType, DataType
+
+
+def arrow_schema(columns: Sequence[Column]) -> Any:
+    """Get the Arrow schema of a table's columns.
+
+    Each data type is mapped to the Arrow type of the same width. ``TIMESTAMP``
+    columns become timestamps with millisecond precision in UTC. Only ``NULLABLE``
+    columns are nullable.
+
+    Args:
+        columns: The definitions of the columns, in the order of the schema's fields.
+
+    Returns:
+        A :class:`pyarrow.Schema`.
+    """
+    import pyarrow
+
+    types = {
+        DataType.Bool: pyarrow.bool_(),
+        DataType.Float32: pyarrow.float32(),
+        DataType.Float64: pyarrow.float64(),
+        DataType.Int32: pyarrow.int32(),
+        DataType.Int64: pyarrow.int64(),
+        DataType.String: pyarrow.string(),
+        DataType.Timestamp: pyarrow.timestamp("ms", tz="UTC"),
+    }
+    return pyarrow.schema(
+        [
+            pyarrow.field(
+                column.name,
+                types[column.data_type],
+                nullable=column.column_type == ColumnType.Nullable,
+            )
+            for column in columns
+        ]
+    )
+
+
+def to_record_batch(batch: Mapping[str, ColumnArray], schema: Any) -> Any:
+    """Convert a batch of typed columns to an Arrow record batch.
+
+    Args:
+        batch: A dictionary mapping each column name to its values, such as a batch
+            returned by
+            :func:`~nisystemlink.clients.dataframe.columnar.iter_csv_batches`.
+        schema: The :class:`pyarrow.Schema` of the record batch, such as one
+            returned by :func:`arrow_schema`.
+
+    Returns:
+        A :class:`pyarrow.RecordBatch` with the columns of ``schema``.
+
+    Raises:
+        ValueError: if a column of ``schema`` is not in ``batch``.
+    """
+    import pyarrow
+
+    arrays = []
+    for field in schema:
+        column = batch.get(field.name)
+        if column is None:
+            raise ValueError("Column '{}' is not in the batch".format(field.name))
+        mask = None if column.valid is None else ~column.valid
+        arrays.append(pyarrow.array(column.values, type=field.type, mask=mask))
+    return pyarrow.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def write_parquet(
+    batches: Iterable[Mapping[str, ColumnArray]],
+    columns: Sequence[Column],
+    path: PathLike,
+    compression: str = "snappy",
+) -> int:
+    """Write batches of typed columns to a Parquet file, one row group per batch.
+
+    Each batch is written as it is received, so memory use is bounded by the size
+    of a batch.
+
+    Args:
+        batches: The batches of rows to write.
+        columns: The definitions of the columns to write, in order.
+        path: The file to write. An existing file is overwritten.
+        compression: The compression codec, such as ``"snappy"``, ``"zstd"``, or
+            ``"none"``.
+
+    Returns:
+        The number of rows written.
+
+    Raises:
+        ValueError: if a column is not in a batch.
+    """
+    import pyarrow.parquet
+
+    schema = arrow_schema(columns)
+    rows = 0
+    with pyarrow.parquet.ParquetWriter(
+        os.fspath(path), schema, compression=compression
+    ) as writer:
+        for batch in batches:
+            record_batch = to_record_batch(batch, schema)
+            if record_batch.num_rows:
+                writer.write_batch(record_batch, row_group_size=record_batch.num_rows)
+                rows += record_batch.num_rows
+    return rows
+
+
+def write_arrow_ipc(
+    batches: Iterable[Mapping[str, ColumnArray]],
+    columns: Sequence[Column],
+    path: PathLike,
+) -> int:
+    """Write batches of typed columns to an Arrow IPC file, one record batch per
+    batch.
+
+    Each batch is written as it is received, so memory use is bounded by the size
+    of a batch. The file can be memory-mapped with :func:`pyarrow.ipc.open_file`.
+
+    Args:
+        batches: The batches of rows to write.
+        columns: The definitions of the columns to write, in order.
+        path: The file to write. An existing file is overwritten.
+
+    Returns:
+        The number of rows written.
+
+    Raises:
+        ValueError: if a column is not in a batch.
+    """
+    import pyarrow
+
+    schema = arrow_schema(columns)
+    rows = 0
+    with pyarrow.ipc.new_file(os.fspath(path), schema) as writer:
+        for batch in batches:
+            record_batch = to_record_batch(batch, schema)
+            if record_batch.num_rows:
+                writer.write_batch(record_batch)
+                rows += record_batch.num_rows
+    return rows
@@ -0,0 +1,138 @@
+"""Implementation of ColumnArray."""
+
+from typing import Any, Optional, Sequence
+
+import numpy as np
+
+from ..models import DataType
+
+_DTYPES = {
+    DataType.Bool: np.dtype(np.bool_),
+    DataType.Float32: np.dtype(np.float32),
+    DataType.Float64: np.dtype(np.float64),
+    DataType.Int32: np.dtype(np.int32),
+    DataType.Int64: np.dtype(np.int64),
+    DataType.String: np.dtype(object),
+    DataType.Timestamp: np.dtype("datetime64[ms]"),
+}
+
+
+def numpy_dtype(data_type: DataType) -> np.dtype:
+    """Get the NumPy dtype used to hold values of a column's data type.
+
+    Args:
+        data_type: The data type of the column.
+
+    Returns:
+        The NumPy dtype. ``STRING`` columns are held as Python objects and
+        ``TIMESTAMP`` columns as ``datetime64[ms]`` in UTC.
+    """
+    return _DTYPES[data_type]
+
+
+class ColumnArray:
+    """The values of a single table column, held in a typed NumPy array.
+
+    Null entries of the column are tracked by :attr:`valid`. The value stored in
+    :attr:`values` for a null entry is 0 for integer columns, ``False`` for
+    ``BOOL`` columns, ``NaN`` for floating-point columns, ``NaT`` for
+    ``TIMESTAMP`` columns, and ``None`` for ``STRING`` columns.
+    """
+
+    def __init__(
+        self,
+        data_type: DataType,
+        values: np.ndarray,
+        valid: Optional[np.ndarray] = None,
+    ) -> None:
+        """Initialize an instance.
+
+        Args:
+            data_type: The data type of the column.
+            values: The values of the column, using the dtype given by
+                :func:`numpy_dtype` for ``data_type``.
+            valid: A boolean array that is False for each null entry, or None if
+                the column cannot contain nulls.
+
+        Raises:
+            ValueError: if ``valid`` is not the same length as ``values``.
+        """
+        if valid is not None and len(valid) != len(values):
+            raise ValueError("valid must be the same length as values")
+
+        self.data_type = data_type
+        self.values = values
+        self.valid = valid
+
+    @property
+    def null_count(self) -> int:
+        """The number of null entries in the column."""
+        if self.valid is None:
+            return 0
+        return len(self.valid) - int(np.count_nonzero(self.valid))
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, key: Any) -> "ColumnArray":
+        """Select entries by slice, integer indices, or boolean mask.
+
+        Args:
+            key: Any index that selects a one-dimensional subset of a NumPy array.
+
+        Returns:
+            A column containing the selected entries.
+        """
+        return ColumnArray(
+            self.data_type,
+            self.values[key],
+            None if self.valid is None else self.valid[key],
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ColumnArray):
+            return NotImplemented
+        if self.data_type != other.data_type or len(self) != len(other):
+            return False
+        mine = self.valid if self.valid is not None else np.ones(len(self), bool)
+        theirs = other.valid if other.valid is not None else np.ones(len(other), bool)
+        if not np.array_equal(mine, theirs):
+            return False
+        values = self.values[mine]
+        other_values = other.values[theirs]
+        if values.dtype.kind == "f":
+            return bool(np.array_equal(values, other_values, equal_nan=True))
+        return bool(np.array_equal(values, other_values))
+
+    def __repr__(self) -> str:
+        return "ColumnArray(data_type={!r}, values={!r}, valid={!r})".format(
+            self.data_type, self.values, self.valid
+        )
+
+    @classmethod
+    def concatenate(
+        cls, data_type: DataType, columns: Sequence["ColumnArray"]
+    ) -> "ColumnArray":
+        """Join several pieces of the same column end to end.
+
+        Args:
+            data_type: The data type of the column.
+            columns: The pieces to join, in order.
+
+        Returns:
+            A column containing the entries of every piece. The result tracks
+            nulls if any piece does.
+        """
+        if not columns:
+            return cls(data_type, np.empty(0, numpy_dtype(data_type)))
+
+        values = np.concatenate([column.values for column in columns])
+        if all(column.valid is None for column in columns):
+            return cls(data_type, values)
+        valid = np.concatenate(
+            [
+                np.ones(len(column), bool) if column.valid is None else column.valid
+                for column in columns
+            ]
+        )
+        return cls(data_type, values, valid)
@@ -0,0 +1,135 @@
+"""Incremental parsing of exported CSV data into typed columns."""
+
+import codecs
+import csv
+import io
+from typing import Any, Dict, Iterator, List, Sequence
+
+import numpy as np
+
+from ._column_array import ColumnArray
+from ._decode import column_definitions, ColumnsLike, decode_column
+from ..models import Column, ColumnType, DataType
+
+_DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def iter_csv_batches(
+    stream: Any,
+    table_columns: ColumnsLike,
+    batch_rows: int,
+    chunk_size: int = _DEFAULT_CHUNK_SIZE,
+) -> Iterator[Dict[str, ColumnArray]]:
+    """Parse CSV table data from a binary stream in batches of typed columns.
+
+    The stream is read ``chunk_size`` bytes at a time and at most ``batch_rows``
+    rows are held in memory, so memory use does not depend on the size of the
+    data. The first row must be a header containing the column names.
+
+    In ``NULLABLE`` columns, an empty field is read as null, except in ``STRING``
+    columns, where CSV cannot distinguish an empty string from null and an empty
+    string is returned.
+
+    Args:
+        stream: A binary file-like object containing UTF-8 encoded CSV data, such
+            as the result of
+            :meth:`~nisystemlink.clients.dataframe.DataFrameClient.export_table_data`.
+        table_columns: The metadata of the table the data was exported from, or its
+            column definitions. Used to look up the data type of each column.
+        batch_rows: The maximum number of rows in each batch.
+        chunk_size: The number of bytes to read from the stream at a time.
+
+    Returns:
+        An iterator over batches of rows. Each batch maps each column name, in the
+        order of the header, to its values.
+
+    Raises:
+        ValueError: if ``batch_rows`` or ``chunk_size`` is less than one, the
+            header contains a column that isn't defined in ``table_columns``, a row
+            has a different number of values than the header, or a value cannot be
+            parsed as its column's data type.
+    """
+    if batch_rows < 1:
+        raise ValueError("batch_rows must be at least 1")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    return _iter_csv_batches(stream, table_columns, batch_rows, chunk_size)
+
+
+def _iter_csv_batches(
+    stream: Any, table_columns: ColumnsLike, batch_rows: int, chunk_size: int
+) -> Iterator[Dict[str, ColumnArray]]:
+    reader = csv.reader(_iter_lines(stream, chunk_size))
+    header = next(reader, None)
+    if header is None:
+        return
+
+    columns = _header_columns(header, table_columns)
+    rows = []  # type: List[List[str]]
+    for row in reader:
+        if not row:
+            continue
+        rows.append(row)
+        if len(rows) == batch_rows:
+            yield _decode_rows(rows, columns)
+            rows = []
+    if rows:
+        yield _decode_rows(rows, columns)
+
+
+def _header_columns(header: List[str], table_columns: ColumnsLike) -> List[Column]:
+    definitions = column_definitions(table_columns)
+    columns = []  # type: List[Column]
+    for name in header:
+        definition = definitions.get(name)
+        if definition is None:
+            raise ValueError("Column '{}' is not defined in the table".format(name))
+        columns.append(definition)
+    return columns
+
+
+def _iter_lines(stream: Any, chunk_size: int) -> Iterator[str]:
+    """Split a binary stream into complete lines for ``csv``."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    while True:
+        chunk = stream.read(chunk_size)
+        text = pending + decoder.decode(chunk, final=not chunk)
+        if not chunk:
+            if text:
+                yield text
+            return
+
+        end = text.rfind("\n") + 1
+        pending = text[end:]
+        if end:
+            # StringIO only splits on "\n" when newline="\n", unlike
+            # str.splitlines, which also splits on characters that may appear
+            # inside a quoted field.
+            yield from io.StringIO(text[:end], newline="\n")
+
+
+def _decode_rows(
+    rows: List[List[str]], columns: Sequence[Column]
+) -> Dict[str, ColumnArray]:
+    for row in rows:
+        if len(row) != len(columns):
+            raise ValueError(
+                "Row has {} values but the header has {} columns".format(
+                    len(row), len(columns)
+                )
+            )
+    result = {}
+    for definition, cells in zip(columns, zip(*rows)):
+        result[definition.name] = _decode_csv_column(cells, definition)
+    return result
+
+
+def _decode_csv_column(cells: Sequence[str], definition: Column) -> ColumnArray:
+    nullable = definition.column_type == ColumnType.Nullable
+    if not nullable or definition.data_type == DataType.String:
+        return decode_column(cells, definition.data_type, nullable, definition.name)
+
+    encoded = np.array(cells, dtype=object)
+    encoded[encoded == ""] = None
+    return decode_column(encoded, definition.data_type, nullable, definition.name)
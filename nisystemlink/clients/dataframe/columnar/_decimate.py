@@ -0,0 +1,155 @@
+"""Client-side decimation of typed columns."""
+
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
+
+import numpy as np
+
+from ._column_array import ColumnArray
+from ..models import DecimationMethod
+
+
+def decimate(
+    arrays: Mapping[str, Any],
+    x_column: str,
+    y_columns: Sequence[str] = (),
+    intervals: int = 1000,
+    method: DecimationMethod = DecimationMethod.Lossy,
+) -> Dict[str, Any]:
+    """Decimate rows that have already been read, using the same methods as
+    :meth:`DataFrameClient.query_decimated_data
+    <nisystemlink.clients.dataframe.DataFrameClient.query_decimated_data>`.
+
+    Rows are ordered by ``x_column``, keeping rows with equal x values in their
+    original order, and rows whose x value is null or ``NaN`` are dropped.
+
+    * ``LOSSY`` keeps ``intervals`` rows evenly spaced through the ordered rows,
+      always including the first and last, or every row if there are no more than
+      ``intervals`` of them.
+    * ``MAX_MIN`` divides the range of x values into ``intervals`` intervals of
+      equal width and keeps, for each interval and each of ``y_columns``, the first
+      row holding the smallest and the first row holding the largest value. Null and
+      ``NaN`` y values are ignored.
+    * ``ENTRY_EXIT`` keeps the same rows as ``MAX_MIN`` plus the first and last row
+      of each interval.
+
+    A row selected for several reasons is returned once, and the rows that are kept
+    stay ordered by ``x_column``.
+
+    Args:
+        arrays: A mapping from column name to the values of that column, such as
+            the result of :func:`decode_frame`. Values may be a
+            :class:`ColumnArray` or anything NumPy can convert to an array.
+        x_column: The name of the numeric column to order and divide the rows by.
+        y_columns: The names of the numeric columns whose extremes are kept. Only
+            used by ``MAX_MIN`` and ``ENTRY_EXIT``.
+        intervals: The number of intervals, or of rows for ``LOSSY``.
+        method: The decimation method.
+
+    Returns:
+        A dictionary with the same keys as ``arrays``, mapping each column name to
+        the kept values of that column. :class:`ColumnArray` values remain
+        :class:`ColumnArray` objects; all others are returned as NumPy arrays.
+
+    Raises:
+        ValueError: if ``intervals`` is less than one, a column is missing or not
+            numeric, or the columns are not all the same length.
+    """
+    if intervals < 1:
+        raise ValueError("intervals must be at least 1")
+    columns = {
+        name: values if isinstance(values, ColumnArray) else np.asarray(values)
+        for name, values in arrays.items()
+    }  # type: Dict[str, Any]
+    if len({len(values) for values in columns.values()}) > 1:
+        raise ValueError("All columns must have the same number of values")
+
+    x, x_valid = _numeric(columns, x_column)
+    order = np.flatnonzero(x_valid)
+    order = order[np.argsort(x[order], kind="stable")]
+
+    if method == DecimationMethod.Lossy:
+        selected = order[_lossy(len(order), intervals)]
+    else:
+        starts = _interval_starts(x[order], intervals)
+        keep = [] if method == DecimationMethod.MaxMin else _entry_exit(starts, order)
+        for y_column in y_columns:
+            y, y_valid = _numeric(columns, y_column)
+            keep.extend(_extremes(y[order], y_valid[order], starts))
+        positions = np.unique(np.concatenate(keep)) if keep else np.empty(0, np.intp)
+        selected = order[positions]
+
+    return {name: values[selected] for name, values in columns.items()}
+
+
+def _numeric(columns: Mapping[str, Any], name: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Get a column as float64 or int64 values and a mask of its usable entries."""
+    if name not in columns:
+        raise ValueError("Column '{}' was not provided".format(name))
+    column = columns[name]
+    values = column.values if isinstance(column, ColumnArray) else column
+    if values.dtype.kind == "M":
+        valid = ~np.isnat(values)
+        values = values.astype("datetime64[ms]").view(np.int64)
+    elif values.dtype.kind == "f":
+        values = values.astype(np.float64, copy=False)
+        valid = ~np.isnan(values)
+    elif values.dtype.kind in "iu":
+        values = values.astype(np.int64, copy=False)
+        valid = np.ones(len(values), bool)
+    else:
+        raise ValueError("Column '{}' is not numeric".format(name))
+    if isinstance(column, ColumnArray) and column.valid is not None:
+        valid &= column.valid
+    return values, valid
+
+
+def _lossy(count: int, intervals: int) -> np.ndarray:
+    """Positions of ``intervals`` evenly spaced rows out of ``count``."""
+    if count <= intervals:
+        return np.arange(count)
+    if intervals == 1:
+        return np.zeros(1, np.intp)
+    return (np.arange(intervals) * (count - 1)) // (intervals - 1)
+
+
+def _interval_starts(x: np.ndarray, intervals: int) -> np.ndarray:
+    """Positions of the first row of each non-empty interval of sorted x values."""
+    if len(x) == 0:
+        return np.empty(0, np.intp)
+    first = float(x[0])
+    width = (float(x[-1]) - first) / intervals
+    if width == 0:
+        return np.zeros(1, np.intp)
+    numbers = np.minimum(((x - first) / width).astype(np.int64), intervals - 1)
+    return np.concatenate((np.zeros(1, np.intp), np.flatnonzero(np.diff(numbers)) + 1))
+
+
+def _entry_exit(starts: np.ndarray, order: np.ndarray) -> List[np.ndarray]:
+    if len(starts) == 0:
+        return []
+    ends = np.append(starts[1:], len(order)) - 1
+    return [starts, ends]
+
+
+def _extremes(y: np.ndarray, valid: np.ndarray, starts: np.ndarray) -> List[np.ndarray]:
+    """Positions of the first smallest and first largest valid y value of each
+    interval, skipping intervals without valid values.
+    """
+    if len(starts) == 0:
+        return []
+    if y.dtype.kind == "f":
+        low, high = -np.inf, np.inf
+    else:
+        low, high = np.iinfo(y.dtype).min, np.iinfo(y.dtype).max
+
+    positions = np.arange(len(y))
+    reductions = ((high, np.minimum), (low, np.maximum))  # type: Any
+    result = []  # type: List[np.ndarray]
+    for fill, reduce in reductions:
+        filled = np.where(valid, y, fill)
+        extreme = reduce.reduceat(filled, starts)
+        lengths = np.diff(np.append(starts, len(y)))
+        matches = valid & (filled == np.repeat(extreme, lengths))
+        first = np.minimum.reduceat(np.where(matches, positions, len(y)), starts)
+        result.append(first[first < len(y)])
+    return result
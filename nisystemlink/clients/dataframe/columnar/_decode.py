@@ -0,0 +1,202 @@
+"""Conversion of string-encoded table data into typed columns."""
+
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ._column_array import ColumnArray, numpy_dtype
+from ._timestamps import parse_timestamps
+from ..models import (
+    Column,
+    ColumnType,
+    DataFrame,
+    DataType,
+    PagedTableRows,
+    TableMetadata,
+    TableRows,
+)
+
+FrameLike = Union[DataFrame, PagedTableRows, TableRows, Mapping[str, Any]]
+"""A data frame, a query result containing one, or the decoded JSON of either."""
+
+ColumnsLike = Union[TableMetadata, Sequence[Column]]
+"""A table's metadata or its column definitions."""
+
+# The string substituted for nulls before parsing, chosen so that parsing succeeds.
+_NULL_PLACEHOLDERS = {
+    DataType.Bool: "false",
+    DataType.Float32: "NaN",
+    DataType.Float64: "NaN",
+    DataType.Int32: "0",
+    DataType.Int64: "0",
+    DataType.Timestamp: "NaT",
+}
+
+
+def decode_frame(frame: FrameLike, columns: ColumnsLike) -> Dict[str, ColumnArray]:
+    """Convert the rows of a data frame into one typed NumPy array per column.
+
+    Each column is converted as a whole rather than cell by cell. Values are
+    interpreted according to the encoding described by :class:`.DataFrame`.
+
+    Args:
+        frame: The rows to convert. May be a :class:`.DataFrame`, a
+            :class:`.PagedTableRows` or :class:`.TableRows` containing one, or the
+            decoded JSON of any of those.
+        columns: The metadata of the table the rows were read from, or its column
+            definitions. Used to look up the data type of each column.
+
+    Returns:
+        A dictionary mapping each column name to its values, in the order of the
+        frame's columns. ``NULLABLE`` columns always include a validity mask.
+
+    Raises:
+        ValueError: if the frame contains a column that isn't defined in
+            ``columns``, or a null value in a column that is not ``NULLABLE``.
+    """
+    names, rows = _unpack_frame(frame)
+    definitions = column_definitions(columns)
+    if names is None:
+        names = list(definitions)
+
+    if rows:
+        cells = list(zip(*rows))
+    else:
+        cells = [() for _ in names]
+
+    result = {}
+    for name, column_cells in zip(names, cells):
+        definition = definitions.get(name)
+        if definition is None:
+            raise ValueError("Column '{}' is not defined in the table".format(name))
+        result[name] = decode_column(
+            column_cells,
+            definition.data_type,
+            definition.column_type == ColumnType.Nullable,
+            name,
+        )
+    return result
+
+
+def decode_column(
+    cells: Union[Sequence[Optional[str]], np.ndarray],
+    data_type: DataType,
+    nullable: bool,
+    name: str = "",
+) -> ColumnArray:
+    """Convert the string-encoded values of a single column into a typed array.
+
+    Args:
+        cells: The encoded values of the column, with None for nulls. May be a
+            sequence of strings or a NumPy array of strings or objects.
+        data_type: The data type of the column.
+        nullable: Whether the column may contain nulls. If True, the result
+            always includes a validity mask.
+        name: The name of the column, used in error messages.
+
+    Returns:
+        The typed column.
+
+    Raises:
+        ValueError: if ``cells`` contains a null value and ``nullable`` is False,
+            or a value cannot be parsed as ``data_type``.
+    """
+    if data_type == DataType.String:
+        values = np.array(cells, dtype=object)
+        is_valid = not_null(values)
+        if not nullable and not is_valid.all():
+            _raise_unexpected_null(name)
+        return ColumnArray(data_type, values, is_valid if nullable else None)
+
+    if None not in cells:
+        values = _parse(cells, data_type, name)
+        return ColumnArray(
+            data_type, values, np.ones(len(values), bool) if nullable else None
+        )
+
+    if not nullable:
+        _raise_unexpected_null(name)
+    encoded = np.array(cells, dtype=object)
+    is_valid = not_null(encoded)
+    encoded[~is_valid] = _NULL_PLACEHOLDERS[data_type]
+    return ColumnArray(data_type, _parse(encoded, data_type, name), is_valid)
+
+
+def _parse(
+    cells: Union[Sequence[Optional[str]], np.ndarray], data_type: DataType, name: str
+) -> np.ndarray:
+    if data_type == DataType.Bool:
+        lowered = np.char.lower(np.array(cells, dtype=str))
+        values = lowered == "true"
+        recognized = values | (lowered == "false")
+        if not recognized.all():
+            _raise_invalid_value(
+                name, np.asarray(cells)[np.argmin(recognized)], data_type
+            )
+        return values
+    if data_type == DataType.Timestamp:
+        return parse_timestamps(np.asarray(cells))
+    # NumPy parses each string with the same rules as Python's int() and float(),
+    # which accept the "NaN", "Infinity", and "-Infinity" encodings. Integers are
+    # parsed as int64 because casting to int32 would wrap large values.
+    if data_type in (DataType.Int32, DataType.Int64):
+        dtype = np.dtype(np.int64)
+    else:
+        dtype = numpy_dtype(data_type)
+    try:
+        values = np.array(cells, dtype=dtype)
+    except (ValueError, OverflowError):
+        # Find the offending cell only once parsing has failed.
+        for cell in cells:
+            try:
+                np.array([cell], dtype=dtype)
+            except (ValueError, OverflowError) as error:
+                _raise_invalid_value(name, cell, data_type, error)
+        raise
+    if data_type == DataType.Int32:
+        bounds = np.iinfo(np.int32)
+        outside = (values < bounds.min) | (values > bounds.max)
+        if outside.any():
+            _raise_invalid_value(name, values[np.argmax(outside)], data_type)
+        values = values.astype(np.int32)
+    return values
+
+
+def not_null(values: np.ndarray) -> np.ndarray:
+    """Compare each element of an object array with None."""
+    return values != None  # noqa: E711
+
+
+def _raise_invalid_value(
+    name: str, value: Any, data_type: DataType, cause: Optional[Exception] = None
+) -> None:
+    raise ValueError(
+        "Column '{}' contains '{}', which is not a valid {} value".format(
+            name, value, data_type.value
+        )
+    ) from cause
+
+
+def _raise_unexpected_null(name: str) -> None:
+    raise ValueError(
+        "Column '{}' contains null values but is not NULLABLE".format(name)
+    )
+
+
+def _unpack_frame(
+    frame: FrameLike,
+) -> Tuple[Optional[List[str]], Sequence[Sequence[Optional[str]]]]:
+    """Get the column names and rows out of any of the supported frame types."""
+    if isinstance(frame, (PagedTableRows, TableRows)):
+        frame = frame.frame
+    if isinstance(frame, DataFrame):
+        return frame.columns, frame.data
+    raw = frame.get("frame", frame)  # type: Mapping[str, Any]
+    return raw.get("columns"), raw["data"]
+
+
+def column_definitions(columns: ColumnsLike) -> Dict[str, Column]:
+    """Get a table's column definitions keyed by column name."""
+    if isinstance(columns, TableMetadata):
+        columns = columns.columns
+    return {column.name: column for column in columns}
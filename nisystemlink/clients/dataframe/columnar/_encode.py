@@ -0,0 +1,214 @@
+"""Conversion of typed columns into the string encoding used for appending rows."""
+
+from typing import Any, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from ._column_array import ColumnArray
+from ._decode import column_definitions, ColumnsLike
+from ._timestamps import format_timestamps
+from ..models import DataFrame, DataType
+
+_INTEGER_BOUNDS = {
+    DataType.Int32: (-(2**31), 2**31 - 1),
+    DataType.Int64: (-(2**63), 2**63 - 1),
+}
+
+
+def encode_frame(columns: Mapping[str, Any], table_columns: ColumnsLike) -> DataFrame:
+    """Convert one array per column into a data frame that can be appended to a table.
+
+    Each column is encoded as a whole rather than cell by cell, using the
+    encodings described by :class:`.DataFrame`. The data frame is created without
+    validating each cell, so the result is ready to send without further
+    processing.
+
+    Args:
+        columns: A mapping from column name to the values of that column. Values
+            may be a :class:`ColumnArray`, a NumPy array, a NumPy masked array, or
+            anything NumPy can convert to an array, such as a list or a pandas
+            ``Series``. A pandas ``DataFrame`` may be passed as the mapping itself.
+            Masked entries, ``None``, ``NaT``, and pandas' ``NA`` are encoded as
+            nulls, as is ``NaN`` in a ``STRING`` column or in an array of objects.
+        table_columns: The metadata of the table being appended to, or its column
+            definitions. Used to look up the data type of each column.
+
+    Returns:
+        The encoded data frame, with its columns in the order of ``columns``.
+
+    Raises:
+        ValueError: if a column isn't defined in ``table_columns``, the columns
+            are not all the same length, an integer column has a value that isn't
+            an integer or is out of range, or a ``BOOL`` column has a string other
+            than ``"true"`` or ``"false"``.
+    """
+    definitions = column_definitions(table_columns)
+    names = []  # type: List[str]
+    encoded = []  # type: List[List[Optional[str]]]
+    for name, values in columns.items():
+        definition = definitions.get(name)
+        if definition is None:
+            raise ValueError("Column '{}' is not defined in the table".format(name))
+        names.append(name)
+        try:
+            encoded.append(encode_column(values, definition.data_type))
+        except ValueError as error:
+            raise ValueError("Column '{}': {}".format(name, error)) from error
+
+    if len({len(column) for column in encoded}) > 1:
+        raise ValueError("All columns must have the same number of values")
+
+    rows = [list(row) for row in zip(*encoded)]
+    return DataFrame.construct(columns=names, data=rows)
+
+
+def encode_column(values: Any, data_type: DataType) -> List[Optional[str]]:
+    """Convert the values of a single column into their string encodings.
+
+    ``FLOAT32`` and ``FLOAT64`` values are written with the fewest digits that
+    parse back to exactly the same binary value, ``TIMESTAMP`` values as ISO-8601
+    in UTC with millisecond precision, and ``BOOL`` values as ``"true"`` or
+    ``"false"``. ``STRING`` values of any other type are converted with
+    :class:`str`.
+
+    Args:
+        values: The values of the column. See :func:`encode_frame` for the
+            supported types.
+        data_type: The data type of the column.
+
+    Returns:
+        The encoded values, with None for nulls.
+
+    Raises:
+        ValueError: if a value of an ``INT32`` or ``INT64`` column is not an integer
+            or is out of the range of the column's data type, or a string in a
+            ``BOOL`` column is not ``"true"`` or ``"false"``.
+    """
+    array, valid = _unpack(values)
+
+    if data_type == DataType.String:
+        valid = valid & ~_missing(array)
+        encoded = array.astype(str)
+    elif data_type == DataType.Timestamp:
+        valid, array = _replace_nulls(array, valid, None)
+        timestamps = array.astype("datetime64[ms]")
+        valid = valid & ~np.isnat(timestamps)
+        encoded = format_timestamps(timestamps)
+    elif data_type == DataType.Bool:
+        valid, array = _replace_nulls(array, valid, False)
+        encoded = np.where(_booleans(array, valid), "true", "false")
+    elif data_type in (DataType.Float32, DataType.Float64):
+        valid, array = _replace_nulls(array, valid, np.nan)
+        dtype = np.float32 if data_type == DataType.Float32 else np.float64
+        floats = array.astype(dtype)
+        # NumPy writes the shortest string that round-trips to the same value,
+        # but spells the special values differently than the service.
+        encoded = floats.astype(str)
+        encoded[np.isnan(floats)] = "NaN"
+        encoded[np.isposinf(floats)] = "Infinity"
+        encoded[np.isneginf(floats)] = "-Infinity"
+    else:
+        valid, array = _replace_nulls(array, valid, 0)
+        encoded = _integers(array, valid, data_type).astype(str)
+
+    if valid.all():
+        return encoded.tolist()
+    encoded = encoded.astype(object)
+    encoded[~valid] = None
+    return encoded.tolist()
+
+
+def _integers(array: np.ndarray, valid: np.ndarray, data_type: DataType) -> np.ndarray:
+    """Convert the values of an integer column to int64, raising instead of
+    truncating or wrapping values that the column's data type cannot hold.
+    """
+    if array.dtype == object:
+        array = np.array(array.tolist())
+    if array.dtype.kind in "SU":
+        array = array.astype(np.int64)
+    if array.dtype.kind not in "biuf":
+        raise ValueError("{} values must be integers".format(data_type.value))
+
+    # Masked entries may hold any value.
+    array = np.where(valid, array, 0)
+    if array.dtype.kind == "f" and not np.all(np.trunc(array) == array):
+        raise ValueError("{} values must be integers".format(data_type.value))
+    minimum, maximum = _INTEGER_BOUNDS[data_type]
+    # Compared as Python numbers, which compare exactly across int and float.
+    if len(array) and (array.min().item() < minimum or array.max().item() > maximum):
+        raise ValueError(
+            "{} values must be between {} and {}".format(
+                data_type.value, minimum, maximum
+            )
+        )
+    return array.astype(np.int64)
+
+
+def _booleans(array: np.ndarray, valid: np.ndarray) -> np.ndarray:
+    """Convert the values of a boolean column to bool, accepting the strings
+    ``"true"`` and ``"false"`` in any case.
+    """
+    if array.dtype == object:
+        array = np.array(array.tolist())
+    if array.dtype.kind not in "SU":
+        return array.astype(bool)
+
+    lowered = np.char.lower(array.astype(str))
+    values = lowered == "true"
+    # Masked entries may hold any value.
+    recognized = values | (lowered == "false") | ~valid
+    if not recognized.all():
+        raise ValueError(
+            "'{}' is not a BOOL value".format(array[np.argmin(recognized)])
+        )
+    return values
+
+
+def _unpack(values: Any) -> Tuple[np.ndarray, np.ndarray]:
+    """Get the values and validity mask of any of the supported array types."""
+    if isinstance(values, ColumnArray):
+        valid = values.valid
+        values = values.values
+    elif isinstance(values, np.ma.MaskedArray):
+        # The mask may be the scalar "nomask" when no entries are masked.
+        valid = ~np.broadcast_to(values.mask, values.shape)
+        values = values.data
+    else:
+        valid = None
+        values = np.asarray(values)
+
+    if valid is None:
+        valid = np.ones(len(values), bool)
+    return values, valid
+
+
+def _replace_nulls(
+    array: np.ndarray, valid: np.ndarray, fill_value: Any
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Replace nulls in an object array so that it can be cast to a numeric type."""
+    if array.dtype != object:
+        return valid, array
+    present = ~_missing(array)
+    return valid & present, np.where(present, array, fill_value)
+
+
+def _missing(array: np.ndarray) -> np.ndarray:
+    """Find the nulls in an array: ``None``, ``NaN``, ``NaT``, and pandas' ``NA``."""
+    if array.dtype.kind == "f":
+        return np.isnan(array)
+    if array.dtype.kind in "mM":
+        return np.isnat(array)
+    if array.dtype != object:
+        return np.zeros(len(array), bool)
+    return np.fromiter((_is_missing(value) for value in array), bool, len(array))
+
+
+def _is_missing(value: Any) -> bool:
+    # pandas' NA can't be compared, and isn't imported so pandas stays optional.
+    if value is None or type(value).__name__ == "NAType":
+        return True
+    try:
+        # NaN and NaT are the only values that are not equal to themselves.
+        return bool(value != value)
+    except (TypeError, ValueError):
+        return False
@@ -0,0 +1,337 @@
+"""Table data spilled to memory-mapped files, for reading tables larger than memory."""
+
+import json
+import os
+import shutil
+import tempfile
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from ._column_array import ColumnArray, numpy_dtype
+from ._decode import column_definitions, ColumnsLike
+from ..models import Column, ColumnType, DataType
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+_MANIFEST = "table.json"
+
+
+class MemmapTable:
+    """The rows of a table held in memory-mapped files on disk.
+
+    Each column is stored in its own file, with a second file holding the validity
+    mask of ``NULLABLE`` columns, so that a column can be sliced without reading the
+    rest of the table into memory. ``STRING`` columns are stored as UTF-8 encoded
+    bytes and the offset of each value within them.
+
+    Tables are created by :func:`spill_to_memmap`, and can be opened again later with
+    :meth:`open`. A table created in a temporary directory deletes it when closed.
+    """
+
+    def __init__(
+        self,
+        directory: PathLike,
+        columns: List[Column],
+        row_count: int,
+        temporary: bool = False,
+    ) -> None:
+        """Initialize an instance.
+
+        Args:
+            directory: The directory containing the table's files.
+            columns: The definitions of the table's columns, in order.
+            row_count: The number of rows in the table.
+            temporary: Whether to delete ``directory`` when the table is closed.
+        """
+        self.directory = os.fspath(directory)
+        self.columns = columns
+        self.row_count = row_count
+        self._temporary = temporary
+        self._positions = {column.name: i for i, column in enumerate(columns)}
+
+    @classmethod
+    def open(cls, directory: PathLike) -> "MemmapTable":
+        """Open a table previously written by :func:`spill_to_memmap`.
+
+        Args:
+            directory: The directory the table was written to.
+
+        Returns:
+            The table. Its files are not deleted when it is closed.
+        """
+        with open(os.path.join(directory, _MANIFEST), "r", encoding="utf-8") as file:
+            manifest = json.load(file)
+        return cls(
+            directory,
+            [Column.parse_obj(column) for column in manifest["columns"]],
+            manifest["rowCount"],
+        )
+
+    def __len__(self) -> int:
+        return self.row_count
+
+    def __enter__(self) -> "MemmapTable":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Delete the table's files if they were written to a temporary directory.
+
+        Arrays returned by the table must not be used after it is closed.
+        """
+        if self._temporary:
+            shutil.rmtree(self.directory, ignore_errors=True)
+            self._temporary = False
+
+    def column(self, name: str) -> ColumnArray:
+        """Get the values of a column.
+
+        The values and validity mask of every column except ``STRING`` columns are
+        read-only :class:`numpy.memmap` arrays, so slicing them only reads the
+        selected rows from disk. Use :meth:`read` to get a range of ``STRING`` values.
+
+        Args:
+            name: The name of the column.
+
+        Returns:
+            The column's values.
+
+        Raises:
+            KeyError: if the table has no column named ``name``.
+        """
+        position = self._positions[name]
+        definition = self.columns[position]
+        if definition.data_type == DataType.String:
+            return self._read_strings(position, 0, self.row_count)
+        return ColumnArray(
+            definition.data_type,
+            self._map(position, "values", numpy_dtype(definition.data_type)),
+            self._valid(position),
+        )
+
+    def string_buffers(self, name: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the memory-mapped storage of a ``STRING`` column.
+
+        Args:
+            name: The name of the column.
+
+        Returns:
+            The UTF-8 encoded bytes of every value, end to end, and the offset of each
+            value within them. Value ``i`` is ``data[offsets[i]:offsets[i + 1]]``.
+            Nulls are stored as empty strings.
+
+        Raises:
+            KeyError: if the table has no column named ``name``.
+            ValueError: if the column is not a ``STRING`` column.
+        """
+        position = self._positions[name]
+        if self.columns[position].data_type != DataType.String:
+            raise ValueError("Column '{}' is not a STRING column".format(name))
+        return (
+            self._map(position, "values", np.dtype(np.uint8)),
+            self._map(position, "offsets", np.dtype(np.int64), self.row_count + 1),
+        )
+
+    def read(
+        self, start: int = 0, stop: Optional[int] = None
+    ) -> Dict[str, ColumnArray]:
+        """Copy a range of rows into memory.
+
+        Args:
+            start: The index of the first row to read.
+            stop: The index after the last row to read. Defaults to the end of the
+                table.
+
+        Returns:
+            A dictionary mapping each column name to its values in the range.
+        """
+        start, stop, _ = slice(start, stop).indices(self.row_count)
+        stop = max(start, stop)
+        result = {}
+        for position, definition in enumerate(self.columns):
+            if definition.data_type == DataType.String:
+                result[definition.name] = self._read_strings(position, start, stop)
+            else:
+                column = self.column(definition.name)
+                result[definition.name] = ColumnArray(
+                    definition.data_type,
+                    np.array(column.values[start:stop]),
+                    None
+                    if column.valid is None
+                    else np.array(column.valid[start:stop]),
+                )
+        return result
+
+    def _read_strings(self, position: int, start: int, stop: int) -> ColumnArray:
+        data, offsets = self.string_buffers(self.columns[position].name)
+        bounds = np.array(offsets[start : stop + 1]) - offsets[start]
+        content = data[offsets[start] : offsets[stop]].tobytes()
+        values = np.array(
+            [
+                content[begin:end].decode("utf-8")
+                for begin, end in zip(bounds[:-1].tolist(), bounds[1:].tolist())
+            ],
+            dtype=object,
+        )
+        valid = self._valid(position)
+        if valid is None:
+            return ColumnArray(DataType.String, values)
+        valid = np.array(valid[start:stop])
+        values[~valid] = None
+        return ColumnArray(DataType.String, values, valid)
+
+    def _valid(self, position: int) -> Optional[np.ndarray]:
+        if self.columns[position].column_type != ColumnType.Nullable:
+            return None
+        return self._map(position, "valid", np.dtype(np.bool_))
+
+    def _map(
+        self, position: int, kind: str, dtype: np.dtype, count: Optional[int] = None
+    ) -> np.ndarray:
+        path = _column_path(self.directory, position, kind)
+        if count is None:
+            count = os.path.getsize(path) // dtype.itemsize
+        if count == 0:
+            # Empty files cannot be memory-mapped.
+            return np.empty(0, dtype)
+        return np.memmap(path, dtype, mode="r", shape=(count,))
+
+
+def spill_to_memmap(
+    batches: Iterable[Dict[str, ColumnArray]],
+    table_columns: ColumnsLike,
+    directory: Optional[PathLike] = None,
+) -> MemmapTable:
+    """Write batches of typed columns to memory-mapped files as they are produced.
+
+    Only one batch is held in memory at a time, so tables much larger than memory
+    can be written and then sliced with :class:`MemmapTable`.
+
+    Args:
+        batches: The batches of rows to write, such as those produced by
+            :func:`iter_csv_batches`. Every batch must contain the same columns.
+        table_columns: The metadata of the table the rows were read from, or its
+            column definitions. Used to look up the data type of each column.
+        directory: The directory to write the files to, which is created if it
+            doesn't exist. Defaults to a new temporary directory, which is deleted
+            when the returned table is closed.
+
+    Returns:
+        The table containing every row of every batch.
+
+    Raises:
+        ValueError: if the batches don't all contain the same columns, or contain
+            a column that isn't defined in ``table_columns``.
+    """
+    definitions = column_definitions(table_columns)
+    temporary = directory is None
+    if directory is None:
+        directory = tempfile.mkdtemp(prefix="nisystemlink-table-")
+    else:
+        os.makedirs(directory, exist_ok=True)
+
+    writers = None  # type: Optional[List[_ColumnWriter]]
+    row_count = 0
+    try:
+        try:
+            for batch in batches:
+                if writers is None:
+                    writers = _open_writers(directory, definitions, list(batch))
+                if list(batch) != [writer.definition.name for writer in writers]:
+                    raise ValueError("Every batch must contain the same columns")
+                for writer in writers:
+                    writer.write(batch[writer.definition.name])
+                row_count += len(next(iter(batch.values()), []))
+            if writers is None:
+                writers = _open_writers(directory, definitions, list(definitions))
+        finally:
+            # The files must be closed before a temporary directory can be removed.
+            for writer in writers or []:
+                writer.close()
+
+        columns = [writer.definition for writer in writers]
+        manifest = os.path.join(directory, _MANIFEST)
+        with open(manifest, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "rowCount": row_count,
+                    "columns": [
+                        json.loads(column.json(by_alias=True, exclude_none=True))
+                        for column in columns
+                    ],
+                },
+                file,
+            )
+    except BaseException:
+        if temporary:
+            shutil.rmtree(directory, ignore_errors=True)
+        raise
+    return MemmapTable(directory, columns, row_count, temporary)
+
+
+class _ColumnWriter:
+    """Appends the pieces of one column to its files."""
+
+    def __init__(self, directory: PathLike, position: int, definition: Column) -> None:
+        self.definition = definition
+        self._dtype = numpy_dtype(definition.data_type)
+        self._files = {}  # type: Dict[str, BinaryIO]
+        kinds = ["values"]
+        if definition.data_type == DataType.String:
+            kinds.append("offsets")
+        if definition.column_type == ColumnType.Nullable:
+            kinds.append("valid")
+        for kind in kinds:
+            self._files[kind] = open(_column_path(directory, position, kind), "wb")
+        self._offset = 0
+        if definition.data_type == DataType.String:
+            self._files["offsets"].write(np.zeros(1, np.int64).tobytes())
+
+    def write(self, column: ColumnArray) -> None:
+        if "valid" in self._files:
+            valid = np.ones(len(column), bool) if column.valid is None else column.valid
+            self._files["valid"].write(np.ascontiguousarray(valid, bool).tobytes())
+
+        if self.definition.data_type != DataType.String:
+            values = np.ascontiguousarray(column.values, self._dtype)
+            self._files["values"].write(values.tobytes())
+            return
+
+        encoded = [
+            b"" if value is None else value.encode("utf-8") for value in column.values
+        ]
+        lengths = np.fromiter(map(len, encoded), np.int64, len(encoded))
+        offsets = self._offset + np.cumsum(lengths)
+        if len(offsets):
+            self._offset = int(offsets[-1])
+        self._files["values"].write(b"".join(encoded))
+        self._files["offsets"].write(offsets.tobytes())
+
+    def close(self) -> None:
+        for file in self._files.values():
+            file.close()
+
+
+def _open_writers(
+    directory: PathLike, definitions: Dict[str, Column], names: List[str]
+) -> List[_ColumnWriter]:
+    writers = []  # type: List[_ColumnWriter]
+    try:
+        for position, name in enumerate(names):
+            definition = definitions.get(name)
+            if definition is None:
+                raise ValueError("Column '{}' is not defined in the table".format(name))
+            writers.append(_ColumnWriter(directory, position, definition))
+    except BaseException:
+        for writer in writers:
+            writer.close()
+        raise
+    return writers
+
+
+def _column_path(directory: PathLike, position: int, kind: str) -> str:
+    # Columns are named by position, since column names may not be valid file names.
+    return os.path.join(directory, "{}.{}".format(position, kind))
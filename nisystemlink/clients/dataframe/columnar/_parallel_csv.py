@@ -0,0 +1,184 @@
+"""Parsing exported CSV data into typed columns on multiple processes."""
+
+import csv
+import io
+import os
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import Any, Deque, Dict, Iterator, List, Optional, Sequence
+
+from ._column_array import ColumnArray
+from ._csv import _decode_rows, _header_columns
+from ._decode import ColumnsLike
+from ..models import Column
+
+_DEFAULT_BLOCK_SIZE = 16 * 1024 * 1024
+_BOM = b"\xef\xbb\xbf"
+
+
+def iter_csv_batches_parallel(
+    stream: Any,
+    table_columns: ColumnsLike,
+    block_size: int = _DEFAULT_BLOCK_SIZE,
+    max_workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> Iterator[Dict[str, ColumnArray]]:
+    """Parse CSV table data from a binary stream in batches of typed columns, using
+    several processes to parse the batches in parallel.
+
+    The stream is split into blocks of about ``block_size`` bytes that end on a row
+    boundary, and each block is parsed into one batch by a pool of processes. The
+    batches are returned in the order of the stream. At most ``2 * max_workers``
+    blocks are read ahead of the batch being returned, so memory use does not
+    depend on the size of the data.
+
+    Parsing is the same as :func:`iter_csv_batches`, but each batch holds a block
+    of rows instead of a fixed number of rows.
+
+    Args:
+        stream: A binary file-like object containing UTF-8 encoded CSV data, such
+            as the result of
+            :meth:`~nisystemlink.clients.dataframe.DataFrameClient.export_table_data`.
+        table_columns: The metadata of the table the data was exported from, or its
+            column definitions. Used to look up the data type of each column.
+        block_size: The approximate number of bytes of CSV data in each batch. A
+            row longer than ``block_size`` is never split.
+        max_workers: The number of blocks to parse at a time. Defaults to the number
+            of processors on the machine.
+        executor: The executor that parses the blocks. Defaults to a new
+            :class:`~concurrent.futures.ProcessPoolExecutor` with ``max_workers``
+            processes, which is shut down when iteration ends.
+
+    Returns:
+        An iterator over batches of rows. Each batch maps each column name, in the
+        order of the header, to its values.
+
+    Raises:
+        ValueError: if ``block_size`` or ``max_workers`` is less than one, the
+            header contains a column that isn't defined in ``table_columns``, or a
+            value cannot be parsed as its column's data type.
+    """
+    if block_size < 1:
+        raise ValueError("block_size must be at least 1")
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    return _iter_csv_batches_parallel(
+        stream, table_columns, block_size, max_workers, executor
+    )
+
+
+def _iter_csv_batches_parallel(
+    stream: Any,
+    table_columns: ColumnsLike,
+    block_size: int,
+    max_workers: int,
+    executor: Optional[Executor],
+) -> Iterator[Dict[str, ColumnArray]]:
+    blocks = _iter_blocks(stream, block_size)
+    header = next(blocks, None)
+    if header is None:
+        return
+    columns = _header_columns(_parse_header(header), table_columns)
+
+    owned = executor is None
+    pool = ProcessPoolExecutor(max_workers) if executor is None else executor
+    pending = deque()  # type: Deque[Future[Dict[str, ColumnArray]]]
+    try:
+        for block in blocks:
+            pending.append(pool.submit(_decode_block, block, columns))
+            if len(pending) >= 2 * max_workers:
+                yield from _completed(pending.popleft())
+        while pending:
+            yield from _completed(pending.popleft())
+    finally:
+        for future in pending:
+            future.cancel()
+        if owned:
+            pool.shutdown()
+
+
+def _completed(
+    future: "Future[Dict[str, ColumnArray]]",
+) -> Iterator[Dict[str, ColumnArray]]:
+    batch = future.result()
+    if batch:
+        yield batch
+
+
+def _iter_blocks(stream: Any, block_size: int) -> Iterator[bytes]:
+    """Split a binary stream into the header row followed by blocks of complete
+    rows.
+    """
+    buffer = bytearray()
+    header_read = False
+    while True:
+        chunk = stream.read(block_size)
+        if chunk:
+            buffer += chunk
+        if not header_read:
+            end = _first_row_end(buffer)
+            if not end and chunk:
+                continue
+            if not buffer:
+                return
+            header_read = True
+            header = bytes(buffer[:end] if end else buffer)
+            del buffer[: len(header)]
+            yield header
+        if not chunk:
+            if buffer:
+                yield bytes(buffer)
+            return
+        if len(buffer) >= block_size:
+            end = _last_row_end(buffer)
+            if end:
+                yield bytes(buffer[:end])
+                del buffer[:end]
+
+
+def _first_row_end(data: bytearray) -> int:
+    """Find the offset just past the first complete row, or 0 if there is none.
+
+    A newline only ends a row when it is outside a quoted value, which is the case
+    when an even number of quotes precede it in the row.
+    """
+    position = 0
+    quotes = 0
+    while True:
+        newline = data.find(b"\n", position)
+        if newline < 0:
+            return 0
+        quotes += data.count(b'"', position, newline)
+        position = newline + 1
+        if quotes % 2 == 0:
+            return position
+
+
+def _last_row_end(data: bytearray) -> int:
+    """Find the offset just past the last complete row, or 0 if there is none."""
+    end = data.rfind(b"\n")
+    quotes = data.count(b'"', 0, end) if end >= 0 else 0
+    while end >= 0:
+        if quotes % 2 == 0:
+            return end + 1
+        previous = data.rfind(b"\n", 0, end)
+        quotes -= data.count(b'"', previous + 1, end)
+        end = previous
+    return 0
+
+
+def _parse_header(header: bytes) -> List[str]:
+    if header.startswith(_BOM):
+        header = header[len(_BOM) :]
+    return next(csv.reader([header.decode("utf-8")]), [])
+
+
+def _decode_block(block: bytes, columns: Sequence[Column]) -> Dict[str, ColumnArray]:
+    """Parse a block of complete rows. Runs in a worker process."""
+    lines = io.StringIO(block.decode("utf-8"), newline="\n")
+    rows = [row for row in csv.reader(lines) if row]
+    if not rows:
+        return {}
+    return _decode_rows(rows, columns)
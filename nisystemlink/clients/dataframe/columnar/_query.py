@@ -0,0 +1,222 @@
+"""Local evaluation of table data queries against typed columns."""
+
+from typing import Dict, Mapping, Sequence
+
+import numpy as np
+
+from ._column_array import ColumnArray
+from ._decode import decode_column
+from ..models import (
+    ColumnFilter,
+    ColumnOrderBy,
+    DataType,
+    FilterOperation,
+    QueryTableDataRequest,
+)
+
+_STRING_OPERATIONS = (
+    FilterOperation.Equals,
+    FilterOperation.NotEquals,
+    FilterOperation.Contains,
+    FilterOperation.NotContains,
+)
+
+
+def query_columns(
+    columns: Mapping[str, ColumnArray], query: QueryTableDataRequest
+) -> Dict[str, ColumnArray]:
+    """Apply the filters, ordering, column selection, and row limit of a query to
+    rows that are already held locally.
+
+    The rows selected are the same as those the DataFrame Service would return for
+    the query. See :func:`evaluate_filters` and :func:`sort_order` for how each part
+    of the query is evaluated.
+
+    Args:
+        columns: The rows to query, as a dictionary mapping each column name to its
+            values, such as a batch returned by
+            :func:`~nisystemlink.clients.dataframe.columnar.decode_frame`. Every
+            column used by the query must be included.
+        query: The query to evaluate. Paging is not supported, so ``take`` limits
+            the total number of rows returned.
+
+    Returns:
+        A dictionary mapping each column in ``query.columns``, or each column of
+        ``columns`` if it isn't set, to the values of the selected rows.
+
+    Raises:
+        ValueError: if ``query.continuation_token`` is set, the query uses a column
+            that is not in ``columns``, or a filter is not valid for its column.
+    """
+    if query.continuation_token is not None:
+        raise ValueError("Continuation tokens cannot be evaluated locally")
+
+    rows = np.flatnonzero(evaluate_filters(columns, query.filters or []))
+    if query.order_by:
+        selected = {name: column[rows] for name, column in columns.items()}
+        rows = rows[sort_order(selected, query.order_by)]
+    if query.take is not None:
+        rows = rows[: query.take]
+    names = query.columns if query.columns is not None else list(columns)
+    return {name: _column(columns, name)[rows] for name in names}
+
+
+def evaluate_filters(
+    columns: Mapping[str, ColumnArray], filters: Sequence[ColumnFilter]
+) -> np.ndarray:
+    """Find the rows that match every filter, using the DataFrame Service's rules.
+
+    * A null only matches ``EQUALS`` with a ``None`` value, and every non-null value
+      matches ``NOT_EQUALS`` with a ``None`` value.
+    * ``NaN`` is equal to itself and greater than every other number, including
+      infinity.
+    * ``STRING`` columns only support ``EQUALS``, ``NOT_EQUALS``, ``CONTAINS``, and
+      ``NOT_CONTAINS``, which compare case-sensitively. Other columns don't support
+      ``CONTAINS`` or ``NOT_CONTAINS``.
+
+    Args:
+        columns: A dictionary mapping each column name to its values.
+        filters: The filters to apply.
+
+    Returns:
+        A boolean array that is True for each row that matches every filter.
+
+    Raises:
+        ValueError: if a filter uses a column that is not in ``columns``, uses an
+            operation that its column's data type or value doesn't support, or has
+            a value that cannot be converted to its column's data type.
+    """
+    row_count = len(next(iter(columns.values()))) if columns else 0
+    mask = np.ones(row_count, bool)
+    for column_filter in filters:
+        mask &= _matches(_column(columns, column_filter.column), column_filter)
+    return mask
+
+
+def sort_order(
+    columns: Mapping[str, ColumnArray], order_by: Sequence[ColumnOrderBy]
+) -> np.ndarray:
+    """Find the order of rows given by a list of columns to order by.
+
+    Values are ordered as the DataFrame Service orders them. Nulls come after every
+    value in ascending order and before every value in descending order, ``NaN``
+    comes after every other number, and strings are ordered by code point. Rows with
+    equal values in every column keep their relative order.
+
+    Args:
+        columns: A dictionary mapping each column name to its values.
+        order_by: The columns to order by, most significant first.
+
+    Returns:
+        The indices of the rows in sorted order.
+
+    Raises:
+        ValueError: if a column to order by is not in ``columns``.
+    """
+    keys = []
+    for order in reversed(order_by):
+        ranks = _ranks(_column(columns, order.column))
+        keys.append(-ranks if order.descending else ranks)
+    if not keys:
+        row_count = len(next(iter(columns.values()))) if columns else 0
+        return np.arange(row_count)
+    return np.lexsort(keys)
+
+
+def _column(columns: Mapping[str, ColumnArray], name: str) -> ColumnArray:
+    column = columns.get(name)
+    if column is None:
+        raise ValueError("Column '{}' is not in the data".format(name))
+    return column
+
+
+def _matches(column: ColumnArray, column_filter: ColumnFilter) -> np.ndarray:
+    operation = column_filter.operation
+    valid = column.valid if column.valid is not None else np.ones(len(column), bool)
+    if column_filter.value is None:
+        if operation == FilterOperation.Equals:
+            return ~valid
+        if operation == FilterOperation.NotEquals:
+            return valid.copy()
+        raise ValueError(
+            "Column '{}' can only be compared with null using EQUALS or "
+            "NOT_EQUALS".format(column_filter.column)
+        )
+
+    if column.data_type == DataType.String:
+        return _matches_string(column, valid, column_filter, column_filter.value)
+    if operation in (FilterOperation.Contains, FilterOperation.NotContains):
+        raise ValueError(
+            "Column '{}' does not support {}".format(
+                column_filter.column, operation.value
+            )
+        )
+
+    value = decode_column(
+        [column_filter.value], column.data_type, False, column_filter.column
+    ).values[0]
+    values = column.values
+    if column.data_type in (DataType.Float32, DataType.Float64):
+        nan = np.isnan(values)
+        if np.isnan(value):
+            if operation != FilterOperation.NotEquals:
+                raise ValueError(
+                    "Column '{}' can only be compared with NaN using "
+                    "NOT_EQUALS".format(column_filter.column)
+                )
+            return ~nan & valid
+        if operation in (
+            FilterOperation.GreaterThan,
+            FilterOperation.GreaterThanEquals,
+        ):
+            # NaN is greater than every number.
+            return (_compare(values, operation, value) | nan) & valid
+    return _compare(values, operation, value) & valid
+
+
+def _matches_string(
+    column: ColumnArray, valid: np.ndarray, column_filter: ColumnFilter, value: str
+) -> np.ndarray:
+    operation = column_filter.operation
+    if operation not in _STRING_OPERATIONS:
+        raise ValueError(
+            "Column '{}' does not support {}".format(
+                column_filter.column, operation.value
+            )
+        )
+    # Nulls are replaced so that every element is a string.
+    values = np.where(valid, column.values, "")
+    if operation in (FilterOperation.Equals, FilterOperation.NotEquals):
+        matches = values == value
+    else:
+        matches = np.char.find(values.astype(str), value) >= 0
+    if operation in (FilterOperation.NotEquals, FilterOperation.NotContains):
+        matches = ~matches
+    return matches & valid
+
+
+def _compare(
+    values: np.ndarray, operation: FilterOperation, value: object
+) -> np.ndarray:
+    if operation == FilterOperation.Equals:
+        return values == value
+    if operation == FilterOperation.NotEquals:
+        return values != value
+    if operation == FilterOperation.LessThan:
+        return values < value
+    if operation == FilterOperation.LessThanEquals:
+        return values <= value
+    if operation == FilterOperation.GreaterThan:
+        return values > value
+    return values >= value
+
+
+def _ranks(column: ColumnArray) -> np.ndarray:
+    """Number the distinct values of a column in ascending order, with nulls last."""
+    if column.valid is None:
+        _, ranks = np.unique(column.values, return_inverse=True)
+        return ranks
+    unique, inverse = np.unique(column.values[column.valid], return_inverse=True)
+    ranks = np.full(len(column), len(unique), np.intp)
+    ranks[column.valid] = inverse
+    return ranks
@@ -0,0 +1,203 @@
+"""Summary statistics of columns, accumulated one batch of rows at a time."""
+
+import math
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional
+
+import numpy as np
+
+from ._column_array import ColumnArray
+from ..models import DataType
+
+_NUMERIC_TYPES = (
+    DataType.Bool,
+    DataType.Float32,
+    DataType.Float64,
+    DataType.Int32,
+    DataType.Int64,
+)
+
+
+class ColumnStatistics:
+    """Summary statistics of the values of one column.
+
+    Statistics are updated with each batch of the column's values, without keeping
+    the values, so that the statistics of a whole table can be computed as it is
+    read. The mean and variance are combined across batches with the pairwise
+    algorithm of Chan et al., which remains accurate for long columns.
+
+    ``NaN`` values of floating-point columns are counted, but not included in the
+    other statistics. The mean and variance are only computed for numeric and
+    ``BOOL`` columns, where ``True`` counts as 1.
+    """
+
+    def __init__(self, data_type: DataType) -> None:
+        """Initialize an instance with no values.
+
+        Args:
+            data_type: The data type of the column.
+        """
+        self.data_type = data_type
+        self.count = 0
+        """The number of values that are not null, including ``NaN`` values."""
+        self.null_count = 0
+        """The number of null values."""
+        self.nan_count = 0
+        """The number of ``NaN`` values."""
+        self.minimum = None  # type: Any
+        """The smallest value, or None if there are no values."""
+        self.maximum = None  # type: Any
+        """The largest value, or None if there are no values."""
+        self._mean = 0.0
+        self._squares = 0.0  # Sum of squared differences from the mean
+
+    @property
+    def mean(self) -> Optional[float]:
+        """The mean of the values, or None if there are none or the column is not
+        numeric.
+        """
+        if self.data_type not in _NUMERIC_TYPES or self._measured == 0:
+            return None
+        return self._mean
+
+    @property
+    def variance(self) -> Optional[float]:
+        """The sample variance of the values, or None if there are fewer than two
+        or the column is not numeric.
+        """
+        if self.data_type not in _NUMERIC_TYPES or self._measured < 2:
+            return None
+        return self._squares / (self._measured - 1)
+
+    @property
+    def stddev(self) -> Optional[float]:
+        """The sample standard deviation of the values, or None if there are fewer
+        than two or the column is not numeric.
+        """
+        variance = self.variance
+        return None if variance is None else math.sqrt(variance)
+
+    @property
+    def _measured(self) -> int:
+        return self.count - self.nan_count
+
+    def update(self, column: ColumnArray) -> None:
+        """Include a batch of the column's values in the statistics.
+
+        Args:
+            column: The values to include.
+
+        Raises:
+            ValueError: if ``column`` has a different data type.
+        """
+        if column.data_type != self.data_type:
+            raise ValueError(
+                "Cannot include {} values in statistics of a {} column".format(
+                    column.data_type.value, self.data_type.value
+                )
+            )
+        values = column.values
+        if column.valid is not None:
+            values = values[column.valid]
+        nulls = len(column) - len(values)
+        if self.data_type in (DataType.Float32, DataType.Float64):
+            nan = np.isnan(values)
+            nan_count = int(np.count_nonzero(nan))
+            measured = values[~nan] if nan_count else values
+        else:
+            nan_count = 0
+            measured = values
+
+        batch = ColumnStatistics(self.data_type)
+        batch.count = len(values)
+        batch.null_count = nulls
+        batch.nan_count = nan_count
+        if len(measured):
+            batch.minimum = measured.min()
+            batch.maximum = measured.max()
+            if self.data_type in _NUMERIC_TYPES:
+                numbers = measured.astype(np.float64)
+                batch._mean = float(numbers.mean())
+                batch._squares = float(np.square(numbers - batch._mean).sum())
+        self.merge(batch)
+
+    def merge(self, other: "ColumnStatistics") -> None:
+        """Include the values summarized by other statistics of the same column,
+        such as those of another part of the table read in parallel.
+
+        Args:
+            other: The statistics to include.
+        """
+        measured, other_measured = self._measured, other._measured
+        total = measured + other_measured
+        if other_measured:
+            delta = other._mean - self._mean
+            self._mean += delta * other_measured / total
+            self._squares += (
+                other._squares + delta * delta * measured * other_measured / total
+            )
+            if self.minimum is None or other.minimum < self.minimum:
+                self.minimum = other.minimum
+            if self.maximum is None or other.maximum > self.maximum:
+                self.maximum = other.maximum
+        self.count += other.count
+        self.null_count += other.null_count
+        self.nan_count += other.nan_count
+
+    def __repr__(self) -> str:
+        return (
+            "ColumnStatistics(data_type={!r}, count={!r}, null_count={!r}, "
+            "minimum={!r}, maximum={!r}, mean={!r}, stddev={!r})".format(
+                self.data_type,
+                self.count,
+                self.null_count,
+                self.minimum,
+                self.maximum,
+                self.mean,
+                self.stddev,
+            )
+        )
+
+
+class TableStatistics:
+    """Summary statistics of every column of a table, accumulated from batches of
+    typed columns such as those produced by
+    :func:`~nisystemlink.clients.dataframe.columnar.decode_frame` or
+    :func:`~nisystemlink.clients.dataframe.columnar.iter_csv_batches`.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an instance with no rows."""
+        self.columns = {}  # type: Dict[str, ColumnStatistics]
+        """The statistics of each column, keyed by column name."""
+        self.row_count = 0
+        """The number of rows included in the statistics."""
+
+    def update(self, batch: Mapping[str, ColumnArray]) -> None:
+        """Include a batch of rows in the statistics.
+
+        Args:
+            batch: A dictionary mapping each column name to its values.
+        """
+        for name, column in batch.items():
+            statistics = self.columns.get(name)
+            if statistics is None:
+                statistics = self.columns[name] = ColumnStatistics(column.data_type)
+            statistics.update(column)
+        if batch:
+            self.row_count += len(next(iter(batch.values())))
+
+    def track(
+        self, batches: Iterable[Mapping[str, ColumnArray]]
+    ) -> Iterator[Mapping[str, ColumnArray]]:
+        """Include each batch of rows in the statistics as it passes through.
+
+        Args:
+            batches: The batches of rows to include.
+
+        Returns:
+            An iterator over the same batches, which updates the statistics as each
+            batch is returned.
+        """
+        for batch in batches:
+            self.update(batch)
+            yield batch
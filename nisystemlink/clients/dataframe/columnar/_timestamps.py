@@ -0,0 +1,154 @@
+"""Conversion between ISO-8601 strings and ``datetime64[ms]`` arrays.
+
+The service encodes every timestamp in the same fixed-width form,
+``YYYY-MM-DDTHH:MM:SS.fffZ``. Columns in that form are converted with arithmetic on
+the characters of every string at once, which is several times faster than NumPy's
+general-purpose datetime parsing and formatting. Anything else is converted by
+NumPy, which also rejects strings that are not valid timestamps.
+"""
+
+import warnings
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+_WIDTH = 24
+_TEMPLATE = "0000-00-00T00:00:00.000Z"
+_SEPARATORS = [(i, c) for i, c in enumerate(_TEMPLATE) if c != "0"]
+_DIGITS = [i for i, c in enumerate(_TEMPLATE) if c == "0"]
+_MS_PER_DAY = 86400000
+_YEAR_RANGE = (0, 9999)
+
+# The digit characters of every two and three digit number as UCS-4 code points,
+# with one row per digit.
+_TWO_DIGITS = np.ascontiguousarray(
+    np.array([list("{:02d}".format(i)) for i in range(100)], "U1").view(np.uint32).T
+)
+_THREE_DIGITS = np.ascontiguousarray(
+    np.array([list("{:03d}".format(i)) for i in range(1000)], "U1").view(np.uint32).T
+)
+
+
+def parse_timestamps(cells: Union[Sequence[str], np.ndarray]) -> np.ndarray:
+    """Convert ISO-8601 strings into timestamps with millisecond precision.
+
+    Strings of the form ``2022-08-19T16:17:30.123Z`` are converted with a vectorized
+    fast path. Other strings, such as those with a different number of fractional
+    digits or a time zone offset, are converted by NumPy.
+
+    Args:
+        cells: The strings to convert. ``"NaT"`` is converted to ``NaT``.
+
+    Returns:
+        A ``datetime64[ms]`` array of the timestamps in UTC.
+
+    Raises:
+        ValueError: if a string is not a valid timestamp.
+    """
+    try:
+        encoded = np.array(cells, dtype="S")
+    except UnicodeEncodeError:
+        return _numpy_parse(cells)
+    if encoded.ndim != 1 or encoded.dtype.itemsize != _WIDTH:
+        return _numpy_parse(cells)
+
+    # One row per character position, so that each position is contiguous.
+    characters = encoded.view(np.uint8).reshape(len(encoded), _WIDTH).T.copy()
+    matches = np.ones(len(encoded), bool)
+    for position, separator in _SEPARATORS:
+        matches &= characters[position] == ord(separator)
+    digits = characters - ord("0")
+    for position in _DIGITS:
+        # Characters below "0" wrap around to large values.
+        matches &= digits[position] <= 9
+
+    def number(start: int, stop: int) -> np.ndarray:
+        value = digits[start].astype(np.int64)
+        for position in range(start + 1, stop):
+            value = value * 10 + digits[position]
+        return value
+
+    year, month, day = number(0, 4), number(5, 7), number(8, 10)
+    hour, minute, second = number(11, 13), number(14, 16), number(17, 19)
+    millisecond = number(20, 23)
+    matches &= (month >= 1) & (month <= 12) & (day >= 1)
+    matches &= (hour < 24) & (minute < 60) & (second < 60)
+
+    months = ((year - 1970) * 12 + np.where(matches, month, 1) - 1).astype(
+        "datetime64[M]"
+    )
+    month_start = months.astype("datetime64[D]").astype(np.int64)
+    next_month_start = (months + 1).astype("datetime64[D]").astype(np.int64)
+    days = month_start + day - 1
+    matches &= days < next_month_start
+
+    result = (((days * 24 + hour) * 60 + minute) * 60 + second) * 1000 + millisecond
+    result = result.astype("datetime64[ms]")
+    if not matches.all():
+        others = ~matches
+        result[others] = _numpy_parse(np.asarray(cells, dtype=object)[others])
+    return result
+
+
+def format_timestamps(values: np.ndarray) -> np.ndarray:
+    """Convert timestamps into ISO-8601 strings in UTC with millisecond precision.
+
+    Timestamps between the years 0 and 9999 are formatted with a vectorized fast
+    path. Other timestamps are formatted by NumPy.
+
+    Args:
+        values: The timestamps to convert, as a ``datetime64`` array.
+
+    Returns:
+        An array of strings of the form ``2022-08-19T16:17:30.123Z``. ``NaT`` is
+        converted to ``"NaT"``.
+    """
+    timestamps = values.astype("datetime64[ms]")
+    missing = np.isnat(timestamps)
+    milliseconds = np.where(missing, 0, timestamps.astype(np.int64))
+    days = milliseconds // _MS_PER_DAY
+    time_of_day = milliseconds - days * _MS_PER_DAY
+    months = days.astype("datetime64[D]").astype("datetime64[M]")
+    month_count = months.astype(np.int64)
+    year = month_count // 12 + 1970
+    if len(year) and (year.min() < _YEAR_RANGE[0] or year.max() > _YEAR_RANGE[1]):
+        return _numpy_format(timestamps)
+    month = month_count - (year - 1970) * 12 + 1
+    day = days - months.astype("datetime64[D]").astype(np.int64) + 1
+    seconds = time_of_day // 1000
+    minutes = seconds // 60
+    hours = minutes // 60
+
+    # One row per character position, so that each position is written
+    # contiguously, transposed to one row per string at the end.
+    characters = np.empty((_WIDTH, len(timestamps)), np.uint32)
+    characters[:] = np.array(list(_TEMPLATE), "U1").view(np.uint32)[:, np.newaxis]
+    fields = [
+        (0, _TWO_DIGITS, year // 100),
+        (2, _TWO_DIGITS, year % 100),
+        (5, _TWO_DIGITS, month),
+        (8, _TWO_DIGITS, day),
+        (11, _TWO_DIGITS, hours),
+        (14, _TWO_DIGITS, minutes - hours * 60),
+        (17, _TWO_DIGITS, seconds - minutes * 60),
+        (20, _THREE_DIGITS, time_of_day - seconds * 1000),
+    ]
+    for start, table, field in fields:
+        stop = start + len(table)
+        np.take(table, field, axis=1, out=characters[start:stop])
+    result = characters.T.copy().view("U{}".format(_WIDTH)).reshape(-1)
+    if missing.any():
+        result[missing] = "NaT"
+    return result
+
+
+def _numpy_parse(cells: Union[Sequence[Optional[str]], np.ndarray]) -> np.ndarray:
+    with warnings.catch_warnings():
+        # NumPy warns about parsing the "Z" time zone designator but still
+        # converts the value to UTC.
+        warnings.simplefilter("ignore", DeprecationWarning)
+        return np.array(cells, dtype=str).astype("datetime64[ms]")
+
+
+def _numpy_format(timestamps: np.ndarray) -> np.ndarray:
+    return np.datetime_as_string(timestamps, unit="ms", timezone="UTC")
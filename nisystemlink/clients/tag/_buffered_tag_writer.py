@@ -10,8 +10,8 @@ from types import TracebackType
 from typing import Any, Callable, Optional, Type
 
 from nisystemlink.clients import core, tag as tbase
+from nisystemlink.clients.core._internal._manual_reset_timer import ManualResetTimer
 from nisystemlink.clients.tag._core._itime_stamper import ITimeStamper
-from nisystemlink.clients.tag._core._manual_reset_timer import ManualResetTimer
 
 
 class BufferedTagWriter(tbase.ITagWriter):
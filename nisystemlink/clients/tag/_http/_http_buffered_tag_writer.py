@@ -8,9 +8,9 @@ from typing import Any, Dict, Optional
 
 from nisystemlink.clients import tag as tbase
 from nisystemlink.clients.core._internal._http_client import HttpClient
+from nisystemlink.clients.core._internal._manual_reset_timer import ManualResetTimer
 from nisystemlink.clients.core._internal._timestamp_utilities import TimestampUtilities
 from nisystemlink.clients.tag._core._itime_stamper import ITimeStamper
-from nisystemlink.clients.tag._core._manual_reset_timer import ManualResetTimer
 from typing_extensions import final
 
 
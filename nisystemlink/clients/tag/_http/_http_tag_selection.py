@@ -7,8 +7,8 @@ from typing import Any, Awaitable, Callable, List, Optional, Sequence, Tuple, Ty
 
 from nisystemlink.clients import core, tag as tbase
 from nisystemlink.clients.core._internal._http_client import HttpClient, HttpResponse
+from nisystemlink.clients.core._internal._manual_reset_timer import ManualResetTimer
 from nisystemlink.clients.core._internal._timestamp_utilities import TimestampUtilities
-from nisystemlink.clients.tag._core._manual_reset_timer import ManualResetTimer
 from nisystemlink.clients.tag._core._serialized_tag_with_aggregates import (
     SerializedTagWithAggregates,
 )
@@ -8,8 +8,8 @@ from typing import Iterable, List, Optional
 
 from nisystemlink.clients import core, tag as tbase
 from nisystemlink.clients.core._internal._http_client import HttpClient
+from nisystemlink.clients.core._internal._manual_reset_timer import ManualResetTimer
 from nisystemlink.clients.core._internal._timestamp_utilities import TimestampUtilities
-from nisystemlink.clients.tag._core._manual_reset_timer import ManualResetTimer
 from nisystemlink.clients.tag._core._serialized_tag_with_aggregates import (
     SerializedTagWithAggregates,
 )
@@ -11,7 +11,7 @@ from typing import Iterable, List, Optional, Type
 
 import events
 from nisystemlink.clients import core, tag as tbase
-from nisystemlink.clients.tag._core._manual_reset_timer import ManualResetTimer
+from nisystemlink.clients.core._internal._manual_reset_timer import ManualResetTimer
 
 
 class TagSubscription(events.Events, abc.ABC):
@@ -0,0 +1,51 @@
+from typing import AsyncIterator, List
+
+import pytest  # type: ignore
+from nisystemlink.clients.core.helpers import AsyncIteratorFileLike
+
+
+async def _iterate(chunks: List[bytes]) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+class TestAsyncIteratorFileLike:
+    @pytest.mark.asyncio
+    async def test__negative_size__read__reads_all_data(self):
+        file_like = AsyncIteratorFileLike(_iterate([b"123", b"456", b"789"]))
+
+        assert await file_like.read(-1) == b"123456789"
+        assert await file_like.read(-1) == b""
+
+    @pytest.mark.asyncio
+    async def test__size_larger_than_chunk__read__reads_to_size(self):
+        file_like = AsyncIteratorFileLike(_iterate([b"123", b"", b"456789", b"ab"]))
+
+        assert await file_like.read(4) == b"1234"
+        assert await file_like.read(6) == b"56789a"
+        assert await file_like.read(6) == b"b"
+
+    @pytest.mark.asyncio
+    async def test__partially_read__iterate__yields_remaining_chunks(self):
+        file_like = AsyncIteratorFileLike(_iterate([b"123", b"456"]))
+        await file_like.read(1)
+
+        assert [chunk async for chunk in file_like] == [b"23", b"456"]
+
+    @pytest.mark.asyncio
+    async def test__generator__aclose__closes_generator(self):
+        closed = []
+
+        async def generate() -> AsyncIterator[bytes]:
+            try:
+                yield b"123"
+                yield b"456"
+            finally:
+                closed.append(True)
+
+        async with AsyncIteratorFileLike(generate()) as file_like:
+            assert await file_like.read(1) == b"1"
+
+        assert closed == [True]
+        with pytest.raises(ValueError):
+            await file_like.read()
@@ -1,3 +1,8 @@
+import csv
+import io
+import shutil
+
+import pytest
 from nisystemlink.clients.core.helpers import IteratorFileLike
 
 
@@ -19,3 +24,106 @@ class TestIteratorFileLike:
         assert iterator_file_like.read(4) == b"1234"
         assert iterator_file_like.read(6) == b"56789a"
         assert iterator_file_like.read(6) == b"bcde"
+
+    def test__empty_chunks__read__skips_empty_chunks(self):
+        iterator_file_like = IteratorFileLike(iter([b"", b"12", b"", b"34"]))
+
+        assert iterator_file_like.read(3) == b"123"
+        assert iterator_file_like.read(3) == b"4"
+        assert iterator_file_like.read(3) == b""
+
+    def test__whole_chunk__read__returns_chunk_without_copying(self):
+        chunk = b"123"
+        iterator_file_like = IteratorFileLike(iter([chunk]))
+
+        assert iterator_file_like.read(3) is chunk
+
+    def test__size_larger_than_buffered_data__read1__reads_one_chunk(self):
+        iterator_file_like = IteratorFileLike(iter([b"123", b"456"]))
+
+        assert iterator_file_like.read1(5) == b"123"
+        assert iterator_file_like.read1(1) == b"4"
+        assert iterator_file_like.read1() == b"56"
+        assert iterator_file_like.read1() == b""
+
+    def test__buffer__readinto__fills_buffer_across_chunks(self):
+        iterator_file_like = IteratorFileLike(iter([b"123", b"456", b"789"]))
+        buffer = bytearray(5)
+
+        assert iterator_file_like.readinto(buffer) == 5
+        assert buffer == b"12345"
+        assert iterator_file_like.readinto(buffer) == 4
+        assert buffer[:4] == b"6789"
+        assert iterator_file_like.readinto(buffer) == 0
+
+    def test__memoryview__readinto__writes_through_memoryview(self):
+        iterator_file_like = IteratorFileLike(iter([memoryview(b"1234")]))
+        buffer = bytearray(6)
+
+        assert iterator_file_like.readinto(memoryview(buffer)[2:]) == 4
+        assert buffer == b"\x00\x001234"
+
+    def test__buffer__readinto1__reads_one_chunk(self):
+        iterator_file_like = IteratorFileLike(iter([b"123", b"456"]))
+        buffer = bytearray(5)
+
+        assert iterator_file_like.readinto1(buffer) == 3
+        assert buffer[:3] == b"123"
+
+    def test__lines_across_chunks__readline__reads_each_line(self):
+        iterator_file_like = IteratorFileLike(iter([b"ab\ncd", b"ef", b"\ngh"]))
+
+        assert iterator_file_like.readline() == b"ab\n"
+        assert iterator_file_like.readline() == b"cdef\n"
+        assert iterator_file_like.readline() == b"gh"
+        assert iterator_file_like.readline() == b""
+
+    def test__size__readline__reads_at_most_size(self):
+        iterator_file_like = IteratorFileLike(iter([b"abc", b"def\n"]))
+
+        assert iterator_file_like.readline(4) == b"abcd"
+        assert iterator_file_like.readline(4) == b"ef\n"
+
+    def test__lines__iterate__yields_lines(self):
+        iterator_file_like = IteratorFileLike(iter([b"a\nb", b"\nc"]))
+
+        assert list(iterator_file_like) == [b"a\n", b"b\n", b"c"]
+
+    def test__text_wrapper__read_csv__parses_rows(self):
+        chunks = [b"a,b\r\n1,", b'"x\r\ny"\r\n2,z\r\n']
+        text = io.TextIOWrapper(
+            IteratorFileLike(iter(chunks)), encoding="utf-8", newline=""
+        )
+
+        assert list(csv.reader(text)) == [["a", "b"], ["1", "x\r\ny"], ["2", "z"]]
+
+    def test__copyfileobj__copies_all_data(self):
+        destination = io.BytesIO()
+
+        shutil.copyfileobj(
+            IteratorFileLike(iter([b"123", b"456"])), destination, length=4
+        )
+
+        assert destination.getvalue() == b"123456"
+
+    def test__closed__read__raises(self):
+        iterator_file_like = IteratorFileLike(iter([b"123"]))
+        iterator_file_like.close()
+
+        with pytest.raises(ValueError):
+            iterator_file_like.read()
+
+    def test__generator__close__closes_generator(self):
+        closed = []
+
+        def generate():
+            try:
+                yield b"123"
+                yield b"456"
+            finally:
+                closed.append(True)
+
+        with IteratorFileLike(generate()) as iterator_file_like:
+            assert iterator_file_like.read(1) == b"1"
+
+        assert closed == [True]
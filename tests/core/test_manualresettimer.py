@@ -1,7 +1,7 @@
 import datetime
 import time
 
-from nisystemlink.clients.tag._core._manual_reset_timer import ManualResetTimer
+from nisystemlink.clients.core._internal._manual_reset_timer import ManualResetTimer
 
 
 class TestManualResetTimer:
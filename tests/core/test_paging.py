@@ -0,0 +1,84 @@
+import threading
+from typing import List, Optional
+
+import pytest  # type: ignore
+from nisystemlink.clients.core._uplink._paging import iterate_pages
+from nisystemlink.clients.core._uplink._with_paging import WithPaging
+
+
+class _Page(WithPaging):
+    value: int
+
+
+def _fetcher(page_count: int, requested: List[Optional[str]]):
+    def fetch(token: Optional[str]) -> _Page:
+        requested.append(token)
+        index = 0 if token is None else int(token)
+        next_token = str(index + 1) if index + 1 < page_count else None
+        return _Page(value=index, continuation_token=next_token)
+
+    return fetch
+
+
+class TestIteratePages:
+    @pytest.mark.parametrize("prefetch", [0, 1, 3])
+    def test__multiple_pages__yields_all_pages_in_order(self, prefetch):
+        requested: List[Optional[str]] = []
+
+        pages = list(iterate_pages(_fetcher(4, requested), prefetch=prefetch))
+
+        assert [page.value for page in pages] == [0, 1, 2, 3]
+        assert requested == [None, "1", "2", "3"]
+
+    @pytest.mark.parametrize("prefetch", [0, 2])
+    def test__initial_token__starts_from_token(self, prefetch):
+        requested: List[Optional[str]] = []
+
+        pages = list(iterate_pages(_fetcher(4, requested), "2", prefetch=prefetch))
+
+        assert [page.value for page in pages] == [2, 3]
+
+    def test__prefetch__fetches_next_page_before_it_is_requested(self):
+        requested: List[Optional[str]] = []
+        fetched = threading.Event()
+
+        def fetch(token: Optional[str]) -> _Page:
+            page = _fetcher(3, requested)(token)
+            if token == "1":
+                fetched.set()
+            return page
+
+        pages = iterate_pages(fetch, prefetch=1)
+        assert next(pages).value == 0
+
+        assert fetched.wait(5)
+        pages.close()
+
+    @pytest.mark.parametrize("prefetch", [0, 1])
+    def test__fetch_raises__error_is_raised_to_consumer(self, prefetch):
+        def fetch(token: Optional[str]) -> _Page:
+            if token is not None:
+                raise RuntimeError("boom")
+            return _Page(value=0, continuation_token="1")
+
+        pages = iterate_pages(fetch, prefetch=prefetch)
+
+        assert next(pages).value == 0
+        with pytest.raises(RuntimeError, match="boom"):
+            next(pages)
+
+    def test__consumer_stops_early__background_fetching_stops(self):
+        requested: List[Optional[str]] = []
+
+        pages = iterate_pages(_fetcher(1000, requested), prefetch=2)
+        next(pages)
+        pages.close()
+
+        count = len(requested)
+        threading.Event().wait(0.1)
+        assert len(requested) <= count + 1
+        assert len(requested) < 1000
+
+    def test__negative_prefetch__raises(self):
+        with pytest.raises(ValueError):
+            iterate_pages(_fetcher(1, []), prefetch=-1)
@@ -0,0 +1,122 @@
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import pyarrow
+import pyarrow.parquet
+import pytest  # type: ignore
+from nisystemlink.clients.dataframe.columnar import (
+    arrow_schema,
+    ColumnArray,
+    to_record_batch,
+    write_arrow_ipc,
+    write_parquet,
+)
+from nisystemlink.clients.dataframe.models import Column, ColumnType, DataType
+
+COLUMNS = [
+    Column(name="index", data_type=DataType.Int32, column_type=ColumnType.Index),
+    Column(name="time", data_type=DataType.Timestamp, column_type=ColumnType.Nullable),
+    Column(name="label", data_type=DataType.String),
+]
+
+
+def _batches() -> List[Dict[str, ColumnArray]]:
+    return [
+        {
+            "index": ColumnArray(DataType.Int32, np.array([1, 2], np.int32)),
+            "time": ColumnArray(
+                DataType.Timestamp,
+                np.array(["2022-08-19T16:17:30.123", "NaT"], "datetime64[ms]"),
+                np.array([True, False]),
+            ),
+            "label": ColumnArray(DataType.String, np.array(["a", "b"], object)),
+        },
+        {
+            "label": ColumnArray(DataType.String, np.array(["c"], object)),
+            "index": ColumnArray(DataType.Int32, np.array([3], np.int32)),
+            "time": ColumnArray(
+                DataType.Timestamp, np.array(["2023-01-01"], "datetime64[ms]")
+            ),
+        },
+    ]
+
+
+EXPECTED = {
+    "index": [1, 2, 3],
+    "time": [
+        datetime(2022, 8, 19, 16, 17, 30, 123000, timezone.utc),
+        None,
+        datetime(2023, 1, 1, tzinfo=timezone.utc),
+    ],
+    "label": ["a", "b", "c"],
+}
+
+
+class TestArrowSchema:
+    def test__every_data_type__mapped(self):
+        columns = [
+            Column(name=data_type.value, data_type=data_type) for data_type in DataType
+        ]
+
+        schema = arrow_schema(columns)
+
+        assert schema.types == [
+            pyarrow.bool_(),
+            pyarrow.float32(),
+            pyarrow.float64(),
+            pyarrow.int32(),
+            pyarrow.int64(),
+            pyarrow.string(),
+            pyarrow.timestamp("ms", tz="UTC"),
+        ]
+
+    def test__column_types__determine_nullability(self):
+        schema = arrow_schema(COLUMNS)
+
+        assert [field.nullable for field in schema] == [False, True, False]
+
+
+class TestToRecordBatch:
+    def test__missing_column__raises(self):
+        batch = _batches()[0]
+        del batch["label"]
+
+        with pytest.raises(ValueError, match="label"):
+            to_record_batch(batch, arrow_schema(COLUMNS))
+
+
+class TestWriteParquet:
+    def test__batches__written_as_row_groups(self, tmp_path: Path):
+        path = tmp_path / "table.parquet"
+
+        rows = write_parquet(_batches(), COLUMNS, path)
+
+        assert rows == 3
+        parquet_file = pyarrow.parquet.ParquetFile(path)
+        assert parquet_file.num_row_groups == 2
+        assert parquet_file.schema_arrow == arrow_schema(COLUMNS)
+        assert parquet_file.read().to_pydict() == EXPECTED
+
+    def test__no_batches__writes_schema(self, tmp_path: Path):
+        path = tmp_path / "table.parquet"
+
+        rows = write_parquet([], COLUMNS, path, compression="zstd")
+
+        assert rows == 0
+        table = pyarrow.parquet.read_table(path)
+        assert table.num_rows == 0
+        assert table.schema == arrow_schema(COLUMNS)
+
+
+class TestWriteArrowIpc:
+    def test__batches__written_as_record_batches(self, tmp_path: Path):
+        path = tmp_path / "table.arrow"
+
+        rows = write_arrow_ipc(_batches(), COLUMNS, path)
+
+        assert rows == 3
+        with pyarrow.ipc.open_file(path) as reader:
+            assert reader.num_record_batches == 2
+            assert reader.read_all().to_pydict() == EXPECTED
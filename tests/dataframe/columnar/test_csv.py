@@ -0,0 +1,75 @@
+import io
+
+import numpy as np
+import pytest  # type: ignore
+from nisystemlink.clients.core.helpers import IteratorFileLike
+from nisystemlink.clients.dataframe.columnar import iter_csv_batches
+from nisystemlink.clients.dataframe.models import Column, ColumnType, DataType
+
+columns = [
+    Column(name="index", data_type=DataType.Int32, column_type=ColumnType.Index),
+    Column(name="value", data_type=DataType.Float64, column_type=ColumnType.Nullable),
+    Column(name="text", data_type=DataType.String, column_type=ColumnType.Nullable),
+]
+
+csv_data = (
+    '"index","value","text"\r\n'
+    '1,1.5,"héllo"\r\n'
+    '2,,"multi\r\nline, with comma"\r\n'
+    "3,NaN,\r\n"
+    '4,-Infinity,"say ""hi"""'
+).encode()
+
+
+class TestIterCsvBatches:
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 1024])
+    def test__any_chunk_size__parses_all_rows(self, chunk_size):
+        batches = list(iter_csv_batches(io.BytesIO(csv_data), columns, 10, chunk_size))
+
+        assert len(batches) == 1
+        batch = batches[0]
+        assert list(batch) == ["index", "value", "text"]
+        assert batch["index"].values.tolist() == [1, 2, 3, 4]
+        assert batch["value"].valid.tolist() == [True, False, True, True]
+        assert batch["value"].values[0] == 1.5
+        assert np.isnan(batch["value"].values[2])
+        assert batch["value"].values[3] == -np.inf
+        assert batch["text"].values.tolist() == [
+            "héllo",
+            "multi\r\nline, with comma",
+            "",
+            'say "hi"',
+        ]
+
+    def test__batch_rows__splits_rows_into_batches(self):
+        stream = IteratorFileLike(iter([csv_data[:20], csv_data[20:]]))
+
+        batches = list(iter_csv_batches(stream, columns, 3))
+
+        assert [batch["index"].values.tolist() for batch in batches] == [
+            [1, 2, 3],
+            [4],
+        ]
+
+    def test__header_only__yields_nothing(self):
+        batches = iter_csv_batches(io.BytesIO(b'"index"\r\n'), columns, 10)
+
+        assert list(batches) == []
+
+    def test__unknown_column__raises(self):
+        batches = iter_csv_batches(io.BytesIO(b'"missing"\r\n1\r\n'), columns, 10)
+
+        with pytest.raises(ValueError, match="missing"):
+            list(batches)
+
+    @pytest.mark.parametrize("row", [b"1,2.5", b"1,2.5,a,extra"])
+    def test__row_with_wrong_number_of_values__raises(self, row):
+        data = b'"index","value","text"\r\n1,1.5,a\r\n' + row
+        batches = iter_csv_batches(io.BytesIO(data), columns, 10)
+
+        with pytest.raises(ValueError, match="header has 3 columns"):
+            list(batches)
+
+    def test__invalid_batch_rows__raises(self):
+        with pytest.raises(ValueError):
+            iter_csv_batches(io.BytesIO(csv_data), columns, 0)
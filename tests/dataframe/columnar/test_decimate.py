@@ -0,0 +1,118 @@
+import numpy as np
+import pytest  # type: ignore
+from nisystemlink.clients.dataframe.columnar import ColumnArray, decimate
+from nisystemlink.clients.dataframe.models import DataType, DecimationMethod
+
+# The x values are shuffled so that decimation has to sort them.
+x = np.array([5, 1, 3, 2, 4, 0, 9, 8, 7, 6])
+y = np.array([1.0, 9.0, np.nan, 4.0, 0.0, 3.0, 2.0, 7.0, 7.0, 5.0])
+
+
+class TestDecimate:
+    def test__lossy__keeps_evenly_spaced_rows_including_ends(self):
+        result = decimate({"x": x, "y": y}, "x", intervals=4)
+
+        assert result["x"].tolist() == [0, 3, 6, 9]
+
+    def test__lossy_with_fewer_rows_than_intervals__keeps_all_rows_in_order(self):
+        result = decimate({"x": x, "y": y}, "x", intervals=100)
+
+        assert result["x"].tolist() == list(range(10))
+
+    def test__max_min__keeps_first_extremes_of_each_interval(self):
+        result = decimate({"x": x, "y": y}, "x", ["y"], 2, DecimationMethod.MaxMin)
+
+        assert result["x"].tolist() == [1, 4, 5, 7]
+        assert result["y"].tolist() == [9.0, 0.0, 1.0, 7.0]
+
+    def test__entry_exit__also_keeps_first_and_last_row_of_each_interval(self):
+        result = decimate({"x": x, "y": y}, "x", ["y"], 2, DecimationMethod.EntryExit)
+
+        assert result["x"].tolist() == [0, 1, 4, 5, 7, 9]
+
+    def test__several_y_columns__keeps_extremes_of_each(self):
+        z = -x
+
+        result = decimate(
+            {"x": x, "y": y, "z": z}, "x", ["y", "z"], 1, DecimationMethod.MaxMin
+        )
+
+        assert result["x"].tolist() == [0, 1, 4, 9]
+
+    def test__null_values__are_ignored(self):
+        x_column = ColumnArray(
+            DataType.Timestamp,
+            np.array([0, 1, 2, 3], "datetime64[ms]"),
+            np.array([True, True, True, False]),
+        )
+        y_column = ColumnArray(
+            DataType.Int64, np.array([5, 0, 3, 9]), np.array([True, False, True, True])
+        )
+
+        result = decimate(
+            {"x": x_column, "y": y_column}, "x", ["y"], 1, DecimationMethod.MaxMin
+        )
+
+        assert isinstance(result["y"], ColumnArray)
+        assert result["y"].values.tolist() == [5, 3]
+        assert result["x"].values.tolist() == [
+            np.datetime64(0, "ms").item(),
+            np.datetime64(2, "ms").item(),
+        ]
+
+    def test__equal_x_values__keeps_single_interval(self):
+        result = decimate(
+            {"x": np.zeros(4), "y": np.array([2, 1, 4, 3])},
+            "x",
+            ["y"],
+            10,
+            DecimationMethod.EntryExit,
+        )
+
+        assert result["y"].tolist() == [2, 1, 4, 3]
+
+    def test__no_rows__returns_empty_columns(self):
+        result = decimate(
+            {"x": np.array([]), "y": np.array([])},
+            "x",
+            ["y"],
+            10,
+            DecimationMethod.MaxMin,
+        )
+
+        assert len(result["x"]) == 0 and len(result["y"]) == 0
+
+    def test__matches_brute_force_max_min(self):
+        rng = np.random.default_rng(0)
+        x_values = rng.uniform(0, 100, 1000)
+        y_values = rng.normal(size=1000)
+
+        result = decimate(
+            {"x": x_values, "y": y_values}, "x", ["y"], 7, DecimationMethod.MaxMin
+        )
+
+        order = np.argsort(x_values, kind="stable")
+        width = (x_values.max() - x_values.min()) / 7
+        numbers = np.minimum(((x_values - x_values.min()) / width).astype(int), 6)
+        expected = set()  # type: set
+        for number in range(7):
+            members = order[numbers[order] == number]
+            expected.add(members[np.argmin(y_values[members])])
+            expected.add(members[np.argmax(y_values[members])])
+        assert sorted(result["x"].tolist()) == sorted(x_values[list(expected)].tolist())
+
+    @pytest.mark.parametrize(
+        "arrays, error",
+        [
+            ({"y": y}, "not provided"),
+            ({"x": x, "y": np.array(["a"] * 10, object)}, "not numeric"),
+            ({"x": x, "y": y[:5]}, "same number"),
+        ],
+    )
+    def test__invalid_columns__raises(self, arrays, error: str):
+        with pytest.raises(ValueError, match=error):
+            decimate(arrays, "x", ["y"], 2, DecimationMethod.MaxMin)
+
+    def test__zero_intervals__raises(self):
+        with pytest.raises(ValueError):
+            decimate({"x": x}, "x", intervals=0)
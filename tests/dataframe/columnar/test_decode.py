@@ -0,0 +1,146 @@
+import numpy as np
+import pytest  # type: ignore
+from nisystemlink.clients.dataframe.columnar import (
+    ColumnArray,
+    decode_column,
+    decode_frame,
+)
+from nisystemlink.clients.dataframe.models import (
+    Column,
+    ColumnType,
+    DataFrame,
+    DataType,
+    PagedTableRows,
+)
+
+columns = [
+    Column(name="index", data_type=DataType.Int64, column_type=ColumnType.Index),
+    Column(name="int32", data_type=DataType.Int32),
+    Column(name="float32", data_type=DataType.Float32),
+    Column(name="float64", data_type=DataType.Float64, column_type=ColumnType.Nullable),
+    Column(name="bool", data_type=DataType.Bool),
+    Column(name="time", data_type=DataType.Timestamp, column_type=ColumnType.Nullable),
+    Column(name="string", data_type=DataType.String, column_type=ColumnType.Nullable),
+]
+
+rows = [
+    ["1", "-5", "1.5", "0.10000000000000001", "True", "2022-08-19T16:17:30.123Z", "a"],
+    ["2", "7", "NaN", None, "false", None, None],
+    ["3", "2147483647", "-Infinity", "Infinity", "TRUE", "2022-08-19T16:17:30Z", ""],
+]
+
+
+class TestDecodeFrame:
+    def test__all_data_types__decodes_typed_columns(self):
+        result = decode_frame(DataFrame(data=rows), columns)
+
+        assert list(result) == [column.name for column in columns]
+        assert result["index"] == ColumnArray(
+            DataType.Int64, np.array([1, 2, 3], np.int64)
+        )
+        assert result["int32"].values.dtype == np.int32
+        assert result["int32"].values.tolist() == [-5, 7, 2147483647]
+        assert result["float32"].values.dtype == np.float32
+        np.testing.assert_array_equal(
+            result["float32"].values, np.array([1.5, np.nan, -np.inf], np.float32)
+        )
+        assert result["float64"].values[0] == 0.1
+        assert result["float64"].values[2] == np.inf
+        assert result["float64"].valid.tolist() == [True, False, True]
+        assert result["bool"].values.tolist() == [True, False, True]
+        assert result["time"].values[0] == np.datetime64("2022-08-19T16:17:30.123")
+        assert np.isnat(result["time"].values[1])
+        assert result["time"].valid.tolist() == [True, False, True]
+        assert result["string"].values.tolist() == ["a", None, ""]
+        assert result["string"].valid.tolist() == [True, False, True]
+
+    def test__non_nullable_column__has_no_validity_mask(self):
+        result = decode_frame(DataFrame(data=rows), columns)
+
+        assert result["index"].valid is None
+        assert result["index"].null_count == 0
+
+    def test__raw_paged_json__decodes_selected_columns_in_order(self):
+        page = {
+            "frame": {"columns": ["string", "index"], "data": [["x", "4"]]},
+            "totalRowCount": 1,
+            "continuationToken": None,
+        }
+
+        result = decode_frame(page, columns)
+
+        assert list(result) == ["string", "index"]
+        assert result["index"].values.tolist() == [4]
+
+    def test__paged_table_rows__decodes(self):
+        page = PagedTableRows(
+            frame=DataFrame(columns=["index"], data=[["9"]]), total_row_count=1
+        )
+
+        assert decode_frame(page, columns)["index"].values.tolist() == [9]
+
+    def test__no_rows__decodes_empty_columns(self):
+        result = decode_frame(DataFrame(columns=["index", "time"], data=[]), columns)
+
+        assert len(result["index"]) == 0
+        assert result["time"].values.dtype == np.dtype("datetime64[ms]")
+
+    def test__null_in_non_nullable_column__raises(self):
+        with pytest.raises(ValueError, match="int32"):
+            decode_frame(DataFrame(columns=["int32"], data=[[None]]), columns)
+
+    def test__unknown_column__raises(self):
+        with pytest.raises(ValueError, match="missing"):
+            decode_frame(DataFrame(columns=["missing"], data=[["1"]]), columns)
+
+    def test__bool_values__ignore_case(self):
+        result = decode_column(["TRUE", "False", "tRuE"], DataType.Bool, False)
+
+        assert result.values.tolist() == [True, False, True]
+
+    @pytest.mark.parametrize("cell", ["yes", "1", "", "treu"])
+    def test__invalid_bool_value__raises(self, cell):
+        with pytest.raises(ValueError, match="bool"):
+            decode_frame(DataFrame(columns=["bool"], data=[["true"], [cell]]), columns)
+
+    def test__int32_bounds__decoded(self):
+        result = decode_column(["-2147483648", "2147483647"], DataType.Int32, False)
+
+        assert result.values.dtype == np.int32
+        assert result.values.tolist() == [-2147483648, 2147483647]
+
+    @pytest.mark.parametrize(
+        "name, cell",
+        [
+            ("int32", "3000000000"),
+            ("int32", "-2147483649"),
+            ("index", "9223372036854775808"),
+            ("index", "1.5"),
+            ("float32", "x"),
+        ],
+    )
+    def test__value_out_of_range_or_invalid__raises_naming_column(self, name, cell):
+        with pytest.raises(ValueError, match="'{}'".format(name)):
+            decode_frame(DataFrame(columns=[name], data=[["1"], [cell]]), columns)
+
+
+class TestColumnArray:
+    def test__select_with_mask__selects_values_and_validity(self):
+        column = ColumnArray(
+            DataType.Int32, np.array([1, 2, 3], np.int32), np.array([1, 0, 1], bool)
+        )
+
+        selected = column[np.array([False, True, True])]
+
+        assert selected.values.tolist() == [2, 3]
+        assert selected.valid.tolist() == [False, True]
+
+    def test__concatenate__joins_pieces_and_validity(self):
+        first = ColumnArray(DataType.Float64, np.array([1.0]))
+        second = ColumnArray(DataType.Float64, np.array([np.nan]), np.array([False]))
+
+        result = ColumnArray.concatenate(DataType.Float64, [first, second])
+
+        assert result.values.tolist()[0] == 1.0
+        assert result.valid.tolist() == [True, False]
+        assert result.null_count == 1
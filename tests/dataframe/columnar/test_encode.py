@@ -0,0 +1,198 @@
+import numpy as np
+import pytest  # type: ignore
+from nisystemlink.clients.dataframe.columnar import (
+    ColumnArray,
+    decode_frame,
+    encode_column,
+    encode_frame,
+)
+from nisystemlink.clients.dataframe.models import (
+    AppendTableDataRequest,
+    Column,
+    ColumnType,
+    DataType,
+)
+
+columns = [
+    Column(name="index", data_type=DataType.Int32, column_type=ColumnType.Index),
+    Column(name="float64", data_type=DataType.Float64, column_type=ColumnType.Nullable),
+    Column(name="float32", data_type=DataType.Float32),
+    Column(name="bool", data_type=DataType.Bool),
+    Column(name="time", data_type=DataType.Timestamp, column_type=ColumnType.Nullable),
+    Column(name="string", data_type=DataType.String, column_type=ColumnType.Nullable),
+]
+
+
+class TestEncodeColumn:
+    def test__float64__round_trips_exactly(self):
+        values = np.array([0.1, 1 / 3, 1e300, -0.0, 5e-324])
+
+        encoded = encode_column(values, DataType.Float64)
+
+        assert [float(value) for value in encoded] == values.tolist()
+
+    def test__float32__round_trips_exactly(self):
+        values = np.array([0.1, 1 / 3, 3.4028234e38], np.float32)
+
+        encoded = encode_column(values, DataType.Float32)
+
+        assert np.array_equal(np.array(encoded, np.float32), values)
+
+    def test__float_special_values__uses_service_spelling(self):
+        values = np.array([np.nan, np.inf, -np.inf])
+
+        assert encode_column(values, DataType.Float64) == [
+            "NaN",
+            "Infinity",
+            "-Infinity",
+        ]
+
+    def test__timestamps__encodes_iso_8601_milliseconds(self):
+        values = np.array(["2022-08-19T16:17:30.123456", "NaT"], dtype="datetime64[us]")
+
+        assert encode_column(values, DataType.Timestamp) == [
+            "2022-08-19T16:17:30.123Z",
+            None,
+        ]
+
+    def test__integral_floats__encodes_integers(self):
+        values = np.ma.masked_array([1.0, -2.0, np.nan], mask=[False, False, True])
+
+        encoded = encode_column(values, DataType.Int64)
+
+        assert encoded == ["1", "-2", None]
+
+    @pytest.mark.parametrize(
+        "values", [[1.7], np.array([1.0, -0.5]), [np.nan], ["1.5"]]
+    )
+    def test__non_integer__raises(self, values):
+        with pytest.raises(ValueError):
+            encode_column(values, DataType.Int64)
+
+    @pytest.mark.parametrize(
+        "data_type, values",
+        [
+            (DataType.Int32, np.array([2**31], np.int64)),
+            (DataType.Int32, [-(2**31) - 1]),
+            (DataType.Int32, np.array([3e9])),
+            (DataType.Int64, np.array([2**63], np.uint64)),
+            (DataType.Int64, np.array([2.0**63])),
+            (DataType.Int64, [2**70]),
+        ],
+    )
+    def test__out_of_range__raises(self, data_type, values):
+        with pytest.raises(ValueError):
+            encode_column(values, data_type)
+
+    def test__int32_bounds__encoded(self):
+        values = [-(2**31), 2**31 - 1]
+
+        encoded = encode_column(values, DataType.Int32)
+
+        assert encoded == ["-2147483648", "2147483647"]
+
+    def test__masked_array__encodes_masked_entries_as_null(self):
+        values = np.ma.masked_array([1, 2, 3], mask=[False, True, False])
+
+        assert encode_column(values, DataType.Int64) == ["1", None, "3"]
+
+    def test__list_with_none__encodes_none_as_null(self):
+        assert encode_column([True, None, False], DataType.Bool) == [
+            "true",
+            None,
+            "false",
+        ]
+        assert encode_column([1.5, None], DataType.Float64) == ["1.5", None]
+        assert encode_column(["a", None], DataType.String) == ["a", None]
+
+    def test__objects_with_nan__encodes_nan_as_null(self):
+        values = np.array(["a", np.nan, None, np.datetime64("NaT")], dtype=object)
+
+        assert encode_column(values, DataType.String) == ["a", None, None, None]
+        assert encode_column(np.array([1, np.nan], object), DataType.Int64) == [
+            "1",
+            None,
+        ]
+
+    def test__floats_with_nan__encodes_strings_with_nan_as_null(self):
+        values = np.array([1.5, np.nan, 2.0])
+
+        assert encode_column(values, DataType.String) == ["1.5", None, "2.0"]
+
+    def test__non_strings__encoded_as_strings(self):
+        values = np.array([1, "b", True], dtype=object)
+
+        assert encode_column(values, DataType.String) == ["1", "b", "True"]
+        assert encode_column([1, 2], DataType.String) == ["1", "2"]
+
+    def test__pandas_missing_values__encoded_as_null(self):
+        pandas = pytest.importorskip("pandas")
+
+        strings = pandas.Series(["a", None, pandas.NA], dtype="string")
+        integers = pandas.Series([1, None], dtype="Int64")
+        objects = pandas.Series(["a", float("nan"), 3], dtype=object)
+
+        assert encode_column(strings, DataType.String) == ["a", None, None]
+        assert encode_column(integers, DataType.Int32) == ["1", None]
+        assert encode_column(objects, DataType.String) == ["a", None, "3"]
+
+    def test__bool_strings__encoded_ignoring_case(self):
+        values = np.array(["true", "FALSE", None, True], dtype=object)
+
+        assert encode_column(values, DataType.Bool) == ["true", "false", None, "true"]
+
+    def test__invalid_bool_string__raises(self):
+        with pytest.raises(ValueError, match="yes"):
+            encode_column(["true", "yes"], DataType.Bool)
+
+
+class TestEncodeFrame:
+    def test__columns__builds_rows_in_column_order(self):
+        frame = encode_frame(
+            {"string": np.array(["a", "b"]), "index": np.array([1, 2])}, columns
+        )
+
+        assert frame.columns == ["string", "index"]
+        assert frame.data == [["a", "1"], ["b", "2"]]
+        assert AppendTableDataRequest.construct(frame=frame).json(
+            by_alias=True, exclude_unset=True
+        ) == (
+            '{"frame": {"columns": ["string", "index"], '
+            '"data": [["a", "1"], ["b", "2"]]}}'
+        )
+
+    def test__decoded_columns__round_trip(self):
+        original = {
+            "index": ColumnArray(DataType.Int32, np.array([1, 2], np.int32)),
+            "float64": ColumnArray(
+                DataType.Float64, np.array([0.1, np.nan]), np.array([True, False])
+            ),
+            "float32": ColumnArray(DataType.Float32, np.array([np.inf, 2], np.float32)),
+            "bool": ColumnArray(DataType.Bool, np.array([True, False])),
+            "time": ColumnArray(
+                DataType.Timestamp,
+                np.array(["2022-08-19T16:17:30.123", "NaT"], "datetime64[ms]"),
+                np.array([True, False]),
+            ),
+            "string": ColumnArray(
+                DataType.String,
+                np.array(["x", None], object),
+                np.array([True, False]),
+            ),
+        }
+
+        decoded = decode_frame(encode_frame(original, columns), columns)
+
+        assert decoded == original
+
+    def test__mismatched_lengths__raises(self):
+        with pytest.raises(ValueError, match="same number"):
+            encode_frame({"index": [1, 2], "string": ["a"]}, columns)
+
+    def test__invalid_value__raises_naming_column(self):
+        with pytest.raises(ValueError, match="'bool'"):
+            encode_frame({"bool": ["maybe"]}, columns)
+
+    def test__unknown_column__raises(self):
+        with pytest.raises(ValueError, match="missing"):
+            encode_frame({"missing": [1]}, columns)
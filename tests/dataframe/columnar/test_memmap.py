@@ -0,0 +1,141 @@
+from pathlib import Path
+from typing import Iterator, List
+
+import numpy as np
+import pytest  # type: ignore
+from nisystemlink.clients.dataframe.columnar import _memmap
+from nisystemlink.clients.dataframe.columnar import (
+    ColumnArray,
+    MemmapTable,
+    spill_to_memmap,
+)
+from nisystemlink.clients.dataframe.models import Column, ColumnType, DataType
+
+COLUMNS = [
+    Column(name="index", data_type=DataType.Int64, column_type=ColumnType.Index),
+    Column(name="value", data_type=DataType.Float64, column_type=ColumnType.Nullable),
+    Column(name="label", data_type=DataType.String, column_type=ColumnType.Nullable),
+    Column(name="time", data_type=DataType.Timestamp, column_type=ColumnType.Normal),
+]
+
+
+def _batch(start: int, labels: list) -> dict:
+    count = len(labels)
+    valid = np.array([label is not None for label in labels])
+    return {
+        "index": ColumnArray(DataType.Int64, np.arange(start, start + count)),
+        "value": ColumnArray(
+            DataType.Float64,
+            np.where(valid, np.arange(count) + 0.5, np.nan),
+            valid,
+        ),
+        "label": ColumnArray(DataType.String, np.array(labels, dtype=object), valid),
+        "time": ColumnArray(
+            DataType.Timestamp,
+            np.arange(start, start + count).astype("datetime64[ms]"),
+        ),
+    }
+
+
+BATCHES = [_batch(0, ["a", None, "ünïcode"]), _batch(3, ["", "e"])]
+
+
+class TestSpillToMemmap:
+    def test__batches__columns_are_memory_mapped(self, tmp_path: Path):
+        table = spill_to_memmap(BATCHES, COLUMNS, tmp_path)
+
+        index = table.column("index")
+        value = table.column("value")
+        assert len(table) == 5
+        assert isinstance(index.values, np.memmap)
+        assert isinstance(value.valid, np.memmap)
+        assert index.valid is None
+        assert index.values.tolist() == [0, 1, 2, 3, 4]
+        assert value.valid.tolist() == [True, False, True, True, True]
+        assert table.column("time").values.dtype == np.dtype("datetime64[ms]")
+
+    def test__batches__read_returns_rows_in_range(self, tmp_path: Path):
+        table = spill_to_memmap(BATCHES, COLUMNS, tmp_path)
+
+        rows = table.read(1, 4)
+
+        assert rows["index"] == ColumnArray(DataType.Int64, np.array([1, 2, 3]))
+        assert rows["label"].values.tolist() == [None, "ünïcode", ""]
+        assert rows["label"].valid is not None
+        assert rows["label"].valid.tolist() == [False, True, True]
+        assert not isinstance(rows["value"].values, np.memmap)
+
+    def test__string_column__string_buffers_are_memory_mapped(self, tmp_path: Path):
+        table = spill_to_memmap(BATCHES, COLUMNS, tmp_path)
+
+        data, offsets = table.string_buffers("label")
+
+        assert isinstance(data, np.memmap) and isinstance(offsets, np.memmap)
+        assert offsets.tolist() == [0, 1, 1, 10, 10, 11]
+        assert data[offsets[2] : offsets[3]].tobytes().decode() == "ünïcode"
+
+    def test__written_table__can_be_opened_again(self, tmp_path: Path):
+        spill_to_memmap(BATCHES, COLUMNS, tmp_path).close()
+
+        table = MemmapTable.open(tmp_path)
+
+        assert [column.name for column in table.columns] == [
+            "index",
+            "value",
+            "label",
+            "time",
+        ]
+        with spill_to_memmap(BATCHES, COLUMNS) as expected:
+            assert table.read() == expected.read()
+
+    def test__temporary_directory__is_deleted_when_closed(self):
+        with spill_to_memmap(BATCHES, COLUMNS) as table:
+            directory = Path(table.directory)
+            assert directory.exists()
+
+        assert not directory.exists()
+
+    def test__error__closes_files_before_deleting_temporary_directory(
+        self, monkeypatch
+    ):
+        events = []  # type: List[str]
+        close = _memmap._ColumnWriter.close
+        rmtree = _memmap.shutil.rmtree
+
+        def record_close(writer: _memmap._ColumnWriter) -> None:
+            events.append("close")
+            close(writer)
+
+        def record_rmtree(path: str, ignore_errors: bool = False) -> None:
+            events.append("rmtree")
+            rmtree(path, ignore_errors)
+
+        monkeypatch.setattr(_memmap._ColumnWriter, "close", record_close)
+        monkeypatch.setattr(_memmap.shutil, "rmtree", record_rmtree)
+
+        def batches() -> Iterator[dict]:
+            yield BATCHES[0]
+            raise RuntimeError("read failed")
+
+        with pytest.raises(RuntimeError):
+            spill_to_memmap(batches(), COLUMNS)
+
+        assert events == ["close"] * len(COLUMNS) + ["rmtree"]
+
+    def test__no_batches__returns_empty_table(self, tmp_path: Path):
+        table = spill_to_memmap([], COLUMNS, tmp_path)
+
+        assert len(table) == 0
+        assert len(table.column("value")) == 0
+        assert table.read()["label"].values.tolist() == []
+
+    def test__batches_with_different_columns__raises(self, tmp_path: Path):
+        second = dict(BATCHES[1])
+        del second["label"]
+
+        with pytest.raises(ValueError, match="same columns"):
+            spill_to_memmap([BATCHES[0], second], COLUMNS, tmp_path)
+
+    def test__undefined_column__raises(self):
+        with pytest.raises(ValueError, match="not defined"):
+            spill_to_memmap(BATCHES, COLUMNS[:2])
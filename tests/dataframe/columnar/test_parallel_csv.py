@@ -0,0 +1,107 @@
+import io
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+import numpy as np
+import pytest  # type: ignore
+from nisystemlink.clients.dataframe.columnar import (
+    ColumnArray,
+    iter_csv_batches,
+    iter_csv_batches_parallel,
+)
+from nisystemlink.clients.dataframe.models import Column, ColumnType, DataType
+
+columns = [
+    Column(name="index", data_type=DataType.Int32, column_type=ColumnType.Index),
+    Column(name="value", data_type=DataType.Float64, column_type=ColumnType.Nullable),
+    Column(name="text", data_type=DataType.String, column_type=ColumnType.Nullable),
+]
+
+csv_data = (
+    '\ufeff"index","value","text"\r\n'
+    '1,1.5,"héllo"\r\n'
+    '2,,"multi\r\nline, with comma"\r\n'
+    "3,NaN,\r\n"
+    '4,-Infinity,"say ""hi"""\r\n'
+    '5,2.5,"a\nb\nc"\r\n'
+    "6,,plain"
+).encode()
+
+
+def _concatenate(batches: List[Dict[str, ColumnArray]]) -> Dict[str, list]:
+    return {
+        name: np.concatenate([batch[name].values for batch in batches]).tolist()
+        for name in batches[0]
+    }
+
+
+class TestIterCsvBatchesParallel:
+    @pytest.mark.parametrize("block_size", [1, 2, 5, 16, 40, 1024])
+    def test__any_block_size__matches_serial_parsing(self, block_size):
+        with ThreadPoolExecutor(2) as executor:
+            batches = list(
+                iter_csv_batches_parallel(
+                    io.BytesIO(csv_data), columns, block_size, 2, executor
+                )
+            )
+
+        expected = list(iter_csv_batches(io.BytesIO(csv_data), columns, 100))
+        assert list(batches[0]) == ["index", "value", "text"]
+        actual = _concatenate(batches)
+        assert actual["index"] == [1, 2, 3, 4, 5, 6]
+        assert actual["text"] == expected[0]["text"].values.tolist()
+        np.testing.assert_array_equal(
+            np.concatenate([batch["value"].valid for batch in batches]),
+            expected[0]["value"].valid,
+        )
+
+    def test__small_block_size__yields_batches_in_order(self):
+        with ThreadPoolExecutor(4) as executor:
+            batches = list(
+                iter_csv_batches_parallel(
+                    io.BytesIO(csv_data), columns, 30, 4, executor
+                )
+            )
+
+        indexes = [batch["index"].values.tolist() for batch in batches]
+        assert len(indexes) > 1
+        assert sum(indexes, []) == [1, 2, 3, 4, 5, 6]
+
+    def test__process_pool__parses_all_rows(self):
+        batches = list(iter_csv_batches_parallel(io.BytesIO(csv_data), columns, 16, 2))
+
+        assert _concatenate(batches)["index"] == [1, 2, 3, 4, 5, 6]
+
+    def test__header_only__yields_nothing(self):
+        batches = iter_csv_batches_parallel(io.BytesIO(b'"index"\r\n'), columns, 10)
+
+        assert list(batches) == []
+
+    def test__empty_stream__yields_nothing(self):
+        batches = iter_csv_batches_parallel(io.BytesIO(b""), columns, 10)
+
+        assert list(batches) == []
+
+    def test__unknown_column__raises(self):
+        batches = iter_csv_batches_parallel(
+            io.BytesIO(b'"missing"\r\n1\r\n'), columns, 10
+        )
+
+        with pytest.raises(ValueError, match="missing"):
+            list(batches)
+
+    def test__invalid_value__raises(self):
+        with ThreadPoolExecutor(1) as executor:
+            batches = iter_csv_batches_parallel(
+                io.BytesIO(b'"index"\r\n1\r\nx\r\n'), columns, 4, 1, executor
+            )
+
+            with pytest.raises(ValueError):
+                list(batches)
+
+    @pytest.mark.parametrize("block_size, max_workers", [(0, 1), (1, 0)])
+    def test__invalid_arguments__raise(self, block_size, max_workers):
+        with pytest.raises(ValueError):
+            iter_csv_batches_parallel(
+                io.BytesIO(csv_data), columns, block_size, max_workers
+            )
@@ -0,0 +1,168 @@
+import numpy as np
+import pytest  # type: ignore
+from nisystemlink.clients.dataframe.columnar import (
+    ColumnArray,
+    evaluate_filters,
+    query_columns,
+    sort_order,
+)
+from nisystemlink.clients.dataframe.models import (
+    ColumnFilter,
+    ColumnOrderBy,
+    DataType,
+    FilterOperation,
+    QueryTableDataRequest,
+)
+
+COLUMNS = {
+    "index": ColumnArray(DataType.Int32, np.array([0, 1, 2, 3, 4, 5])),
+    "value": ColumnArray(
+        DataType.Float64,
+        np.array([1.5, np.nan, np.inf, np.nan, -2.0, 1.5]),
+        np.array([True, True, True, False, True, True]),
+    ),
+    "name": ColumnArray(
+        DataType.String,
+        np.array(["alpha", "Beta", None, "gamma", "", "alphabet"], dtype=object),
+        np.array([True, True, False, True, True, True]),
+    ),
+    "time": ColumnArray(
+        DataType.Timestamp,
+        np.array([0, 1000, 2000, 3000, 4000, 5000], "datetime64[ms]"),
+    ),
+}
+
+
+def _rows(operation: FilterOperation, column: str, value) -> list:
+    mask = evaluate_filters(
+        COLUMNS, [ColumnFilter(column=column, operation=operation, value=value)]
+    )
+    return np.flatnonzero(mask).tolist()
+
+
+class TestEvaluateFilters:
+    @pytest.mark.parametrize(
+        "operation, value, expected",
+        [
+            (FilterOperation.Equals, "1.5", [0, 5]),
+            (FilterOperation.NotEquals, "1.5", [1, 2, 4]),
+            (FilterOperation.LessThan, "Infinity", [0, 4, 5]),
+            (FilterOperation.LessThanEquals, "1.5", [0, 4, 5]),
+            (FilterOperation.GreaterThan, "Infinity", [1]),
+            (FilterOperation.GreaterThanEquals, "1.5", [0, 1, 2, 5]),
+            (FilterOperation.NotEquals, "NaN", [0, 2, 4, 5]),
+            (FilterOperation.Equals, None, [3]),
+            (FilterOperation.NotEquals, None, [0, 1, 2, 4, 5]),
+        ],
+    )
+    def test__float_column__matches_like_service(self, operation, value, expected):
+        assert _rows(operation, "value", value) == expected
+
+    @pytest.mark.parametrize(
+        "operation, value, expected",
+        [
+            (FilterOperation.Equals, "alpha", [0]),
+            (FilterOperation.NotEquals, "alpha", [1, 3, 4, 5]),
+            (FilterOperation.Contains, "alpha", [0, 5]),
+            (FilterOperation.NotContains, "a", [4]),
+            (FilterOperation.Contains, "bet", [5]),
+            (FilterOperation.Equals, None, [2]),
+        ],
+    )
+    def test__string_column__matches_like_service(self, operation, value, expected):
+        assert _rows(operation, "name", value) == expected
+
+    def test__timestamp_column__compares_parsed_value(self):
+        rows = _rows(FilterOperation.GreaterThan, "time", "1970-01-01T00:00:03Z")
+
+        assert rows == [4, 5]
+
+    def test__several_filters__matches_all(self):
+        mask = evaluate_filters(
+            COLUMNS,
+            [
+                ColumnFilter(
+                    column="index", operation=FilterOperation.GreaterThan, value="0"
+                ),
+                ColumnFilter(
+                    column="name", operation=FilterOperation.Contains, value="a"
+                ),
+            ],
+        )
+
+        assert np.flatnonzero(mask).tolist() == [1, 3, 5]
+
+    @pytest.mark.parametrize(
+        "column, operation, value, error",
+        [
+            ("name", FilterOperation.LessThan, "a", "does not support"),
+            ("index", FilterOperation.Contains, "1", "does not support"),
+            ("value", FilterOperation.Equals, "NaN", "NaN"),
+            ("index", FilterOperation.LessThan, None, "null"),
+            ("index", FilterOperation.Equals, "one", "one"),
+            ("missing", FilterOperation.Equals, "1", "not in the data"),
+        ],
+    )
+    def test__invalid_filter__raises(self, column, operation, value, error):
+        with pytest.raises(ValueError, match=error):
+            _rows(operation, column, value)
+
+
+class TestSortOrder:
+    def test__ascending__puts_nan_then_nulls_last(self):
+        order = sort_order(COLUMNS, [ColumnOrderBy(column="value")])
+
+        assert order.tolist() == [4, 0, 5, 2, 1, 3]
+
+    def test__descending__puts_nulls_first(self):
+        order = sort_order(COLUMNS, [ColumnOrderBy(column="value", descending=True)])
+
+        assert order.tolist() == [3, 1, 2, 0, 5, 4]
+
+    def test__several_columns__orders_ties_by_next_column(self):
+        order = sort_order(
+            COLUMNS,
+            [
+                ColumnOrderBy(column="value"),
+                ColumnOrderBy(column="index", descending=True),
+            ],
+        )
+
+        assert order.tolist() == [4, 5, 0, 2, 1, 3]
+
+    def test__strings__orders_by_code_point(self):
+        order = sort_order(COLUMNS, [ColumnOrderBy(column="name")])
+
+        assert order.tolist() == [4, 1, 0, 5, 3, 2]
+
+
+class TestQueryColumns:
+    def test__query__filters_orders_selects_and_takes(self):
+        result = query_columns(
+            COLUMNS,
+            QueryTableDataRequest(
+                columns=["name", "index"],
+                filters=[
+                    ColumnFilter(
+                        column="value",
+                        operation=FilterOperation.NotEquals,
+                        value=None,
+                    )
+                ],
+                order_by=[ColumnOrderBy(column="name", descending=True)],
+                take=3,
+            ),
+        )
+
+        assert list(result) == ["name", "index"]
+        assert result["index"].values.tolist() == [2, 5, 0]
+        assert result["name"].values.tolist() == [None, "alphabet", "alpha"]
+
+    def test__empty_query__returns_every_row(self):
+        result = query_columns(COLUMNS, QueryTableDataRequest())
+
+        assert all(result[name] == COLUMNS[name] for name in COLUMNS)
+
+    def test__continuation_token__raises(self):
+        with pytest.raises(ValueError, match="Continuation"):
+            query_columns(COLUMNS, QueryTableDataRequest(continuation_token="token"))
@@ -0,0 +1,104 @@
+import numpy as np
+import pytest  # type: ignore
+from nisystemlink.clients.dataframe.columnar import (
+    ColumnArray,
+    ColumnStatistics,
+    TableStatistics,
+)
+from nisystemlink.clients.dataframe.models import DataType
+
+
+def _floats(values, valid=None) -> ColumnArray:
+    return ColumnArray(
+        DataType.Float64,
+        np.array(values, np.float64),
+        None if valid is None else np.array(valid),
+    )
+
+
+class TestColumnStatistics:
+    def test__batches__match_statistics_of_all_values(self):
+        rng = np.random.default_rng(0)
+        values = rng.normal(1e9, 3.0, 10000)
+        statistics = ColumnStatistics(DataType.Float64)
+
+        for batch in np.array_split(values, 7):
+            statistics.update(_floats(batch))
+
+        assert statistics.count == 10000
+        assert statistics.minimum == values.min()
+        assert statistics.maximum == values.max()
+        assert statistics.mean == pytest.approx(values.mean(), rel=1e-15)
+        # A sum of squares would lose every digit of a variance this small relative
+        # to the mean.
+        assert statistics.variance == pytest.approx(values.var(ddof=1), rel=1e-6)
+        assert statistics.stddev == pytest.approx(values.std(ddof=1), rel=1e-6)
+
+    def test__nulls_and_nan__are_counted_but_not_measured(self):
+        statistics = ColumnStatistics(DataType.Float64)
+
+        statistics.update(_floats([1.0, np.nan, 0.0, 3.0], [True, True, False, True]))
+
+        assert statistics.count == 3
+        assert statistics.null_count == 1
+        assert statistics.nan_count == 1
+        assert (statistics.minimum, statistics.maximum) == (1.0, 3.0)
+        assert statistics.mean == 2.0
+
+    def test__string_column__has_range_but_no_mean(self):
+        statistics = ColumnStatistics(DataType.String)
+
+        statistics.update(
+            ColumnArray(DataType.String, np.array(["b", "a", "c"], dtype=object))
+        )
+
+        assert (statistics.minimum, statistics.maximum) == ("a", "c")
+        assert statistics.mean is None and statistics.stddev is None
+
+    def test__bool_column__mean_is_fraction_true(self):
+        statistics = ColumnStatistics(DataType.Bool)
+
+        statistics.update(
+            ColumnArray(DataType.Bool, np.array([True, False, True, True]))
+        )
+
+        assert statistics.mean == 0.75
+
+    def test__no_values__statistics_are_empty(self):
+        statistics = ColumnStatistics(DataType.Int32)
+
+        statistics.update(
+            ColumnArray(DataType.Int32, np.zeros(2, np.int32), np.zeros(2, bool))
+        )
+
+        assert statistics.count == 0 and statistics.null_count == 2
+        assert statistics.minimum is None and statistics.mean is None
+
+    def test__merge__combines_statistics_of_parts(self):
+        first = ColumnStatistics(DataType.Int64)
+        first.update(ColumnArray(DataType.Int64, np.array([1, 2, 3])))
+        second = ColumnStatistics(DataType.Int64)
+        second.update(ColumnArray(DataType.Int64, np.array([10, 20])))
+
+        first.merge(second)
+
+        assert first.count == 5
+        assert (first.minimum, first.maximum) == (1, 20)
+        assert first.mean == pytest.approx(7.2)
+        assert first.variance == pytest.approx(np.var([1, 2, 3, 10, 20], ddof=1))
+
+    def test__different_data_type__raises(self):
+        with pytest.raises(ValueError):
+            ColumnStatistics(DataType.Int32).update(_floats([1.0]))
+
+
+class TestTableStatistics:
+    def test__track__updates_statistics_as_batches_pass_through(self):
+        statistics = TableStatistics()
+        batches = [{"value": _floats([1.0, 2.0])}, {"value": _floats([3.0])}]
+
+        passed = list(statistics.track(batches))
+
+        assert passed == batches
+        assert statistics.row_count == 3
+        assert statistics.columns["value"].mean == 2.0
@@ -0,0 +1,124 @@
+import numpy as np
+import pytest  # type: ignore
+from nisystemlink.clients.dataframe.columnar import (
+    format_timestamps,
+    parse_timestamps,
+)
+
+
+def _random_timestamps(count: int) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    # Between the years 1000 and 8000, including times before 1970.
+    milliseconds = rng.integers(-30000000000000, 190000000000000, count)
+    return milliseconds.astype("datetime64[ms]")
+
+
+class TestParseTimestamps:
+    def test__service_format__matches_numpy(self):
+        values = _random_timestamps(10000)
+        cells = np.datetime_as_string(values, unit="ms", timezone="UTC").tolist()
+
+        parsed = parse_timestamps(cells)
+
+        assert parsed.dtype == np.dtype("datetime64[ms]")
+        np.testing.assert_array_equal(parsed, values)
+
+    def test__calendar_edges__parsed(self):
+        cells = [
+            "1969-12-31T23:59:59.999Z",
+            "1970-01-01T00:00:00.000Z",
+            "2000-02-29T12:00:00.001Z",
+            "0000-01-01T00:00:00.000Z",
+            "9999-12-31T23:59:59.999Z",
+        ]
+
+        parsed = parse_timestamps(cells)
+
+        expected = np.array([cell[:-1] for cell in cells], "datetime64[ms]")
+        np.testing.assert_array_equal(parsed, expected)
+
+    def test__other_formats__parsed_by_fallback(self):
+        cells = [
+            "2022-08-19T16:17:30.123Z",
+            "NaT",
+            "2022-08-19T16:17:30Z",
+            "2022-08-19T17:17:30.5+01:00",
+            "2022-08-19",
+        ]
+
+        parsed = parse_timestamps(np.array(cells, dtype=object))
+
+        expected = np.array(
+            [
+                "2022-08-19T16:17:30.123",
+                "NaT",
+                "2022-08-19T16:17:30.000",
+                "2022-08-19T16:17:30.500",
+                "2022-08-19T00:00:00.000",
+            ],
+            "datetime64[ms]",
+        )
+        np.testing.assert_array_equal(parsed, expected)
+
+    @pytest.mark.parametrize(
+        "cell",
+        [
+            "2023-02-29T00:00:00.000Z",
+            "2022-13-01T00:00:00.000Z",
+            "2022-01-01T24:00:00.000Z",
+            "2022-01-01T00:60:00.000Z",
+            "2022-01-01T00:00:60.000Z",
+            "2022-01-0aT00:00:00.000Z",
+            "not a timestamp at all!!",
+        ],
+    )
+    def test__invalid_value__raises(self, cell: str):
+        with pytest.raises(ValueError):
+            parse_timestamps(["2022-01-01T00:00:00.000Z", cell])
+
+    def test__empty__returns_empty_array(self):
+        parsed = parse_timestamps([])
+
+        assert parsed.dtype == np.dtype("datetime64[ms]")
+        assert len(parsed) == 0
+
+
+class TestFormatTimestamps:
+    def test__timestamps__match_numpy(self):
+        values = _random_timestamps(10000)
+
+        formatted = format_timestamps(values)
+
+        expected = np.datetime_as_string(values, unit="ms", timezone="UTC")
+        np.testing.assert_array_equal(formatted, expected)
+
+    def test__nat__formatted_as_nat(self):
+        values = np.array(["2022-08-19T16:17:30.123", "NaT"], "datetime64[ms]")
+
+        formatted = format_timestamps(values)
+
+        assert formatted.tolist() == ["2022-08-19T16:17:30.123Z", "NaT"]
+
+    def test__other_units__converted_to_milliseconds(self):
+        values = np.array(["2022-08-19T16:17:30.123456"], "datetime64[us]")
+
+        formatted = format_timestamps(values)
+
+        assert formatted.tolist() == ["2022-08-19T16:17:30.123Z"]
+
+    def test__year_outside_four_digits__formatted_by_numpy(self):
+        values = np.array(["10000-01-01", "2022-08-19"], "datetime64[ms]")
+
+        formatted = format_timestamps(values)
+
+        assert formatted.tolist() == [
+            "10000-01-01T00:00:00.000Z",
+            "2022-08-19T00:00:00.000Z",
+        ]
+
+    def test__round_trip__preserves_values(self):
+        values = _random_timestamps(1000)
+
+        np.testing.assert_array_equal(
+            parse_timestamps(format_timestamps(values)), values
+        )
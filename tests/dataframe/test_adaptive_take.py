@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+from typing import List
+
+import pytest  # type: ignore
+from nisystemlink.clients.dataframe import AdaptiveTake, PageMeasurement
+
+
+class TestAdaptiveTake:
+    def test__slow_pages__shrinks_take_toward_target(self):
+        controller = AdaptiveTake(initial=1000, minimum=10, target_seconds=1.0)
+
+        controller.record(1000, 1000, 2.0, 50000)
+
+        assert controller.take == 500
+
+    def test__fast_pages__grows_take_at_most_double(self):
+        controller = AdaptiveTake(initial=1000, target_seconds=1.0)
+
+        controller.record(1000, 1000, 0.01, 50000)
+
+        assert controller.take == 2000
+
+    def test__very_slow_page__shrinks_take_at_most_by_four(self):
+        controller = AdaptiveTake(initial=1000, minimum=10, target_seconds=1.0)
+
+        controller.record(1000, 1000, 60.0, 50000)
+
+        assert controller.take == 250
+
+    def test__take__stays_within_bounds(self):
+        controller = AdaptiveTake(initial=500, minimum=400, maximum=600)
+
+        controller.record(500, 500, 0.01, 1000)
+        assert controller.take == 600
+        controller.record(600, 600, 100.0, 1000)
+        assert controller.take == 400
+
+    def test__max_bytes__limits_take_by_row_size(self):
+        controller = AdaptiveTake(initial=1000, max_bytes=100000)
+
+        controller.record(1000, 1000, 0.01, 200000)
+
+        assert controller.take == 500
+
+    def test__partial_page__keeps_take(self):
+        controller = AdaptiveTake(initial=1000)
+
+        controller.record(1000, 10, 0.01, 100)
+
+        assert controller.take == 1000
+
+    def test__pages__are_recorded_and_reported(self):
+        reported = []  # type: List[PageMeasurement]
+        controller = AdaptiveTake(initial=1000, on_page=reported.append)
+
+        controller.record(1000, 1000, 0.5, 2000)
+
+        assert reported == controller.pages
+        assert (reported[0].take, reported[0].rows, reported[0].size) == (
+            1000,
+            1000,
+            2000,
+        )
+
+    @pytest.mark.parametrize(
+        "arguments",
+        [
+            {"minimum": 0},
+            {"initial": 50, "minimum": 100},
+            {"initial": 500, "maximum": 100},
+            {"target_seconds": 0},
+            {"max_bytes": 0},
+        ],
+    )
+    def test__invalid_arguments__raises(self, arguments):
+        with pytest.raises(ValueError):
+            AdaptiveTake(**arguments)
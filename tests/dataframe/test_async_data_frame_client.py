@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+import json
+from typing import Callable, List
+
+import httpx
+import pytest  # type: ignore
+from nisystemlink.clients.core import ApiException, HttpConfiguration
+from nisystemlink.clients.dataframe import AsyncDataFrameClient
+from nisystemlink.clients.dataframe.models import (
+    AppendTableDataRequest,
+    DataFrame,
+    ExportFormat,
+    ExportTableDataRequest,
+    QueryTableDataRequest,
+)
+
+from .test_data_frame_client import _page, _table_metadata
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+
+def _create_client(
+    handler: Handler, requests: List[httpx.Request]
+) -> AsyncDataFrameClient:
+    def record(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return handler(request)
+
+    client = AsyncDataFrameClient(HttpConfiguration("http://localhost:9090", "api-key"))
+    client._http_client._kwargs["transport"] = httpx.MockTransport(record)
+    return client
+
+
+class TestAsyncDataFrameClient:
+    @pytest.mark.asyncio
+    async def test__list_tables__sends_query_parameters(self):
+        requests = []  # type: List[httpx.Request]
+        client = _create_client(
+            lambda _: httpx.Response(200, json={"tables": [_table_metadata()]}),
+            requests,
+        )
+
+        async with client:
+            result = await client.list_tables(
+                take=2, id=["a", "b"], order_by="NAME", order_by_descending=True
+            )
+
+        assert [table.id for table in result.tables] == ["table-id"]
+        assert requests[0].method == "GET"
+        assert requests[0].url.path == "/nidataframe/v1/tables"
+        assert requests[0].url.params.multi_items() == [
+            ("take", "2"),
+            ("id", "a"),
+            ("id", "b"),
+            ("orderBy", "NAME"),
+            ("orderByDescending", "true"),
+        ]
+        assert requests[0].headers["x-ni-api-key"] == "api-key"
+
+    @pytest.mark.asyncio
+    async def test__query_table_data__posts_query_and_parses_rows(self):
+        requests = []  # type: List[httpx.Request]
+        client = _create_client(
+            lambda _: httpx.Response(200, json=_page([["1", "2.5"]], "token")),
+            requests,
+        )
+
+        async with client:
+            result = await client.query_table_data(
+                "table-id", QueryTableDataRequest(take=1)
+            )
+
+        assert result.frame.data == [["1", "2.5"]]
+        assert result.continuation_token == "token"
+        assert requests[0].url.path == "/nidataframe/v1/tables/table-id/query-data"
+        assert json.loads(requests[0].content) == {"take": 1}
+        assert requests[0].headers["content-type"] == "application/json"
+
+    @pytest.mark.asyncio
+    async def test__follow_table__reads_rows_after_last_index(self):
+        requests = []  # type: List[httpx.Request]
+        polls = []  # type: List[bool]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.method == "GET":
+                polls.append(True)
+                return httpx.Response(
+                    200,
+                    json=dict(
+                        _table_metadata(),
+                        rowsModifiedAt="2023-01-0{}T00:00:00Z".format(len(polls)),
+                        supportsAppend=len(polls) < 2,
+                    ),
+                )
+            return httpx.Response(200, json=_page([[str(len(polls)), "1.5"]]))
+
+        client = _create_client(handler, requests)
+
+        async with client:
+            pages = [page async for page in client.follow_table("table-id", None, 0)]
+
+        assert [page.frame.data for page in pages] == [[["1", "1.5"]], [["2", "1.5"]]]
+        assert json.loads(requests[3].content)["filters"] == [
+            {"column": "index", "operation": "GREATER_THAN", "value": "1"}
+        ]
+
+    @pytest.mark.asyncio
+    async def test__trusted__query_table_data__skips_cell_validation(self):
+        client = _create_client(
+            lambda _: httpx.Response(
+                200, json={"frame": {"data": [[1]]}, "totalRowCount": 1}
+            ),
+            [],
+        )
+
+        async with client:
+            result = await client.query_table_data(
+                "table-id", QueryTableDataRequest(), trusted=True
+            )
+
+        assert result.frame.data == [[1]]
+        assert result.total_row_count == 1
+
+    @pytest.mark.asyncio
+    async def test__append_table_data__posts_frame(self):
+        requests = []  # type: List[httpx.Request]
+        client = _create_client(lambda _: httpx.Response(204), requests)
+
+        async with client:
+            await client.append_table_data(
+                "table-id",
+                AppendTableDataRequest(
+                    frame=DataFrame(columns=["index"], data=[["1"]]), end_of_data=True
+                ),
+            )
+
+        assert json.loads(requests[0].content) == {
+            "frame": {"columns": ["index"], "data": [["1"]]},
+            "endOfData": True,
+        }
+
+    @pytest.mark.asyncio
+    async def test__delete_tables_all_succeed__returns_none(self):
+        requests = []  # type: List[httpx.Request]
+        client = _create_client(lambda _: httpx.Response(204), requests)
+
+        async with client:
+            result = await client.delete_tables(["a", "b"])
+
+        assert result is None
+        assert json.loads(requests[0].content) == {"ids": ["a", "b"]}
+
+    @pytest.mark.asyncio
+    async def test__error_response__raises_api_exception(self):
+        client = _create_client(
+            lambda _: httpx.Response(
+                404, json={"error": {"name": "Skyline.NotFound", "message": "gone"}}
+            ),
+            [],
+        )
+
+        async with client:
+            with pytest.raises(ApiException) as exception:
+                await client.get_table_metadata("table-id")
+
+        assert exception.value.http_status_code == 404
+
+    @pytest.mark.asyncio
+    async def test__export_table_data__streams_content(self):
+        requests = []  # type: List[httpx.Request]
+        client = _create_client(
+            lambda _: httpx.Response(200, content=b"index,value\r\n1,2.5\r\n"),
+            requests,
+        )
+
+        async with client:
+            stream = await client.export_table_data(
+                "table-id", ExportTableDataRequest(response_format=ExportFormat.CSV)
+            )
+            async with stream:
+                data = await stream.read()
+
+        assert data == b"index,value\r\n1,2.5\r\n"
+        assert stream.closed
+        assert requests[0].url.path == "/nidataframe/v1/tables/table-id/export-data"
+        assert json.loads(requests[0].content) == {"responseFormat": "CSV"}
+
+    @pytest.mark.asyncio
+    async def test__export_table_data_error__raises_api_exception(self):
+        client = _create_client(lambda _: httpx.Response(400, text="bad"), [])
+
+        async with client:
+            with pytest.raises(ApiException) as exception:
+                await client.export_table_data(
+                    "table-id",
+                    ExportTableDataRequest(response_format=ExportFormat.CSV),
+                )
+
+        assert exception.value.http_status_code == 400
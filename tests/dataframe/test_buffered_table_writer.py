@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+from datetime import timedelta
+from typing import Any, Dict, List
+from unittest.mock import Mock, PropertyMock
+
+import pytest  # type: ignore
+from nisystemlink.clients.core import ApiException, HttpConfiguration
+from nisystemlink.clients.core._internal._manual_reset_timer import ManualResetTimer
+from nisystemlink.clients.dataframe import BufferedTableWriter, DataFrameClient
+
+from ..core.mock_manualresettimer import MockManualResetTimer
+
+
+def _sent_requests(client: Mock) -> List[Dict[str, Any]]:
+    return [
+        call[0][1].dict(by_alias=True, exclude_unset=True)
+        for call in client.append_table_data.call_args_list
+    ]
+
+
+class TestBufferedTableWriter:
+    def setup_method(self, method):
+        self._client = Mock(DataFrameClient)
+
+    def _create_writer(self, buffer_rows: int, timer: Any) -> BufferedTableWriter:
+        return BufferedTableWriter(
+            self._client, "table-id", buffer_rows, timer, columns=["index", "value"]
+        )
+
+    def test__rows_written__send_buffered_writes__sends_rows_in_one_request(self):
+        writer = self._create_writer(10, ManualResetTimer.null_timer)
+
+        writer.write(["1", "2.5"])
+        writer.write_rows([["2", None], ["3", "7.5"]])
+        writer.send_buffered_writes()
+
+        self._client.append_table_data.assert_called_once()
+        assert self._client.append_table_data.call_args[0][0] == "table-id"
+        assert _sent_requests(self._client) == [
+            {
+                "frame": {
+                    "columns": ["index", "value"],
+                    "data": [["1", "2.5"], ["2", None], ["3", "7.5"]],
+                }
+            }
+        ]
+
+    def test__nothing_buffered__send_buffered_writes__sends_nothing(self):
+        writer = self._create_writer(10, ManualResetTimer.null_timer)
+
+        writer.send_buffered_writes()
+
+        self._client.append_table_data.assert_not_called()
+
+    def test__buffer_rows_reached__write__sends_rows(self):
+        writer = self._create_writer(2, ManualResetTimer.null_timer)
+
+        writer.write(["1", "2.5"])
+        self._client.append_table_data.assert_not_called()
+        writer.write(["2", "5.0"])
+
+        assert _sent_requests(self._client)[0]["frame"]["data"] == [
+            ["1", "2.5"],
+            ["2", "5.0"],
+        ]
+
+    def test__rows_buffered__clear_buffered_writes__rows_discarded(self):
+        writer = self._create_writer(10, ManualResetTimer.null_timer)
+
+        writer.write(["1", "2.5"])
+        writer.clear_buffered_writes()
+        writer.send_buffered_writes()
+
+        self._client.append_table_data.assert_not_called()
+
+    def test__rows_buffered__flush_timer_elapsed__rows_sent(self):
+        timer = MockManualResetTimer()
+        type(timer).can_start = PropertyMock(return_value=True)
+        writer = self._create_writer(10, timer)
+
+        writer.write(["1", "2.5"])
+        timer.start.assert_called_once_with()
+        for handler in list(timer.elapsed):
+            handler()
+
+        assert _sent_requests(self._client)[0]["frame"]["data"] == [["1", "2.5"]]
+
+    def test__send_buffered_writes_already_called__original_flush_timer_elapsed__rows_not_sent(
+        self,
+    ):
+        timer = MockManualResetTimer()
+        type(timer).can_start = PropertyMock(return_value=True)
+        writer = self._create_writer(10, timer)
+
+        writer.write(["1", "2.5"])
+        elapsed_handlers = list(timer.elapsed)
+        writer.send_buffered_writes()
+        writer.write(["2", "5.0"])
+        for handler in elapsed_handlers:
+            handler()
+
+        assert self._client.append_table_data.call_count == 1
+
+    def test__flush_timer_send_fails__write__raises_send_error(self):
+        timer = MockManualResetTimer()
+        type(timer).can_start = PropertyMock(return_value=True)
+        writer = self._create_writer(10, timer)
+        error = ApiException("failed")
+        self._client.append_table_data.side_effect = error
+
+        writer.write(["1", "2.5"])
+        for handler in list(timer.elapsed):
+            handler()
+        self._client.append_table_data.side_effect = None
+
+        with pytest.raises(ApiException) as exception:
+            writer.write(["2", "5.0"])
+        assert exception.value is error
+
+    def test__rows_buffered__close__sends_rows_with_end_of_data(self):
+        with self._create_writer(10, ManualResetTimer.null_timer) as writer:
+            writer.write(["1", "2.5"])
+
+        assert writer.closed
+        assert _sent_requests(self._client) == [
+            {
+                "frame": {"columns": ["index", "value"], "data": [["1", "2.5"]]},
+                "endOfData": True,
+            }
+        ]
+
+    def test__nothing_buffered__close__sends_end_of_data(self):
+        writer = self._create_writer(10, ManualResetTimer.null_timer)
+
+        writer.close()
+        writer.close()
+
+        assert _sent_requests(self._client) == [{"endOfData": True}]
+
+    def test__end_of_data_disabled__close__sends_only_rows(self):
+        writer = BufferedTableWriter(
+            self._client,
+            "table-id",
+            10,
+            ManualResetTimer.null_timer,
+            end_of_data=False,
+        )
+
+        writer.write(["1", "2.5"])
+        writer.close()
+
+        assert _sent_requests(self._client) == [{"frame": {"data": [["1", "2.5"]]}}]
+
+    def test__flush_timer_send_failed__close__raises_without_end_of_data(self):
+        timer = MockManualResetTimer()
+        type(timer).can_start = PropertyMock(return_value=True)
+        writer = self._create_writer(10, timer)
+        self._client.append_table_data.side_effect = ApiException("failed")
+        writer.write(["1", "2.5"])
+        for handler in list(timer.elapsed):
+            handler()
+        self._client.append_table_data.side_effect = None
+
+        with pytest.raises(ApiException):
+            writer.close()
+
+        assert self._client.append_table_data.call_count == 1
+
+    def test__writer_closed__write__raises(self):
+        writer = self._create_writer(10, ManualResetTimer.null_timer)
+        writer.close()
+
+        with pytest.raises(ReferenceError):
+            writer.write(["1", "2.5"])
+
+
+class TestCreateWriter:
+    def test__no_limits__create_writer__raises(self):
+        client = DataFrameClient(HttpConfiguration("http://localhost:9090", "api-key"))
+
+        with pytest.raises(ValueError):
+            client.create_writer("table-id")
+
+    def test__buffer_rows_zero__create_writer__raises(self):
+        client = DataFrameClient(HttpConfiguration("http://localhost:9090", "api-key"))
+
+        with pytest.raises(ValueError):
+            client.create_writer("table-id", buffer_rows=0)
+
+    def test__max_buffer_time__create_writer__returns_writer(self):
+        client = DataFrameClient(HttpConfiguration("http://localhost:9090", "api-key"))
+
+        writer = client.create_writer(
+            "table-id", buffer_rows=5, max_buffer_time=timedelta(seconds=1)
+        )
+
+        assert isinstance(writer, BufferedTableWriter)
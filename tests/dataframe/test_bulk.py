@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+import json
+import threading
+from typing import List
+
+import pytest  # type: ignore
+from nisystemlink.clients.dataframe._bulk import (
+    _json_size,
+    run_concurrently,
+    split_rows,
+)
+
+
+class TestSplitRows:
+    def test__max_rows__split_rows__limits_rows_per_chunk(self):
+        rows = [[str(i)] for i in range(5)]
+
+        chunks = list(split_rows(rows, max_rows=2, max_bytes=1000))
+
+        assert chunks == [[["0"], ["1"]], [["2"], ["3"]], [["4"]]]
+
+    def test__max_bytes__split_rows__limits_json_size_of_chunk(self):
+        rows = [["1", "abc"], ["2", None], ["3", "de"]]
+        sizes = [len(json.dumps(row)) for row in rows]
+
+        chunks = list(split_rows(rows, max_rows=10, max_bytes=sizes[0] + sizes[1]))
+
+        assert chunks == [rows[:2], rows[2:]]
+
+    @pytest.mark.parametrize("row", [['a"b', None], ["c\\d"], ["é", "1.5"], ["\n"]])
+    def test__row__json_size__matches_encoded_size_with_separator(self, row):
+        # Each row is followed by a comma when it is part of a data frame.
+        assert _json_size(row) == len(json.dumps(row, separators=(",", ":"))) + 1
+
+    def test__row_larger_than_max_bytes__split_rows__sends_row_alone(self):
+        rows = [["a"], ["b" * 100], ["c"]]
+
+        chunks = list(split_rows(rows, max_rows=10, max_bytes=20))
+
+        assert chunks == [[["a"]], [["b" * 100]], [["c"]]]
+
+    def test__no_rows__split_rows__returns_no_chunks(self):
+        assert list(split_rows([], max_rows=10, max_bytes=100)) == []
+
+
+class TestRunConcurrently:
+    def test__items__run_concurrently__calls_func_for_each_item(self):
+        results = []  # type: List[int]
+        lock = threading.Lock()
+
+        def record(item: int) -> None:
+            with lock:
+                results.append(item)
+
+        run_concurrently(record, range(100), max_workers=4)
+
+        assert sorted(results) == list(range(100))
+
+    def test__func_raises__run_concurrently__stops_consuming_and_raises(self):
+        consumed = []  # type: List[int]
+
+        def items():
+            for i in range(1000):
+                consumed.append(i)
+                yield i
+
+        def fail(item: int) -> None:
+            if item == 3:
+                raise RuntimeError("failed")
+
+        with pytest.raises(RuntimeError):
+            run_concurrently(fail, items(), max_workers=2)
+
+        assert len(consumed) < 1000
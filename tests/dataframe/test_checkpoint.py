@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+import json
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+import pytest  # type: ignore
+from nisystemlink.clients.core.helpers import IteratorFileLike
+from nisystemlink.clients.dataframe._checkpoint import (
+    _split_rows,
+    CheckpointFile,
+    export_to_file,
+    iter_checkpointed,
+)
+from nisystemlink.clients.dataframe.models import (
+    Column,
+    ColumnFilter,
+    ColumnOrderBy,
+    ColumnType,
+    DataFrame,
+    DataType,
+    ExportFormat,
+    ExportTableDataRequest,
+    FilterOperation,
+    PagedTableRows,
+)
+from requests import ConnectionError
+
+INDEX = Column(name="index", data_type=DataType.Int32, column_type=ColumnType.Index)
+HEADER = b'"index","value"\r\n'
+ROWS = [b'1,"a"\r\n', b'2,"multi\r\nline"\r\n', b"3,\r\n", b'4,"d"']
+
+
+class _FakeExport:
+    """Serves an export of ROWS in small chunks, starting after the index value of the
+    last filter and optionally failing partway through.
+    """
+
+    def __init__(self, fail_after: List[int], header: bytes = HEADER) -> None:
+        self.fail_after = fail_after
+        self.header = header
+        self.queries = []  # type: List[ExportTableDataRequest]
+
+    def __call__(self, query: ExportTableDataRequest) -> IteratorFileLike:
+        self.queries.append(query)
+        after = int(query.filters[-1].value or 0) if query.filters else 0
+        content = self.header + b"".join(ROWS[after:])
+        fail_after = self.fail_after.pop(0) if self.fail_after else None
+        return IteratorFileLike(self._chunks(content, fail_after))
+
+    def _chunks(self, content: bytes, fail_after: Optional[int]) -> Iterator[bytes]:
+        for start in range(0, len(content), 5):
+            if fail_after is not None and start >= fail_after:
+                raise ConnectionError("connection reset")
+            yield content[start : start + 5]
+
+
+def _query() -> ExportTableDataRequest:
+    return ExportTableDataRequest(response_format=ExportFormat.CSV)
+
+
+def _checkpoint(tmp_path: Path) -> CheckpointFile:
+    return CheckpointFile(tmp_path / "export.checkpoint", {"table": "table-id"})
+
+
+class TestExportToFile:
+    def test__export__writes_every_row_and_removes_checkpoint(self, tmp_path: Path):
+        export = _FakeExport([])
+        output = tmp_path / "export.csv"
+        checkpoint = _checkpoint(tmp_path)
+
+        rows = export_to_file(export, INDEX, _query(), output, checkpoint, 0)
+
+        assert rows == 4
+        assert output.read_bytes() == HEADER + b"".join(ROWS)
+        assert checkpoint.load() is None
+        assert export.queries[0].order_by == [ColumnOrderBy(column="index")]
+
+    def test__network_error__resumes_after_last_complete_row(self, tmp_path: Path):
+        # Fails partway through the multi-line row, and then just after it.
+        export = _FakeExport([len(HEADER) + 15, len(HEADER) + len(ROWS[1])])
+        output = tmp_path / "export.csv"
+
+        rows = export_to_file(export, INDEX, _query(), output, _checkpoint(tmp_path), 2)
+
+        assert rows == 4
+        assert output.read_bytes() == HEADER + b"".join(ROWS)
+        assert [query.filters for query in export.queries[1:]] == [
+            [_greater_than("1")],
+            [_greater_than("2")],
+        ]
+
+    def test__retries_exhausted__raises_and_next_export_resumes(self, tmp_path: Path):
+        output = tmp_path / "export.csv"
+        checkpoint = _checkpoint(tmp_path)
+
+        with pytest.raises(ConnectionError):
+            export_to_file(
+                _FakeExport([len(HEADER) + 10]), INDEX, _query(), output, checkpoint, 0
+            )
+        assert checkpoint.load() == {
+            "offset": len(HEADER) + len(ROWS[0]),
+            "lastIndex": "1",
+            "rows": 1,
+        }
+
+        export = _FakeExport([])
+        rows = export_to_file(export, INDEX, _query(), output, checkpoint, 0)
+
+        assert rows == 4
+        assert output.read_bytes() == HEADER + b"".join(ROWS)
+        assert export.queries[0].filters == [_greater_than("1")]
+
+    def test__header_with_byte_order_mark__resumes_export(self, tmp_path: Path):
+        header = b"\xef\xbb\xbf" + HEADER
+        export = _FakeExport([len(header) + 10], header)
+        output = tmp_path / "export.csv"
+
+        rows = export_to_file(export, INDEX, _query(), output, _checkpoint(tmp_path), 1)
+
+        assert rows == 4
+        assert output.read_bytes() == header + b"".join(ROWS)
+        assert export.queries[1].filters == [_greater_than("1")]
+
+    def test__checkpoint_for_other_operation__raises(self, tmp_path: Path):
+        CheckpointFile(tmp_path / "export.checkpoint", {"table": "other"}).save({})
+
+        with pytest.raises(ValueError, match="different table"):
+            export_to_file(
+                _FakeExport([]),
+                INDEX,
+                _query(),
+                tmp_path / "export.csv",
+                _checkpoint(tmp_path),
+                0,
+            )
+
+    @pytest.mark.parametrize(
+        "query, error",
+        [
+            (
+                ExportTableDataRequest(
+                    response_format=ExportFormat.CSV, columns=["value"]
+                ),
+                "include the index",
+            ),
+            (
+                ExportTableDataRequest(
+                    response_format=ExportFormat.CSV,
+                    order_by=[ColumnOrderBy(column="index", descending=True)],
+                ),
+                "ascending",
+            ),
+            (
+                ExportTableDataRequest(
+                    response_format=ExportFormat.CSV,
+                    order_by=[ColumnOrderBy(column="value")],
+                ),
+                "ordered by the index",
+            ),
+        ],
+    )
+    def test__query_not_resumable__raises(
+        self, tmp_path: Path, query: ExportTableDataRequest, error: str
+    ):
+        with pytest.raises(ValueError, match=error):
+            export_to_file(
+                _FakeExport([]),
+                INDEX,
+                query,
+                tmp_path / "export.csv",
+                _checkpoint(tmp_path),
+                0,
+            )
+
+    def test__quoted_newline__split_rows__keeps_row_together(self):
+        rows, end = _split_rows(b'1,"a\nb"\n2,"c\nd')
+
+        assert rows == [b'1,"a\nb"\n']
+        assert end == 8
+
+
+class TestIterCheckpointed:
+    def _pages(self, token: Optional[str]) -> Iterator[PagedTableRows]:
+        tokens = ["first", "second", None]
+        start = 0 if token is None else tokens.index(token) + 1
+        for number in range(start, len(tokens)):
+            yield PagedTableRows(
+                frame=DataFrame(columns=["index"], data=[[str(number)]]),
+                total_row_count=3,
+                continuation_token=tokens[number],
+            )
+
+    def test__stopped_early__resumes_from_unfinished_page(self, tmp_path: Path):
+        checkpoint = _checkpoint(tmp_path)
+        pages = iter_checkpointed(self._pages, None, checkpoint)
+        next(pages)
+        next(pages)
+
+        assert checkpoint.load() == {"continuationToken": "first"}
+        resumed = iter_checkpointed(self._pages, None, checkpoint)
+        assert [page.frame.data for page in resumed] == [[["1"]], [["2"]]]
+        assert checkpoint.load() is None
+
+    def test__saved_checkpoint__is_atomic_json(self, tmp_path: Path):
+        checkpoint = _checkpoint(tmp_path)
+        checkpoint.save({"continuationToken": "token"})
+
+        assert json.loads((tmp_path / "export.checkpoint").read_text()) == {
+            "operation": {"table": "table-id"},
+            "progress": {"continuationToken": "token"},
+        }
+        assert list(tmp_path.iterdir()) == [tmp_path / "export.checkpoint"]
+
+
+def _greater_than(value: str) -> ColumnFilter:
+    return ColumnFilter(
+        column="index", operation=FilterOperation.GreaterThan, value=value
+    )
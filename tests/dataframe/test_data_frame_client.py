@@ -0,0 +1,908 @@
+# -*- coding: utf-8 -*-
+import json
+from pathlib import Path
+from typing import Any, cast, Dict, Generator, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pyarrow
+import pyarrow.parquet
+import pytest  # type: ignore
+import responses
+from nisystemlink.clients.core import ApiException, HttpConfiguration
+from nisystemlink.clients.core.helpers import IteratorFileLike
+from nisystemlink.clients.dataframe import (
+    AdaptiveTake,
+    DataFrameClient,
+    TableMetadataCache,
+)
+from nisystemlink.clients.dataframe.models import (
+    AppendTableDataRequest,
+    DataFrame,
+    ExportFormat,
+    ExportTableDataRequest,
+    ModifyTableRequest,
+    ModifyTablesRequest,
+    PagedTableRows,
+    QueryDecimatedDataRequest,
+    QueryTableDataRequest,
+    QueryTablesRequest,
+    TableMetadataModification,
+)
+from requests import ConnectionError
+from responses import matchers
+
+
+@pytest.fixture
+def client() -> DataFrameClient:
+    """Fixture to create a DataFrameClient instance against a mocked server."""
+    return DataFrameClient(HttpConfiguration("http://localhost:9090", "api-key"))
+
+
+def _page(
+    data: List[List[Optional[str]]], token: Optional[str] = None
+) -> Dict[str, Any]:
+    return {
+        "frame": {"columns": ["index", "value"], "data": data},
+        "totalRowCount": 3,
+        "continuationToken": token,
+    }
+
+
+def _table_metadata(id: str = "table-id") -> Dict[str, Any]:
+    return {
+        "columns": [
+            {"name": "index", "dataType": "INT64", "columnType": "INDEX"},
+            {"name": "value", "dataType": "FLOAT64", "columnType": "NULLABLE"},
+        ],
+        "createdAt": "2023-01-01T00:00:00Z",
+        "id": id,
+        "metadataModifiedAt": "2023-01-01T00:00:00Z",
+        "metadataRevision": 1,
+        "name": "Test table",
+        "properties": {},
+        "rowCount": 3,
+        "rowsModifiedAt": "2023-01-01T00:00:00Z",
+        "supportsAppend": True,
+        "workspace": "workspace-id",
+    }
+
+
+class TestDataFrameClient:
+    @responses.activate
+    @pytest.mark.parametrize("prefetch", [0, 1])
+    def test__iter_query_table_data__follows_continuation_tokens(
+        self, client: DataFrameClient, prefetch: int
+    ):
+        url = f"{client.session.base_url}tables/table-id/query-data"
+        responses.post(
+            url,
+            json=_page([["1", "1.5"], ["2", "2.5"]], "token"),
+            match=[matchers.json_params_matcher({"take": 2})],
+        )
+        responses.post(
+            url,
+            json=_page([["3", "3.5"]]),
+            match=[
+                matchers.json_params_matcher({"take": 2, "continuationToken": "token"})
+            ],
+        )
+
+        pages = list(
+            client.iter_query_table_data(
+                "table-id", QueryTableDataRequest(take=2), prefetch=prefetch
+            )
+        )
+
+        assert [page.frame.data for page in pages] == [
+            [["1", "1.5"], ["2", "2.5"]],
+            [["3", "3.5"]],
+        ]
+
+    @responses.activate
+    def test__follow_table__reads_only_new_rows_until_appends_end(
+        self, client: DataFrameClient
+    ):
+        metadata_url = f"{client.session.base_url}tables/table-id"
+        for modified, supports_append in [
+            ("2023-01-01T00:00:00Z", True),
+            ("2023-01-01T00:00:00Z", True),
+            ("2023-01-02T00:00:00Z", False),
+        ]:
+            responses.get(
+                metadata_url,
+                json=dict(
+                    _table_metadata(),
+                    rowsModifiedAt=modified,
+                    supportsAppend=supports_append,
+                ),
+            )
+        url = f"{client.session.base_url}tables/table-id/query-data"
+        order_by = [{"column": "index"}]
+        responses.post(
+            url,
+            json=_page([["1", "1.5"], ["2", "2.5"]], "token"),
+            match=[matchers.json_params_matcher({"take": 2, "orderBy": order_by})],
+        )
+        responses.post(
+            url,
+            json=_page([["3", "3.5"]]),
+            match=[
+                matchers.json_params_matcher(
+                    {"take": 2, "orderBy": order_by, "continuationToken": "token"}
+                )
+            ],
+        )
+        responses.post(
+            url,
+            json=_page([["4", "4.5"]]),
+            match=[
+                matchers.json_params_matcher(
+                    {
+                        "take": 2,
+                        "orderBy": order_by,
+                        "filters": [
+                            {
+                                "column": "index",
+                                "operation": "GREATER_THAN",
+                                "value": "3",
+                            }
+                        ],
+                    }
+                )
+            ],
+        )
+
+        pages = list(client.follow_table("table-id", QueryTableDataRequest(take=2), 0))
+
+        assert [page.frame.data for page in pages] == [
+            [["1", "1.5"], ["2", "2.5"]],
+            [["3", "3.5"]],
+            [["4", "4.5"]],
+        ]
+        assert len(responses.calls) == 6
+
+    @responses.activate
+    def test__follow_table_with_metadata_cache__polls_service(self):
+        client = DataFrameClient(
+            HttpConfiguration("http://localhost:9090", "api-key"),
+            metadata_cache=TableMetadataCache(),
+        )
+        metadata_url = f"{client.session.base_url}tables/table-id"
+        for modified, supports_append in [
+            # Cached before following, so a follower that used the cache would
+            # stop after one poll.
+            ("2023-01-01T00:00:00Z", False),
+            ("2023-01-01T00:00:00Z", True),
+            ("2023-01-02T00:00:00Z", False),
+        ]:
+            responses.get(
+                metadata_url,
+                json=dict(
+                    _table_metadata(),
+                    rowsModifiedAt=modified,
+                    supportsAppend=supports_append,
+                ),
+            )
+        url = f"{client.session.base_url}tables/table-id/query-data"
+        responses.post(url, json=_page([["1", "1.5"]]))
+        responses.post(url, json=_page([["2", "2.5"]]))
+        client.get_table_metadata("table-id")
+
+        pages = list(client.follow_table("table-id", poll_interval=0))
+
+        assert [page.frame.data for page in pages] == [
+            [["1", "1.5"]],
+            [["2", "2.5"]],
+        ]
+        assert len(responses.calls) == 5
+
+    @responses.activate
+    def test__follow_table_without_index_column__raises(self, client: DataFrameClient):
+        responses.get(
+            f"{client.session.base_url}tables/table-id",
+            json=_table_metadata(),
+        )
+
+        with pytest.raises(ValueError, match="index column"):
+            next(
+                client.follow_table(
+                    "table-id", QueryTableDataRequest(columns=["value"]), 0
+                )
+            )
+
+    @responses.activate
+    def test__iter_query_table_data_with_adaptive_take__adjusts_take_per_page(
+        self, client: DataFrameClient
+    ):
+        takes = []  # type: List[int]
+
+        def callback(request: Any) -> Tuple[int, Dict[str, str], str]:
+            take = json.loads(request.body)["take"]
+            takes.append(take)
+            token = "token" if len(takes) < 3 else None
+            rows = [
+                [str(i), "1.5"] for i in range(take)
+            ]  # type: List[List[Optional[str]]]
+            return 200, {}, json.dumps(_page(rows, token))
+
+        responses.add_callback(
+            responses.POST,
+            f"{client.session.base_url}tables/table-id/query-data",
+            callback=callback,
+        )
+        controller = AdaptiveTake(initial=100, target_seconds=60)
+
+        pages = list(
+            client.iter_query_table_data(
+                "table-id", QueryTableDataRequest(take=5), adaptive_take=controller
+            )
+        )
+
+        assert takes == [100, 200, 400]
+        assert [len(page.frame.data) for page in pages] == takes
+        assert [page.take for page in controller.pages] == takes
+        assert all(page.size > 0 for page in controller.pages)
+
+    @responses.activate
+    def test__iter_table_data__follows_continuation_tokens(
+        self, client: DataFrameClient
+    ):
+        url = f"{client.session.base_url}tables/table-id/data"
+        responses.get(
+            url,
+            json=_page([["1", "1.5"]], "token"),
+            match=[matchers.query_param_matcher({"take": "1"})],
+        )
+        responses.get(
+            url,
+            json=_page([["2", "2.5"]]),
+            match=[
+                matchers.query_param_matcher(
+                    {"take": "1", "continuationToken": "token"}
+                )
+            ],
+        )
+
+        pages = list(client.iter_table_data("table-id", take=1))
+
+        assert [page.frame.data for page in pages] == [[["1", "1.5"]], [["2", "2.5"]]]
+
+    @responses.activate
+    @pytest.mark.parametrize("trusted", [False, True])
+    def test__query_table_data__returns_same_rows_whether_trusted(
+        self, client: DataFrameClient, trusted: bool
+    ):
+        responses.post(
+            f"{client.session.base_url}tables/table-id/query-data",
+            json=_page([["1", "1.5"], ["2", None]], "token"),
+        )
+
+        page = client.query_table_data(
+            "table-id", QueryTableDataRequest(), trusted=trusted
+        )
+
+        expected = PagedTableRows.parse_obj(_page([["1", "1.5"], ["2", None]], "token"))
+        assert page == expected
+        assert page.json(exclude_unset=True) == expected.json(exclude_unset=True)
+
+    @responses.activate
+    @pytest.mark.parametrize(
+        "trust_responses, trusted, expected",
+        [
+            (False, None, [["1"]]),
+            (True, None, [[1]]),
+            (False, True, [[1]]),
+            (True, False, [["1"]]),
+        ],
+    )
+    def test__trusted__get_table_data__skips_cell_validation(
+        self,
+        trust_responses: bool,
+        trusted: Optional[bool],
+        expected: List[List[Any]],
+    ):
+        client = DataFrameClient(
+            HttpConfiguration("http://localhost:9090", "api-key"),
+            trust_responses=trust_responses,
+        )
+        responses.get(
+            f"{client.session.base_url}tables/table-id/data",
+            json={"frame": {"columns": ["index"], "data": [[1]]}, "totalRowCount": 1},
+        )
+
+        page = client.get_table_data("table-id", trusted=trusted)
+
+        assert page.frame.data == expected
+
+    @responses.activate
+    def test__trusted__query_decimated_data__returns_rows(
+        self, client: DataFrameClient
+    ):
+        responses.post(
+            f"{client.session.base_url}tables/table-id/query-decimated-data",
+            json={"frame": {"columns": ["index"], "data": [["1"], ["3"]]}},
+        )
+
+        rows = client.query_decimated_data(
+            "table-id", QueryDecimatedDataRequest(), trusted=True
+        )
+
+        assert rows.frame == DataFrame(columns=["index"], data=[["1"], ["3"]])
+
+    @responses.activate
+    def test__read_tables__reads_each_table_on_every_page(
+        self, client: DataFrameClient
+    ):
+        url = f"{client.session.base_url}query-tables"
+        responses.post(
+            url,
+            json={"tables": [_table_metadata("a")], "continuationToken": "next"},
+            match=[matchers.json_params_matcher({"filter": "true"})],
+        )
+        responses.post(
+            url,
+            json={
+                "tables": [_table_metadata("b"), _table_metadata("c")],
+                "continuationToken": None,
+            },
+            match=[
+                matchers.json_params_matcher(
+                    {"filter": "true", "continuationToken": "next"}
+                )
+            ],
+        )
+        for id in ("a", "b"):
+            responses.post(
+                f"{client.session.base_url}tables/{id}/query-data",
+                json=_page([[id, "1.5"]]),
+            )
+        responses.post(f"{client.session.base_url}tables/c/query-data", status=404)
+
+        results = {
+            result.metadata.id: result
+            for result in client.read_tables(
+                QueryTablesRequest(filter="true"), max_workers=2
+            )
+        }
+
+        assert sorted(results) == ["a", "b", "c"]
+        assert results["a"].frame == DataFrame(
+            columns=["index", "value"], data=[["a", "1.5"]]
+        )
+        assert isinstance(results["c"].error, ApiException)
+
+    @responses.activate
+    def test__iter_query_table_data_fails__raises(self, client: DataFrameClient):
+        responses.post(
+            f"{client.session.base_url}tables/table-id/query-data", status=404
+        )
+
+        with pytest.raises(ApiException, match="404"):
+            list(client.iter_query_table_data("table-id", QueryTableDataRequest()))
+
+    @responses.activate
+    def test__append_arrays__appends_encoded_rows(self, client: DataFrameClient):
+        responses.get(
+            f"{client.session.base_url}tables/table-id",
+            json=_table_metadata(),
+        )
+        responses.post(
+            f"{client.session.base_url}tables/table-id/data",
+            status=204,
+            match=[
+                matchers.json_params_matcher(
+                    {
+                        "frame": {
+                            "columns": ["index", "value"],
+                            "data": [["1", "0.5"], ["2", "NaN"]],
+                        },
+                        "endOfData": True,
+                    }
+                )
+            ],
+        )
+
+        client.append_arrays(
+            "table-id",
+            {"index": np.array([1, 2]), "value": np.array([0.5, np.nan])},
+            end_of_data=True,
+        )
+
+    @responses.activate
+    @pytest.mark.parametrize("rows", [2, 25000])
+    def test__append_table_data__sends_request_encoded_once(
+        self, client: DataFrameClient, rows: int
+    ):
+        responses.post(f"{client.session.base_url}tables/table-id/data", status=204)
+        request = AppendTableDataRequest(
+            frame=DataFrame(
+                columns=["index", "value"],
+                data=[[str(i), None] for i in range(rows)],
+            ),
+            end_of_data=True,
+        )
+
+        client.append_table_data("table-id", request)
+
+        sent = responses.calls[0].request
+        body = cast(Any, sent.body)
+        if not isinstance(body, bytes):
+            body = b"".join(body)
+        assert sent.headers["Content-Type"] == "application/json"
+        assert json.loads(body) == json.loads(
+            request.json(by_alias=True, exclude_unset=True)
+        )
+
+    @responses.activate
+    def test__modify_table__sends_only_set_fields(self, client: DataFrameClient):
+        responses.patch(f"{client.session.base_url}tables/table-id", status=204)
+
+        client.modify_table("table-id", ModifyTableRequest(name="renamed"))
+
+        assert responses.calls[0].request.body == b'{"name": "renamed"}'
+
+    @responses.activate
+    def test__bulk_append_table_data__appends_chunks_then_end_of_data(
+        self, client: DataFrameClient
+    ):
+        url = f"{client.session.base_url}tables/table-id/data"
+        responses.post(url, status=204)
+
+        count = client.bulk_append_table_data(
+            "table-id",
+            ([str(i), str(i / 2)] for i in range(5)),
+            columns=["index", "value"],
+            end_of_data=True,
+            max_rows_per_request=2,
+            max_workers=2,
+        )
+
+        assert count == 5
+        bodies = [
+            json.loads(cast(bytes, call.request.body)) for call in responses.calls
+        ]
+        assert bodies[-1] == {"endOfData": True}
+        frames = sorted(bodies[:-1], key=lambda body: body["frame"]["data"][0][0])
+        assert frames == [
+            {"frame": {"columns": ["index", "value"], "data": data}}
+            for data in (
+                [["0", "0.0"], ["1", "0.5"]],
+                [["2", "1.0"], ["3", "1.5"]],
+                [["4", "2.0"]],
+            )
+        ]
+
+    @responses.activate
+    def test__bulk_append_table_data_fails__does_not_send_end_of_data(
+        self, client: DataFrameClient
+    ):
+        url = f"{client.session.base_url}tables/table-id/data"
+        responses.post(url, status=400)
+
+        with pytest.raises(ApiException):
+            client.bulk_append_table_data(
+                "table-id",
+                [["1", "2.5"]],
+                end_of_data=True,
+            )
+
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test__bulk_delete_tables__retries_only_failed_ids_and_merges_results(
+        self, client: DataFrameClient
+    ):
+        requests = []  # type: List[List[str]]
+        attempts = {}  # type: Dict[str, int]
+
+        def delete(request: Any) -> Any:
+            ids = json.loads(request.body)["ids"]
+            requests.append(ids)
+            for id in ids:
+                attempts[id] = attempts.get(id, 0) + 1
+            # "flaky" fails once, "bad" always fails.
+            failed = [
+                id for id in ids if id == "bad" or (id == "flaky" and attempts[id] == 1)
+            ]
+            if not failed:
+                return 204, {}, ""
+            body = {
+                "deletedTableIds": [id for id in ids if id not in failed],
+                "failedTableIds": failed,
+                "error": {"name": "Skyline.OneOrMoreErrorsOccurred"},
+            }
+            return 200, {}, json.dumps(body)
+
+        responses.add_callback(
+            responses.POST, f"{client.session.base_url}delete-tables", callback=delete
+        )
+        ids = ["1", "flaky", "2", "bad", "3"]
+
+        result = client.bulk_delete_tables(ids, max_ids_per_request=2, max_workers=2)
+
+        assert result is not None
+        assert result.deleted_table_ids == ["1", "flaky", "2", "3"]
+        assert result.failed_table_ids == ["bad"]
+        assert result.error.name == "Skyline.OneOrMoreErrorsOccurred"
+        assert sorted(sorted(ids) for ids in requests) == [
+            ["1", "flaky"],
+            ["2", "bad"],
+            ["3"],
+            ["bad", "flaky"],
+        ]
+
+    @responses.activate
+    def test__bulk_delete_tables_all_succeed__returns_none(
+        self, client: DataFrameClient
+    ):
+        responses.post(f"{client.session.base_url}delete-tables", status=204)
+
+        result = client.bulk_delete_tables([str(i) for i in range(5)], 2)
+
+        assert result is None
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test__bulk_modify_tables_request_fails__reports_every_modification(
+        self, client: DataFrameClient
+    ):
+        responses.post(
+            f"{client.session.base_url}modify-tables",
+            status=400,
+            json={"error": {"name": "Skyline.BadRequest", "message": "bad"}},
+        )
+        updates = ModifyTablesRequest(
+            tables=[TableMetadataModification(id=id, name="x") for id in "abc"],
+            replace=True,
+        )
+
+        result = client.bulk_modify_tables(updates, max_tables_per_request=2)
+
+        assert result is not None
+        assert result.modified_table_ids == []
+        assert [table.id for table in result.failed_modifications] == ["a", "b", "c"]
+        assert [error.name for error in result.error.inner_errors] == [
+            "Skyline.BadRequest",
+            "Skyline.BadRequest",
+        ]
+        # Two chunks, each retried once, all sending the replace option.
+        assert len(responses.calls) == 4
+        assert all(
+            json.loads(cast(bytes, call.request.body))["replace"] is True
+            for call in responses.calls
+        )
+
+    @responses.activate
+    def test__iter_query_table_data_with_checkpoint__resumes_from_checkpoint(
+        self, client: DataFrameClient, tmp_path: Path
+    ):
+        url = f"{client.session.base_url}tables/table-id/query-data"
+        responses.post(
+            url,
+            json=_page([["1", "1.5"]], "token"),
+            match=[matchers.json_params_matcher({"take": 1})],
+        )
+        responses.post(
+            url,
+            json=_page([["2", "2.5"]]),
+            match=[
+                matchers.json_params_matcher({"take": 1, "continuationToken": "token"})
+            ],
+        )
+        checkpoint_path = tmp_path / "read.checkpoint"
+        query = QueryTableDataRequest(take=1)
+
+        pages = client.iter_query_table_data(
+            "table-id", query, checkpoint_path=checkpoint_path
+        )
+        next(pages)
+        next(pages)
+        resumed = list(
+            client.iter_query_table_data(
+                "table-id", query, checkpoint_path=checkpoint_path
+            )
+        )
+
+        assert [page.frame.data for page in resumed] == [[["2", "2.5"]]]
+        assert len(responses.calls) == 3
+        assert not checkpoint_path.exists()
+
+    def test__iter_query_table_data_with_other_checkpoint__raises(
+        self, client: DataFrameClient, tmp_path: Path
+    ):
+        checkpoint_path = tmp_path / "read.checkpoint"
+        checkpoint_path.write_text(
+            json.dumps({"operation": {"table": "other-id"}, "progress": {}})
+        )
+
+        with pytest.raises(ValueError, match="different table"):
+            next(
+                client.iter_query_table_data(
+                    "table-id",
+                    QueryTableDataRequest(take=1),
+                    checkpoint_path=checkpoint_path,
+                )
+            )
+
+    @responses.activate
+    def test__export_table_data_to_file__retries_connection_error(
+        self, client: DataFrameClient, tmp_path: Path
+    ):
+        responses.get(
+            f"{client.session.base_url}tables/table-id",
+            json=_table_metadata(),
+        )
+        url = f"{client.session.base_url}tables/table-id/export-data"
+        responses.post(url, body=ConnectionError("connection reset"))
+        responses.post(
+            url,
+            body=b'"index","value"\r\n1,2.5\r\n2,',
+            match=[
+                matchers.json_params_matcher(
+                    {"responseFormat": "CSV", "orderBy": [{"column": "index"}]}
+                )
+            ],
+        )
+        path = tmp_path / "export.csv"
+
+        rows = client.export_table_data_to_file(
+            "table-id", ExportTableDataRequest(response_format=ExportFormat.CSV), path
+        )
+
+        assert rows == 2
+        assert path.read_bytes() == b'"index","value"\r\n1,2.5\r\n2,'
+        assert len(responses.calls) == 3
+        assert not (tmp_path / "export.csv.checkpoint").exists()
+
+    def test__export_table_data_to_file_negative_retries__raises(
+        self, client: DataFrameClient, tmp_path: Path
+    ):
+        with pytest.raises(ValueError, match="retries"):
+            client.export_table_data_to_file(
+                "table-id",
+                ExportTableDataRequest(response_format=ExportFormat.CSV),
+                tmp_path / "export.csv",
+                retries=-1,
+            )
+
+    @responses.activate
+    def test__query_table_data_to_memmap__writes_every_page(
+        self, client: DataFrameClient, tmp_path: Path
+    ):
+        responses.get(
+            f"{client.session.base_url}tables/table-id",
+            json=_table_metadata(),
+        )
+        url = f"{client.session.base_url}tables/table-id/query-data"
+        responses.post(url, json=_page([["1", "1.5"], ["2", None]], "token"))
+        responses.post(url, json=_page([["3", "3.5"]]))
+
+        table = client.query_table_data_to_memmap(
+            "table-id", QueryTableDataRequest(take=2), tmp_path
+        )
+
+        value = table.column("value")
+        assert table.column("index").values.tolist() == [1, 2, 3]
+        assert isinstance(value.values, np.memmap)
+        assert value.valid is not None
+        assert value.valid.tolist() == [True, False, True]
+
+    @responses.activate
+    def test__profile_table_data__computes_statistics_of_each_column(
+        self, client: DataFrameClient
+    ):
+        responses.get(
+            f"{client.session.base_url}tables/table-id",
+            json=_table_metadata(),
+        )
+        responses.post(
+            f"{client.session.base_url}tables/table-id/export-data",
+            body=b'"index","value"\r\n1,2.5\r\n2,\r\n3,7.5',
+            match=[matchers.json_params_matcher({"responseFormat": "CSV"})],
+        )
+
+        statistics = client.profile_table_data("table-id", batch_rows=2)
+
+        assert statistics.row_count == 3
+        assert statistics.columns["index"].maximum == 3
+        assert statistics.columns["value"].null_count == 1
+        assert statistics.columns["value"].mean == 5.0
+
+    @responses.activate
+    def test__export_table_batches__parses_typed_batches(self, client: DataFrameClient):
+        responses.get(
+            f"{client.session.base_url}tables/table-id",
+            json=_table_metadata(),
+        )
+        responses.post(
+            f"{client.session.base_url}tables/table-id/export-data",
+            body=b'"index","value"\r\n1,2.5\r\n2,\r\n3,7.5',
+            match=[matchers.json_params_matcher({"responseFormat": "CSV"})],
+        )
+
+        batches = list(
+            client.export_table_batches(
+                "table-id",
+                ExportTableDataRequest(response_format=ExportFormat.CSV),
+                batch_rows=2,
+            )
+        )
+
+        assert [batch["index"].values.tolist() for batch in batches] == [[1, 2], [3]]
+        valid = batches[0]["value"].valid
+        assert valid is not None and valid.tolist() == [True, False]
+        request = responses.calls[1].request
+        assert request.req_kwargs["stream"] is True  # type: ignore[attr-defined]
+
+    @responses.activate
+    def test__export_table_batches_stopped_early__closes_export(
+        self, client: DataFrameClient, monkeypatch
+    ):
+        responses.get(
+            f"{client.session.base_url}tables/table-id",
+            json=_table_metadata(),
+        )
+        closed = []
+
+        def chunks() -> Iterator[bytes]:
+            try:
+                yield b'"index","value"\r\n1,2.5\r\n2,\r\n3,7.5'
+            finally:
+                closed.append(True)
+
+        # Held so that the stream is only closed explicitly, not by being collected.
+        stream = IteratorFileLike(chunks())
+        monkeypatch.setattr(client, "export_table_data", lambda id, query: stream)
+        batches = client.export_table_batches(
+            "table-id",
+            ExportTableDataRequest(response_format=ExportFormat.CSV),
+            batch_rows=1,
+        )
+
+        next(batches)
+        cast(Generator[Any, None, None], batches).close()
+
+        assert closed == [True]
+        assert stream.closed
+
+    @responses.activate
+    def test__export_table_batches_parallel__parses_batches_in_order(
+        self, client: DataFrameClient
+    ):
+        responses.get(
+            f"{client.session.base_url}tables/table-id",
+            json=_table_metadata(),
+        )
+        responses.post(
+            f"{client.session.base_url}tables/table-id/export-data",
+            body=b'"index","value"\r\n1,2.5\r\n2,\r\n3,7.5',
+            match=[matchers.json_params_matcher({"responseFormat": "CSV"})],
+        )
+
+        batches = list(
+            client.export_table_batches_parallel(
+                "table-id",
+                ExportTableDataRequest(response_format=ExportFormat.CSV),
+                block_size=8,
+                max_workers=2,
+            )
+        )
+
+        indexes = [batch["index"].values.tolist() for batch in batches]
+        assert sum(indexes, []) == [1, 2, 3]
+        assert np.concatenate([batch["value"].valid for batch in batches]).tolist() == [
+            True,
+            False,
+            True,
+        ]
+
+    @responses.activate
+    def test__export_table_batches_parallel_stopped_early__closes_export(
+        self, client: DataFrameClient, monkeypatch
+    ):
+        responses.get(
+            f"{client.session.base_url}tables/table-id",
+            json=_table_metadata(),
+        )
+        closed = []
+
+        def chunks() -> Iterator[bytes]:
+            try:
+                yield b'"index","value"\r\n1,2.5\r\n2,\r\n3,7.5'
+            finally:
+                closed.append(True)
+
+        # Held so that the stream is only closed explicitly, not by being collected.
+        stream = IteratorFileLike(chunks())
+        monkeypatch.setattr(client, "export_table_data", lambda id, query: stream)
+        batches = client.export_table_batches_parallel(
+            "table-id",
+            ExportTableDataRequest(response_format=ExportFormat.CSV),
+            block_size=8,
+            max_workers=1,
+        )
+
+        next(batches)
+        cast(Generator[Any, None, None], batches).close()
+
+        assert closed == [True]
+        assert stream.closed
+
+    @responses.activate
+    def test__export_table_data_to_parquet__writes_row_group_per_batch(
+        self, client: DataFrameClient, tmp_path: Path
+    ):
+        responses.get(
+            f"{client.session.base_url}tables/table-id",
+            json=_table_metadata(),
+        )
+        responses.post(
+            f"{client.session.base_url}tables/table-id/export-data",
+            body=b'"value","index"\r\n2.5,1\r\n,2\r\n7.5,3',
+            match=[
+                matchers.json_params_matcher(
+                    {"responseFormat": "CSV", "columns": ["value", "index"]}
+                )
+            ],
+        )
+        path = tmp_path / "export.parquet"
+
+        rows = client.export_table_data_to_parquet(
+            "table-id",
+            ExportTableDataRequest(
+                response_format=ExportFormat.CSV, columns=["value", "index"]
+            ),
+            path,
+            batch_rows=2,
+        )
+
+        assert rows == 3
+        parquet_file = pyarrow.parquet.ParquetFile(path)
+        assert parquet_file.num_row_groups == 2
+        assert parquet_file.read().to_pydict() == {
+            "value": [2.5, None, 7.5],
+            "index": [1, 2, 3],
+        }
+
+    @responses.activate
+    def test__export_table_data_to_arrow__writes_every_row(
+        self, client: DataFrameClient, tmp_path: Path
+    ):
+        responses.get(
+            f"{client.session.base_url}tables/table-id",
+            json=_table_metadata(),
+        )
+        responses.post(
+            f"{client.session.base_url}tables/table-id/export-data",
+            body=b'"index","value"\r\n1,2.5\r\n2,\r\n3,7.5',
+        )
+        path = tmp_path / "export.arrow"
+
+        rows = client.export_table_data_to_arrow(
+            "table-id", ExportTableDataRequest(response_format=ExportFormat.CSV), path
+        )
+
+        assert rows == 3
+        with pyarrow.ipc.open_file(path) as reader:
+            assert reader.read_all().to_pydict() == {
+                "index": [1, 2, 3],
+                "value": [2.5, None, 7.5],
+            }
+
+    @responses.activate
+    def test__export_table_data_to_parquet_unknown_column__raises(
+        self, client: DataFrameClient, tmp_path: Path
+    ):
+        responses.get(
+            f"{client.session.base_url}tables/table-id",
+            json=_table_metadata(),
+        )
+
+        with pytest.raises(ValueError, match="missing"):
+            client.export_table_data_to_parquet(
+                "table-id",
+                ExportTableDataRequest(
+                    response_format=ExportFormat.CSV, columns=["missing"]
+                ),
+                tmp_path / "export.parquet",
+            )
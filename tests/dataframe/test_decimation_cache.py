@@ -0,0 +1,276 @@
+# -*- coding: utf-8 -*-
+import operator
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import pytest  # type: ignore
+from nisystemlink.clients.dataframe import DecimationCache
+from nisystemlink.clients.dataframe.models import (
+    Column,
+    ColumnFilter,
+    ColumnType,
+    DataFrame,
+    DataType,
+    DecimationMethod,
+    DecimationOptions,
+    FilterOperation,
+    PagedTableRows,
+    QueryDecimatedDataRequest,
+    QueryTableDataRequest,
+    TableMetadata,
+    TableRows,
+)
+
+_OPERATIONS = {
+    FilterOperation.Equals: operator.eq,
+    FilterOperation.NotEquals: operator.ne,
+    FilterOperation.LessThan: operator.lt,
+    FilterOperation.LessThanEquals: operator.le,
+    FilterOperation.GreaterThan: operator.gt,
+    FilterOperation.GreaterThanEquals: operator.ge,
+}
+
+
+class _FakeClient:
+    """Serves an in-memory table of integer ``x`` and ``y`` columns and decimates it
+    the way the server does for ``MAX_MIN``.
+    """
+
+    def __init__(self, rows: List[List[int]]):
+        self.rows = rows
+        self.decimated_queries = []  # type: List[QueryDecimatedDataRequest]
+        self.data_queries = 0
+        self._lock = threading.Lock()
+
+    def get_table_metadata(self, id: str) -> TableMetadata:
+        return TableMetadata(
+            id=id,
+            name="table",
+            workspace="workspace",
+            created_at="2022-01-01T00:00:00Z",
+            metadata_modified_at="2022-01-01T00:00:00Z",
+            rows_modified_at="2022-01-01T00:00:00Z",
+            metadata_revision=1,
+            row_count=len(self.rows),
+            supports_append=True,
+            properties={},
+            columns=[
+                Column(
+                    name="x", data_type=DataType.Int64, column_type=ColumnType.Index
+                ),
+                Column(name="y", data_type=DataType.Int32),
+            ],
+        )
+
+    def query_table_data(self, id: str, query: QueryTableDataRequest) -> PagedTableRows:
+        with self._lock:
+            self.data_queries += 1
+        rows = self._filter(query.filters)
+        descending = bool(query.order_by and query.order_by[0].descending)
+        rows.sort(key=lambda row: row[0], reverse=descending)
+        page = rows[: query.take]
+        return PagedTableRows(
+            frame=DataFrame(columns=["x"], data=[[str(row[0])] for row in page]),
+            total_row_count=len(rows),
+            continuation_token=None,
+        )
+
+    def query_decimated_data(
+        self, id: str, query: QueryDecimatedDataRequest
+    ) -> TableRows:
+        with self._lock:
+            self.decimated_queries.append(query)
+        rows = sorted(self._filter(query.filters), key=lambda row: row[0])
+        intervals = (query.decimation and query.decimation.intervals) or 1000
+        decimated = []  # type: List[Tuple[int, ...]]
+        if rows:
+            first, last = rows[0][0], rows[-1][0]
+            width = (last - first + 1) / intervals
+            bins = {}  # type: Dict[int, List[List[int]]]
+            for row in rows:
+                bins.setdefault(int((row[0] - first) / width), []).append(row)
+            for _, members in sorted(bins.items()):
+                low = min(members, key=lambda row: row[1])
+                high = max(members, key=lambda row: row[1])
+                decimated.extend(sorted({tuple(low), tuple(high)}))
+        columns = query.columns or ["x", "y"]
+        positions = [["x", "y"].index(column) for column in columns]
+        return TableRows(
+            frame=DataFrame(
+                columns=columns,
+                data=[[str(row[p]) for p in positions] for row in decimated],
+            )
+        )
+
+    def _filter(self, filters: Optional[List[ColumnFilter]]) -> List[List[int]]:
+        def matches(row: List[int]) -> bool:
+            for column_filter in filters or []:
+                if column_filter.value is None:
+                    continue
+                value = row[["x", "y"].index(column_filter.column)]
+                compare = _OPERATIONS[column_filter.operation]
+                if not compare(value, int(column_filter.value)):
+                    return False
+            return True
+
+        return [row for row in self.rows if matches(row)]
+
+
+def _query(
+    intervals: int,
+    low: Optional[int] = None,
+    high: Optional[int] = None,
+    method: DecimationMethod = DecimationMethod.MaxMin,
+    columns: Optional[List[str]] = None,
+) -> QueryDecimatedDataRequest:
+    filters = []
+    if low is not None:
+        filters.append(
+            ColumnFilter(
+                column="x", operation=FilterOperation.GreaterThanEquals, value=str(low)
+            )
+        )
+    if high is not None:
+        filters.append(
+            ColumnFilter(
+                column="x", operation=FilterOperation.LessThanEquals, value=str(high)
+            )
+        )
+    return QueryDecimatedDataRequest(
+        columns=columns,
+        filters=filters,
+        decimation=DecimationOptions(
+            x_column="x", y_columns=["y"], intervals=intervals, method=method
+        ),
+    )
+
+
+@pytest.fixture
+def client() -> _FakeClient:
+    """A table of 4096 rows whose y values follow a sawtooth."""
+    return _FakeClient([[x, (x * 37) % 101] for x in range(4096)])
+
+
+class TestDecimationCache:
+    def test__repeated_query__query_decimated_data__served_from_cache(
+        self, client: _FakeClient
+    ):
+        cache = DecimationCache(client, tile_intervals=16)  # type: ignore
+
+        first = cache.query_decimated_data("table", _query(32))
+        fetched = len(client.decimated_queries)
+        second = cache.query_decimated_data("table", _query(32))
+
+        assert fetched > 0
+        assert len(client.decimated_queries) == fetched
+        assert first == second
+
+    def test__view__query_decimated_data__includes_extremes_within_view(
+        self, client: _FakeClient
+    ):
+        cache = DecimationCache(client, tile_intervals=16)  # type: ignore
+
+        result = cache.query_decimated_data("table", _query(8, low=1000, high=1999))
+
+        xs = [int(row[0] or 0) for row in result.frame.data]
+        ys = [int(row[1] or 0) for row in result.frame.data]
+        in_view = [row[1] for row in client.rows if 1000 <= row[0] <= 1999]
+        assert result.frame.columns == ["x", "y"]
+        assert xs == sorted(xs)
+        assert min(xs) >= 1000 and max(xs) <= 1999
+        assert min(ys) == min(in_view)
+        assert max(ys) == max(in_view)
+
+    def test__zoom_in__query_decimated_data__fetches_only_tiles_in_view(
+        self, client: _FakeClient
+    ):
+        cache = DecimationCache(client, tile_intervals=16)  # type: ignore
+        cache.query_decimated_data("table", _query(16))
+        client.decimated_queries.clear()
+
+        cache.query_decimated_data("table", _query(16, low=0, high=511))
+
+        assert 0 < len(client.decimated_queries) <= 2
+        for query in client.decimated_queries:
+            lower = [
+                int(f.value or 0)
+                for f in query.filters or []
+                if f.operation == FilterOperation.GreaterThanEquals
+            ]
+            assert max(lower) < 512
+
+    def test__pan__query_decimated_data__fetches_only_missing_tiles(
+        self, client: _FakeClient
+    ):
+        cache = DecimationCache(client, tile_intervals=16)  # type: ignore
+        cache.query_decimated_data("table", _query(32, low=0, high=1023))
+        fetched = len(client.decimated_queries)
+
+        cache.query_decimated_data("table", _query(32, low=512, high=1535))
+
+        assert 0 < len(client.decimated_queries) - fetched < fetched
+
+    def test__repeated_query__query_decimated_data__reads_range_once(
+        self, client: _FakeClient
+    ):
+        cache = DecimationCache(client, tile_intervals=16)  # type: ignore
+
+        cache.query_decimated_data("table", _query(32))
+        cache.query_decimated_data("table", _query(32, low=100, high=200))
+
+        assert client.data_queries == 2
+
+    def test__columns_without_x__query_decimated_data__omits_x_column(
+        self, client: _FakeClient
+    ):
+        cache = DecimationCache(client, tile_intervals=16)  # type: ignore
+
+        result = cache.query_decimated_data(
+            "table", _query(8, low=0, high=99, columns=["y"])
+        )
+
+        assert result.frame.columns == ["y"]
+        assert all(len(row) == 1 for row in result.frame.data)
+        assert all(query.columns == ["y", "x"] for query in client.decimated_queries)
+
+    def test__lossy__query_decimated_data__passes_query_through(
+        self, client: _FakeClient
+    ):
+        cache = DecimationCache(client, tile_intervals=16)  # type: ignore
+        query = _query(8, method=DecimationMethod.Lossy)
+
+        cache.query_decimated_data("table", query)
+        cache.query_decimated_data("table", query)
+
+        assert client.decimated_queries == [query, query]
+        assert len(cache) == 0
+
+    def test__invalidate__query_decimated_data__fetches_again(
+        self, client: _FakeClient
+    ):
+        cache = DecimationCache(client, tile_intervals=16)  # type: ignore
+        cache.query_decimated_data("table", _query(8))
+        fetched = len(client.decimated_queries)
+
+        cache.invalidate("table")
+        client.rows.append([4096, 1000])
+        result = cache.query_decimated_data("table", _query(8))
+
+        assert len(client.decimated_queries) == 2 * fetched
+        assert ["4096", "1000"] in result.frame.data
+
+    def test__max_tiles__query_decimated_data__evicts_least_recently_used(
+        self, client: _FakeClient
+    ):
+        cache = DecimationCache(client, tile_intervals=4, max_tiles=3)  # type: ignore
+
+        cache.query_decimated_data("table", _query(64))
+
+        assert len(cache) == 3
+
+    @pytest.mark.parametrize("argument", ["tile_intervals", "max_tiles", "max_workers"])
+    def test__argument_less_than_one__construct__raises(
+        self, client: _FakeClient, argument: str
+    ):
+        with pytest.raises(ValueError):
+            DecimationCache(client, **{argument: 0})  # type: ignore
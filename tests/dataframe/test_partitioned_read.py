@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+import threading
+from typing import List
+
+import pytest  # type: ignore
+from nisystemlink.clients.dataframe._partitioned_read import (
+    _split_range,
+    iter_partitioned,
+    timestamp_from_int,
+    to_int,
+)
+from nisystemlink.clients.dataframe.models import (
+    Column,
+    ColumnFilter,
+    ColumnOrderBy,
+    ColumnType,
+    DataFrame,
+    DataType,
+    FilterOperation,
+    PagedTableRows,
+    QueryTableDataRequest,
+)
+
+_INDEX = Column(name="index", data_type=DataType.Int64, column_type=ColumnType.Index)
+
+
+class _FakeTable:
+    """Serves pages of an in-memory table, honoring comparison filters on the index."""
+
+    def __init__(self, indexes: List[int]):
+        self.indexes = indexes
+        self.queries = []  # type: List[QueryTableDataRequest]
+        self._lock = threading.Lock()
+
+    def query_page(self, query: QueryTableDataRequest) -> PagedTableRows:
+        with self._lock:
+            self.queries.append(query)
+        rows = [i for i in self.indexes if self._matches(i, query.filters or [])]
+        descending = bool(query.order_by and query.order_by[0].descending)
+        rows.sort(reverse=descending)
+        start = int(query.continuation_token or 0)
+        take = query.take or 2
+        page = rows[start : start + take]
+        token = str(start + take) if start + take < len(rows) else None
+        return PagedTableRows(
+            frame=DataFrame(columns=["index"], data=[[str(i)] for i in page]),
+            total_row_count=len(rows),
+            continuation_token=token,
+        )
+
+    @staticmethod
+    def _matches(index: int, filters: List[ColumnFilter]) -> bool:
+        for column_filter in filters:
+            value = int(column_filter.value or 0)
+            if column_filter.operation == FilterOperation.GreaterThanEquals:
+                if index < value:
+                    return False
+            elif column_filter.operation == FilterOperation.LessThan:
+                if index >= value:
+                    return False
+            elif column_filter.operation == FilterOperation.NotEquals:
+                if index == value:
+                    return False
+        return True
+
+
+def _indexes(pages) -> List[int]:
+    return [int(row[0]) for page in pages for row in page.frame.data]
+
+
+class TestPartitionedRead:
+    @pytest.mark.parametrize("partitions", [1, 3, 4, 50])
+    def test__partitions__iter_partitioned__reads_all_rows_in_order(
+        self, partitions: int
+    ):
+        table = _FakeTable([5, 1, 9, 3, 12, 7, 8, 2])
+
+        pages = iter_partitioned(
+            table.query_page, _INDEX, QueryTableDataRequest(), partitions, 2
+        )
+
+        assert _indexes(pages) == [1, 2, 3, 5, 7, 8, 9, 12]
+
+    def test__filters__iter_partitioned__applies_filters_to_each_partition(self):
+        table = _FakeTable(list(range(10)))
+        query = QueryTableDataRequest(
+            filters=[
+                ColumnFilter(
+                    column="index", operation=FilterOperation.NotEquals, value="4"
+                )
+            ],
+            take=3,
+        )
+
+        pages = list(iter_partitioned(table.query_page, _INDEX, query, 3, 3))
+
+        assert _indexes(pages) == [0, 1, 2, 3, 5, 6, 7, 8, 9]
+        for page_query in table.queries[2:]:
+            assert page_query.take == 3
+            assert page_query.filters is not None
+            assert page_query.filters[0].operation == FilterOperation.NotEquals
+
+    def test__descending_order__iter_partitioned__reads_rows_in_descending_order(
+        self,
+    ):
+        table = _FakeTable(list(range(10)))
+        query = QueryTableDataRequest(
+            order_by=[ColumnOrderBy(column="index", descending=True)]
+        )
+
+        pages = iter_partitioned(table.query_page, _INDEX, query, 3, 2)
+
+        assert _indexes(pages) == list(reversed(range(10)))
+
+    def test__no_matching_rows__iter_partitioned__returns_nothing(self):
+        table = _FakeTable([])
+
+        pages = iter_partitioned(
+            table.query_page, _INDEX, QueryTableDataRequest(), 4, 4
+        )
+
+        assert list(pages) == []
+        assert len(table.queries) == 1
+
+    def test__ordered_by_other_column__iter_partitioned__raises(self):
+        table = _FakeTable([1])
+        query = QueryTableDataRequest(order_by=[ColumnOrderBy(column="value")])
+
+        with pytest.raises(ValueError):
+            list(iter_partitioned(table.query_page, _INDEX, query, 4, 4))
+
+    def test__range__split_range__returns_contiguous_ranges(self):
+        assert _split_range(0, 9, 3) == [(0, 3), (3, 6), (6, 10)]
+        assert _split_range(5, 6, 4) == [(5, 6), (6, 7)]
+        assert _split_range(-3, -3, 2) == [(-3, -2)]
+
+    @pytest.mark.parametrize(
+        "timestamp",
+        [
+            "1970-01-01T00:00:00.000Z",
+            "2023-08-19T16:17:30.123Z",
+            "1969-12-31T23:59:59.999Z",
+        ],
+    )
+    def test__timestamp__to_int__round_trips(self, timestamp: str):
+        assert timestamp_from_int(to_int(timestamp)) == timestamp
+
+    def test__timestamp_without_fraction__to_int__parses_milliseconds(self):
+        assert to_int("1970-01-01T00:00:01Z") == 1000
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+import datetime
+from typing import List
+
+import pytest  # type: ignore
+import responses
+from nisystemlink.clients.core import ApiException, HttpConfiguration
+from nisystemlink.clients.dataframe import DataFrameClient, TableMetadataCache
+from nisystemlink.clients.dataframe.models import (
+    ModifyTableRequest,
+    ModifyTablesRequest,
+    QueryTablesRequest,
+    TableMetadata,
+    TableMetadataModification,
+)
+
+from .test_data_frame_client import _table_metadata
+
+
+def _metadata(id: str) -> TableMetadata:
+    return TableMetadata.parse_obj(_table_metadata(id))
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> _Clock:
+    """Fixture to control the time seen by TableMetadataCache."""
+    clock = _Clock()
+    monkeypatch.setattr(
+        "nisystemlink.clients.dataframe._table_metadata_cache.time.monotonic", clock
+    )
+    return clock
+
+
+class TestTableMetadataCache:
+    def test__metadata_put__get__returns_copy(self):
+        cache = TableMetadataCache()
+        metadata = _metadata("a")
+
+        cache.put(metadata)
+        result = cache.get("a")
+
+        assert result == metadata
+        assert result is not metadata
+
+    def test__cached_metadata_modified__get__returns_original(self):
+        cache = TableMetadataCache()
+        cache.put(_metadata("a"))
+
+        first = cache.get("a")
+        assert first is not None
+        first.name = "changed"
+
+        second = cache.get("a")
+        assert second is not None and second.name == "Test table"
+
+    def test__time_to_live_elapsed__get__returns_none(self, clock: _Clock):
+        cache = TableMetadataCache(time_to_live=datetime.timedelta(seconds=10))
+        cache.put(_metadata("a"))
+
+        clock.now += 9
+        assert cache.get("a") is not None
+        clock.now += 1
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test__cache_full__put__evicts_least_recently_used(self):
+        cache = TableMetadataCache(max_size=2)
+        cache.put_many([_metadata("a"), _metadata("b")])
+
+        cache.get("a")
+        cache.put(_metadata("c"))
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+
+    def test__metadata_put__invalidate__removes_only_given_ids(self):
+        cache = TableMetadataCache()
+        cache.put_many([_metadata("a"), _metadata("b")])
+
+        cache.invalidate(["a", "unknown"])
+
+        assert cache.get("a") is None
+        assert cache.get("b") is not None
+
+    @pytest.mark.parametrize(
+        "time_to_live, max_size",
+        [(datetime.timedelta(0), 1), (datetime.timedelta(seconds=1), 0)],
+    )
+    def test__invalid_limits__construct__raises(self, time_to_live, max_size):
+        with pytest.raises(ValueError):
+            TableMetadataCache(time_to_live=time_to_live, max_size=max_size)
+
+
+class TestDataFrameClientMetadataCache:
+    def setup_method(self, method):
+        self._cache = TableMetadataCache()
+        self._client = DataFrameClient(
+            HttpConfiguration("http://localhost:9090", "api-key"),
+            metadata_cache=self._cache,
+        )
+        self._base_url = self._client.session.base_url
+
+    @responses.activate
+    def test__metadata_cached__get_table_metadata__does_not_request_again(self):
+        responses.get(f"{self._base_url}tables/a", json=_table_metadata("a"))
+
+        first = self._client.get_table_metadata("a")
+        second = self._client.get_table_metadata("a")
+
+        assert first == second
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test__list_tables__fills_cache(self):
+        responses.get(
+            f"{self._base_url}tables",
+            json={"tables": [_table_metadata("a"), _table_metadata("b")]},
+        )
+
+        self._client.list_tables()
+
+        assert self._client.get_table_metadata("b").id == "b"
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test__query_tables__fills_cache(self):
+        responses.post(
+            f"{self._base_url}query-tables",
+            json={"tables": [_table_metadata("a")]},
+        )
+
+        self._client.query_tables(QueryTablesRequest(filter=""))
+
+        assert self._cache.get("a") is not None
+
+    @responses.activate
+    def test__modify_table__invalidates_table(self):
+        self._cache.put_many([_metadata("a"), _metadata("b")])
+        responses.patch(f"{self._base_url}tables/a", status=204)
+
+        self._client.modify_table("a", ModifyTableRequest(name="renamed"))
+
+        assert self._cache.get("a") is None
+        assert self._cache.get("b") is not None
+
+    @responses.activate
+    def test__modify_tables_fails__invalidates_tables(self):
+        self._cache.put_many([_metadata("a"), _metadata("b")])
+        responses.post(f"{self._base_url}modify-tables", status=500)
+
+        with pytest.raises(ApiException):
+            self._client.modify_tables(
+                ModifyTablesRequest(tables=[TableMetadataModification(id="b")])
+            )
+
+        assert self._cache.get("a") is not None
+        assert self._cache.get("b") is None
+
+    @responses.activate
+    @pytest.mark.parametrize("ids", [["a"], ["a", "b"]])
+    def test__delete__invalidates_tables(self, ids: List[str]):
+        self._cache.put_many([_metadata("a"), _metadata("b"), _metadata("c")])
+        responses.delete(f"{self._base_url}tables/a", status=204)
+        responses.post(f"{self._base_url}delete-tables", status=204)
+
+        if len(ids) == 1:
+            self._client.delete_table(ids[0])
+        else:
+            self._client.delete_tables(ids)
+
+        cached = [id for id in "abc" if self._cache.get(id) is not None]
+        assert cached == [id for id in "abc" if id not in ids]
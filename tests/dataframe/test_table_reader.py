@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+import threading
+from typing import Iterator, List
+
+import pytest  # type: ignore
+from nisystemlink.clients.dataframe._table_reader import read_tables
+from nisystemlink.clients.dataframe.models import DataFrame, TableMetadata
+
+
+def _metadata(id: str) -> TableMetadata:
+    return TableMetadata(
+        id=id,
+        name=id,
+        workspace="workspace",
+        created_at="2023-01-01T00:00:00Z",
+        metadata_modified_at="2023-01-01T00:00:00Z",
+        rows_modified_at="2023-01-01T00:00:00Z",
+        metadata_revision=1,
+        row_count=1,
+        supports_append=True,
+        properties={},
+        columns=[],
+    )
+
+
+def _read(metadata: TableMetadata) -> DataFrame:
+    return DataFrame(columns=["id"], data=[[metadata.id]])
+
+
+class TestReadTables:
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test__tables__read_tables__reads_each_table_once(self, max_workers: int):
+        tables = [_metadata(str(i)) for i in range(20)]
+
+        results = list(read_tables(tables, _read, max_workers))
+
+        assert sorted(result.metadata.id for result in results) == sorted(
+            table.id for table in tables
+        )
+        assert all(result.succeeded for result in results)
+        assert all(
+            result.frame is not None and result.frame.data == [[result.metadata.id]]
+            for result in results
+        )
+
+    def test__slow_table__read_tables__returns_results_in_completion_order(self):
+        release_slow = threading.Event()
+
+        def read(metadata: TableMetadata) -> DataFrame:
+            if metadata.id == "slow":
+                release_slow.wait(5)
+            return _read(metadata)
+
+        results = read_tables([_metadata("slow"), _metadata("fast")], read, 2)
+
+        first = next(results)
+        release_slow.set()
+        second = next(results)
+
+        assert [first.metadata.id, second.metadata.id] == ["fast", "slow"]
+        assert list(results) == []
+
+    def test__table_fails__read_tables__captures_error_and_continues(self):
+        def read(metadata: TableMetadata) -> DataFrame:
+            if metadata.id == "bad":
+                raise RuntimeError("failed")
+            return _read(metadata)
+
+        results = {
+            result.metadata.id: result
+            for result in read_tables(
+                [_metadata("good"), _metadata("bad"), _metadata("other")], read, 2
+            )
+        }
+
+        assert results["good"].succeeded and results["other"].succeeded
+        assert not results["bad"].succeeded
+        assert results["bad"].frame is None
+        assert str(results["bad"].error) == "failed"
+
+    def test__discovery_fails__read_tables__raises(self):
+        def tables() -> Iterator[TableMetadata]:
+            yield _metadata("1")
+            raise RuntimeError("query failed")
+
+        with pytest.raises(RuntimeError, match="query failed"):
+            list(read_tables(tables(), _read, 2))
+
+    def test__stopped_early__read_tables__stops_discovering_tables(self):
+        discovered = []  # type: List[str]
+
+        def tables() -> Iterator[TableMetadata]:
+            for i in range(1000):
+                discovered.append(str(i))
+                yield _metadata(str(i))
+
+        results = read_tables(tables(), _read, 2)
+        next(results)
+        results.close()
+
+        assert len(discovered) < 1000
+
+    def test__no_tables__read_tables__returns_nothing(self):
+        assert list(read_tables([], _read, 2)) == []
@@ -223,7 +223,7 @@ class TestDataFrame:
             basic_table_model
         )  # Don't use fixture to avoid deleting the table twice
 
-        assert client.delete_table(id) is None
+        client.delete_table(id)
 
         with pytest.raises(ApiException, match="404 Not Found"):
             client.get_table_metadata(id)
@@ -2,7 +2,7 @@ from datetime import datetime, timedelta
 
 import pytest  # type: ignore
 from nisystemlink.clients import tag as tbase
-from nisystemlink.clients.tag._core._manual_reset_timer import ManualResetTimer
+from nisystemlink.clients.core._internal._manual_reset_timer import ManualResetTimer
 from nisystemlink.clients.tag._core._system_time_stamper import SystemTimeStamper
 from nisystemlink.clients.tag._http._http_buffered_tag_writer import (
     HttpBufferedTagWriter,
@@ -5,11 +5,11 @@ from unittest.mock import Mock, PropertyMock
 import nisystemlink.clients.core as core
 import nisystemlink.clients.tag as tbase
 import pytest  # type: ignore
+from nisystemlink.clients.core._internal._manual_reset_timer import ManualResetTimer
 from nisystemlink.clients.tag._core._itime_stamper import ITimeStamper
-from nisystemlink.clients.tag._core._manual_reset_timer import ManualResetTimer
 from nisystemlink.clients.tag._core._system_time_stamper import SystemTimeStamper
 
-from .mock_manualresettimer import MockManualResetTimer
+from ..core.mock_manualresettimer import MockManualResetTimer
 
 
 class TestBufferedTagWriter: